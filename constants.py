@@ -1,4 +1,6 @@
 SOLOQ_CODE = 420
 FLEX_CODE = 440
 DRAFT_PICK_CODE = 400
-PICK_TIME_LEFT_MS = 4000
+# Default lead time left before the pick timer runs out when locking in
+# (config: lock_in_safety_margin_ms).
+LOCK_IN_SAFETY_MARGIN_MS = 4000
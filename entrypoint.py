@@ -3,16 +3,18 @@ import json
 import urllib3
 import threading
 import sys
+import keyboard
 import utils.lcu_connection as lcu
 
 from features.post_game.end_of_game_actions import start_end_of_game_actions
 from features.discord_message import (
     create_discord_message,
     get_game_data,
-    send_discord_pre_game_message,
+    schedule_discord_pre_game_message,
 )
 from features.accept_queue import accept_queue
 from features.pick_and_ban import pick_and_ban
+from features.select_champion_logic import compile_counter_indexes
 from features.decline_swap_requests import decline_incoming_swap_requests
 from features.swap_role import swap_role
 from features.swap_pick_position import swap_pick_position
@@ -32,10 +34,20 @@ from utils import (
     get_final_local_champion_name,
     fetch_champion_names,
     LeagueClientDisconnected,
+    log_lcu_request_stats,
 )
-from utils.logger import logger
+from utils.logger import error_aggregator, logger
 from utils import shared_state
+from utils.lcu_events import start_event_listener
+from utils.champion_catalog import get_champion_catalog
+from utils.session_hub import start_session_hub, stop_session_hub
+from utils.session_trace import SessionTraceRecorder
+from utils.lock_in_scheduler import reset_lock_in_scheduler
+from utils.lcu_cache import DISCONNECT, invalidate_lcu_cache
+from utils.poll_scheduler import start_poll_scheduler
 from utils.config_validation import validate_config
+from utils.discord_dispatcher import stop_discord_dispatcher
+from utils.discord_outbox import discord_outbox
 
 # Disable warnings for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -67,6 +79,9 @@ if validation_warnings:
     for warning in validation_warnings:
         print(f"   - {warning}")
 
+# Counter lookups run on every pick-turn loop; invert the lane configs once.
+compile_counter_indexes(config)
+
 
 def check_league_client():
     """Check if League client is running and accessible"""
@@ -92,14 +107,6 @@ def check_league_client_silent():
         return False
 
 
-def start_end_of_game_thread():
-    """Start the end of game monitoring thread"""
-    end_of_game_thread = threading.Thread(target=start_end_of_game_actions)
-    end_of_game_thread.daemon = True
-    end_of_game_thread.start()
-    return end_of_game_thread
-
-
 def wait_for_champ_select():
     """Synchronous version - blocks until champ select starts"""
     while True:
@@ -111,6 +118,18 @@ def wait_for_champ_select():
         return session
 
 
+def setup_lcu_stats_hotkey():
+    """Register the optional hotkey that prints per-endpoint LCU request stats."""
+    hotkey = str(config.get("lcu_stats_hotkey") or "").strip()
+    if not hotkey:
+        return
+    try:
+        keyboard.add_hotkey(hotkey, log_lcu_request_stats)
+        print(f"⌨️ LCU stats hotkey active: {hotkey.upper()}")
+    except Exception as e:
+        print(f"⚠️ Could not register LCU stats hotkey '{hotkey}': {e}")
+
+
 def main():
     # Start logging system
     logger.start_logging()
@@ -144,20 +163,34 @@ def main():
     shared_state.config_preferred_role = config.get("preferred_role")
 
     try:
-        # Start end of game actions in a single long-lived thread
-        start_end_of_game_thread()
+        setup_lcu_stats_hotkey()
+
+        # Deliver game reports a previous run could not send
+        discord_outbox.start()
+
+        # Push-based LCU events (falls back to REST polling when unavailable)
+        start_event_listener()
+
+        # Load the champion catalog now so champ select never waits on Data Dragon
+        get_champion_catalog()
+
+        # Post-game and lobby checks run as tasks on the shared poll scheduler
+        start_end_of_game_actions()
         start_lobby_lane_prompt_watcher()
+        start_poll_scheduler()
 
         while True:
+            trace_recorder = None
             try:
                 # Check if League client disconnected from background thread
                 if shared_state.client_disconnected:
 
-                    # Reset credentials cache
-                    lcu._port = None
-                    lcu._token = None
-                    lcu._base_url = None
-                    lcu._auth = None
+                    # Reset credentials cache and drop the pooled connections
+                    lcu.reset_lcu_connection()
+                    # The new client process has its own clock and latency
+                    reset_lock_in_scheduler()
+                    # Cached summoner/ranked data may belong to another account now
+                    invalidate_lcu_cache(DISCONNECT)
 
                     # Reset shared state
                     shared_state.client_disconnected = False
@@ -192,7 +225,7 @@ def main():
                     # For unsupported queues we still emit Discord pre/post-game messages,
                     # but skip pick/ban automation that relies on draft-specific flows.
                     create_discord_message("Unknown", session)
-                    send_discord_pre_game_message(get_game_data())
+                    schedule_discord_pre_game_message(get_game_data())
                     print(
                         "ℹ️ Unsupported queue for auto-pick: "
                         f"{shared_state.current_queue_type}. "
@@ -208,13 +241,16 @@ def main():
                 schedule_champ_select_message(
                     session, message_override=session_chat_override
                 )
+                if config.get("record_session_traces"):
+                    trace_recorder = SessionTraceRecorder().start()
+                start_session_hub()
                 swap_role(
                     session,
                     config,
                     preferred_role_override=session_preferred_role,
                 )
 
-                # Run concurrently in separate threads
+                # Run concurrently in separate threads, sharing one session poller
                 pick_ban_thread = threading.Thread(
                     target=pick_and_ban, args=(config, session_preferred_role)
                 )
@@ -236,6 +272,7 @@ def main():
                 pick_ban_thread.join()
                 swap_position_thread.join()
                 handle_incoming_swap_requests_thread.join()
+                stop_session_hub()
 
                 session = get_session()
                 if session:
@@ -250,7 +287,7 @@ def main():
                             shared_state.game_data["picked_champion"] = fname
 
                 game_data = get_game_data()
-                send_discord_pre_game_message(game_data)
+                schedule_discord_pre_game_message(game_data)
 
                 print("🟡 Champ select ended!")
 
@@ -269,11 +306,22 @@ def main():
                 print("🔄 Restarting and waiting for next queue...")
                 time.sleep(5)  # Wait a bit before retrying
                 continue
+            finally:
+                # Champ select is over (or aborted): back to direct session GETs.
+                stop_session_hub()
+                if trace_recorder is not None:
+                    print(f"📼 Session trace saved to {trace_recorder.stop()}")
     except KeyboardInterrupt:
         print("\n👋 Shutting down gracefully...")
     except Exception as e:
         print(f"❌ Error during game session: {e}")
     finally:
+        log_lcu_request_stats()
+        # Report coalesced errors, then give queued Discord messages a moment.
+        error_aggregator.flush()
+        # Undelivered game reports stay in the outbox for the next start.
+        discord_outbox.stop(timeout=1)
+        stop_discord_dispatcher(timeout=5)
         # Stop logging system
         logger.stop_logging()
 
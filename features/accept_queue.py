@@ -2,23 +2,74 @@ import requests
 import time
 
 from utils.logger import log_and_discord
-from utils import get_auth, get_base_url, get_session, LeagueClientDisconnected
+from utils import get_session, lcu_get, lcu_post, LeagueClientDisconnected
+from utils import lcu_events
+from utils.metrics import record_metric
 from features.session_lane_prompt import dismiss_lane_prompt_for_game_found
 from features.discord_message import send_discord_champ_select_started_message
 
 
+ACCEPT_LATENCY_METRIC = "ready_check.accept_latency_ms"
+
+# Ready-check poll intervals in seconds. With the event stream connected the pop
+# is pushed, so polling is only a safety net; without it we poll fast only while
+# a ready-check endpoint exists (i.e. while queued) and slowly otherwise.
+EVENT_STREAM_POLL_SECONDS = 5.0
+QUEUED_POLL_SECONDS = 0.25
+IDLE_POLL_SECONDS = 2.0
+
+
+def _ready_check_poll_interval(in_queue):
+    if lcu_events.is_event_stream_connected():
+        return EVENT_STREAM_POLL_SECONDS
+    return QUEUED_POLL_SECONDS if in_queue else IDLE_POLL_SECONDS
+
+
+def _pushed_ready_check(payload):
+    """Ready-check data from an event payload if it is a pop we can accept right away."""
+    if not payload or payload.get("eventType") == "Delete":
+        return None
+    data = payload.get("data")
+    if isinstance(data, dict) and data.get("state") == "InProgress":
+        return data
+    return None
+
+
+def _record_accept_latency(data, observed_at):
+    """Record pop -> accepted in ms; the ready-check timer is seconds since the pop."""
+    pop_age = data.get("timer")
+    if not isinstance(pop_age, (int, float)):
+        return None
+    latency_ms = (pop_age + time.monotonic() - observed_at) * 1000
+    record_metric(ACCEPT_LATENCY_METRIC, latency_ms)
+    return latency_ms
+
+
 def accept_queue():
-    """Polls the ready-check endpoint and accepts the match if found."""
+    """
+    Accepts the match as soon as a ready-check pops.
+
+    Pops pushed over the event stream are accepted straight from the event payload;
+    otherwise the ready-check endpoint is polled (fast only while queued).
+    """
     last_state = None
+    seen_ready_checks = lcu_events.get_event_count(lcu_events.READY_CHECK_EVENT)
     while True:
         try:
-            r = requests.get(
-                f"{get_base_url()}/lol-matchmaking/v1/ready-check",
-                auth=get_auth(),
-                verify=False,
-            )
-            if r.status_code == 200:
-                data = r.json()
+            ready_checks = lcu_events.get_event_count(lcu_events.READY_CHECK_EVENT)
+            data = None
+            if ready_checks != seen_ready_checks:
+                data = _pushed_ready_check(
+                    lcu_events.get_latest_event(lcu_events.READY_CHECK_EVENT)
+                )
+            seen_ready_checks = ready_checks
+            observed_at = time.monotonic()
+            status_code = 200
+            if data is None:
+                r = lcu_get("/lol-matchmaking/v1/ready-check")
+                status_code = r.status_code
+                data = r.json() if status_code == 200 else None
+            if status_code == 200:
                 state = data.get("state")
 
                 # Only log state changes to reduce spam
@@ -37,11 +88,7 @@ def accept_queue():
                     last_state = state
 
                 if state == "InProgress":
-                    accept = requests.post(
-                        f"{get_base_url()}/lol-matchmaking/v1/ready-check/accept",
-                        auth=get_auth(),
-                        verify=False,
-                    )
+                    accept = lcu_post("/lol-matchmaking/v1/ready-check/accept")
 
                     if accept.status_code != 204:
                         log_and_discord(
@@ -52,11 +99,27 @@ def accept_queue():
                         time.sleep(1)
                         continue
 
-                    print("✅ Queue accepted!")
+                    latency_ms = _record_accept_latency(data, observed_at)
+                    if latency_ms is not None:
+                        print(f"✅ Queue accepted! ({latency_ms:.0f} ms after pop)")
+                    else:
+                        print("✅ Queue accepted!")
 
                     # Wait for either champ select to start or queue to be cancelled
+                    watched_events = (
+                        lcu_events.CHAMP_SELECT_SESSION_EVENT,
+                        lcu_events.READY_CHECK_EVENT,
+                    )
+                    seen_events = {
+                        name: lcu_events.get_event_count(name)
+                        for name in watched_events
+                    }
                     while True:
-                        time.sleep(1)
+                        lcu_events.wait_for_event(watched_events, 1, since=seen_events)
+                        seen_events = {
+                            name: lcu_events.get_event_count(name)
+                            for name in watched_events
+                        }
 
                         # Check if champ select has started
                         session = get_session()
@@ -67,11 +130,7 @@ def accept_queue():
                             return
 
                         # Re-check queue state
-                        r = requests.get(
-                            f"{get_base_url()}/lol-matchmaking/v1/ready-check",
-                            auth=get_auth(),
-                            verify=False,
-                        )
+                        r = lcu_get("/lol-matchmaking/v1/ready-check")
                         if r.status_code == 200:
                             data = r.json()
                             state = data.get("state")
@@ -100,7 +159,12 @@ def accept_queue():
                             )
                             break
 
-            time.sleep(1)
+            # Wakes up immediately on a ready-check event.
+            lcu_events.wait_for_event(
+                lcu_events.READY_CHECK_EVENT,
+                _ready_check_poll_interval(status_code == 200),
+                since=seen_ready_checks,
+            )
         except (
             requests.exceptions.ConnectionError,
             requests.exceptions.RequestException,
@@ -1,4 +1,4 @@
-import requests
+import threading
 import time
 import os
 from urllib.parse import quote
@@ -12,55 +12,25 @@ from utils import (
     get_summoner_name,
 )
 from utils import shared_state
+from utils.discord_dispatcher import post_discord_message
+from utils.discord_outbox import discord_outbox
 
 load_dotenv()
 
 _IN_GAME_PHASES = frozenset({"GameStart", "InProgress", "Reconnect"})
 
 
-def _post_to_discord_with_retries(content, max_attempts=3, delay_seconds=1.5):
-    """Post message to Discord with retry support for transient failures."""
+def _post_to_discord(content):
+    """
+    Queue a message for the Discord dispatcher and return immediately.
+
+    Returns False without DISCORD_WEBHOOK_URL or when the queue is full; delivery
+    failures are reported through log_and_discord by the dispatcher thread.
+    """
     webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
     if not webhook_url:
         return False
-
-    for attempt in range(1, max_attempts + 1):
-        try:
-            response = requests.post(
-                webhook_url,
-                json={"content": content},
-                timeout=(4, 10),
-            )
-            if response.status_code == 204:
-                return True
-
-            if response.status_code == 429:
-                retry_after = delay_seconds
-                if response.headers.get("Content-Type", "").startswith(
-                    "application/json"
-                ):
-                    payload = response.json()
-                    retry_after = payload.get("retry_after", delay_seconds)
-                time.sleep(max(retry_after, delay_seconds))
-                continue
-
-            # Retry 5xx errors; log and stop for other HTTP statuses.
-            if 500 <= response.status_code < 600 and attempt < max_attempts:
-                time.sleep(delay_seconds)
-                continue
-
-            log_and_discord(
-                f"❌ Error sending discord message: {response.status_code} - {response.text}"
-            )
-            return False
-        except requests.exceptions.RequestException as e:
-            if attempt < max_attempts:
-                time.sleep(delay_seconds)
-                continue
-            log_and_discord(f"❌ Error sending discord message after retries: {e}")
-            return False
-
-    return False
+    return post_discord_message(webhook_url, content, on_failure=log_and_discord)
 
 
 def send_discord_post_game_message(last_game_data, rank_changes, summoner_name):
@@ -112,8 +82,8 @@ def send_discord_post_game_message(last_game_data, rank_changes, summoner_name):
             "```"
         )
 
-        if _post_to_discord_with_retries(content):
-            print("✅ Discord message sent with post game stats")
+        if discord_outbox.enqueue(content):
+            print("✅ Discord message queued with post game stats")
             return True
         return False
     except LeagueClientDisconnected:
@@ -165,8 +135,8 @@ def send_discord_pre_game_message(game_data):
             f"🌍 **OPGG:** <{opgg_url}>\n\n\n"
         )
 
-        if _post_to_discord_with_retries(styled_content):
-            print("✅ Discord message sent")
+        if discord_outbox.enqueue(styled_content):
+            print("✅ Discord message queued")
             return True
         return False
 
@@ -177,6 +147,23 @@ def send_discord_pre_game_message(game_data):
         return False
 
 
+def schedule_discord_pre_game_message(game_data):
+    """
+    Send the pre-game message from a background thread.
+
+    It waits up to 90 seconds for the game to start, which must not hold up the
+    main loop (a dodge would otherwise delay the next queue accept).
+    """
+    thread = threading.Thread(
+        target=send_discord_pre_game_message,
+        args=(dict(game_data),),
+        name="discord-pre-game",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
 def send_discord_champ_select_started_message(session):
     """Send a lightweight Discord message when champion select starts."""
     try:
@@ -188,8 +175,8 @@ def send_discord_champ_select_started_message(session):
             f"👤 **Player:** `{player_name}`\n"
             "⚔️ **Status:** Champion select is live!"
         )
-        if _post_to_discord_with_retries(content):
-            print("✅ Discord champ select start message sent")
+        if _post_to_discord(content):
+            print("✅ Discord champ select start message queued")
     except LeagueClientDisconnected:
         return
     except Exception as e:
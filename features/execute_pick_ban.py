@@ -1,21 +1,28 @@
-import requests
 import time
 from utils.logger import log_and_discord
-from utils import get_auth, get_base_url, handle_connection_errors, get_session
+from utils import (
+    get_session,
+    handle_connection_errors,
+    lcu_get,
+    lcu_patch,
+    lcu_request_all,
+)
+from utils import lock_in_scheduler, session_hub
+
+# Upper bound for waiting on a session update between preselect confirmation reads.
+PRESELECT_CONFIRM_TIMEOUT_SECONDS = 0.5
 
 
 @handle_connection_errors
 def execute_ban(action, champion_name, champion_id):
     """Execute a ban action via the League Client API."""
     try:
-        res = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/actions/{action['id']}",
+        res = lcu_patch(
+            f"/lol-champ-select/v1/session/actions/{action['id']}",
             json={
                 "championId": champion_id,
                 "completed": True,
             },
-            auth=get_auth(),
-            verify=False,
         )
         if res.status_code == 204:
             print(f"✅ Banned {champion_name}!")
@@ -32,11 +39,9 @@ def execute_ban(action, champion_name, champion_id):
 def execute_preselect(action, champion_name, champion_id):
     """Execute a champion preselection (hover) without locking via the League Client API."""
     try:
-        res = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/actions/{action['id']}",
+        res = lcu_patch(
+            f"/lol-champ-select/v1/session/actions/{action['id']}",
             json={"championId": champion_id, "completed": False},
-            auth=get_auth(),
-            verify=False,
         )
         if res.status_code == 204:
             return True
@@ -54,31 +59,9 @@ def execute_preselect(action, champion_name, champion_id):
 def execute_preselect_intent(champion_name, champion_id, log_errors=True):
     """Set hover intent via my-selection, even before pick turn."""
     try:
-        # Newer clients use `championPickIntent` on my-selection.
-        intent_res = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/my-selection",
-            json={"championPickIntent": champion_id},
-            auth=get_auth(),
-            verify=False,
-        )
-        # Older/community examples use intentChampionId.
-        intent_legacy_res = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/my-selection",
-            json={"intentChampionId": champion_id},
-            auth=get_auth(),
-            verify=False,
-        )
-        # Some clients only react to championId as hover intent.
-        champion_res = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/my-selection",
-            json={"championId": champion_id},
-            auth=get_auth(),
-            verify=False,
-        )
-
         # Some clients ignore my-selection intent updates but still allow patching
-        # our pending pick action with completed=false.
-        action_res = None
+        # our pending pick action with completed=false. While the session hub runs
+        # this read is served from the shared snapshot.
         action_id = None
         session_for_action = get_session() or {}
         my_cell_id_for_action = session_for_action.get("localPlayerCellId")
@@ -94,22 +77,56 @@ def execute_preselect_intent(champion_name, champion_id, log_errors=True):
             if action_id:
                 break
 
+        # The two intent fields go out together. championId is written after them
+        # like it always was, since some clients take it as the final hover.
+        intent_patches = [
+            # Newer clients use `championPickIntent` on my-selection.
+            (
+                "PATCH",
+                "/lol-champ-select/v1/session/my-selection",
+                {"json": {"championPickIntent": champion_id}},
+            ),
+            # Older/community examples use intentChampionId.
+            (
+                "PATCH",
+                "/lol-champ-select/v1/session/my-selection",
+                {"json": {"intentChampionId": champion_id}},
+            ),
+        ]
+        intent_res, intent_legacy_res = lcu_request_all(intent_patches)
+        # Some clients only react to championId as hover intent. The pick action
+        # is a separate resource set to the same champion, so it shares the trip.
+        champion_patches = [
+            (
+                "PATCH",
+                "/lol-champ-select/v1/session/my-selection",
+                {"json": {"championId": champion_id}},
+            ),
+        ]
         if action_id:
-            action_res = requests.patch(
-                f"{get_base_url()}/lol-champ-select/v1/session/actions/{action_id}",
-                json={"championId": champion_id, "completed": False},
-                auth=get_auth(),
-                verify=False,
+            champion_patches.append(
+                (
+                    "PATCH",
+                    f"/lol-champ-select/v1/session/actions/{action_id}",
+                    {"json": {"championId": champion_id, "completed": False}},
+                )
             )
+        responses = lcu_request_all(champion_patches)
+        champion_res = responses[0]
+        action_res = responses[1] if action_id else None
 
-        # Read-after-write can be briefly stale in champ select.
+        # Read-after-write can be briefly stale in champ select: confirm on the
+        # next session fetches instead of fixed sleeps.
         current_intent = 0
         current_champion = 0
         action_pick_champion = 0
         my_selection = {}
         my_selection_status = None
         for _ in range(3):
-            session = get_session() or {}
+            seen_session_version = session_hub.get_session_version()
+            # A pick action seen on an earlier read must not confirm this one.
+            action_pick_champion = 0
+            session = get_session(fresh=True) or {}
             my_cell_id = session.get("localPlayerCellId")
             my_team = session.get("myTeam", [])
             my_player = next(
@@ -128,24 +145,22 @@ def execute_preselect_intent(champion_name, champion_id, log_errors=True):
                         action_pick_champion = action.get("championId", 0)
                         break
 
-            my_selection_res = requests.get(
-                f"{get_base_url()}/lol-champ-select/v1/session/my-selection",
-                auth=get_auth(),
-                verify=False,
-            )
+            if champion_id in (current_intent, current_champion, action_pick_champion):
+                return True
+
+            my_selection_res = lcu_get("/lol-champ-select/v1/session/my-selection")
             my_selection_status = my_selection_res.status_code
             if my_selection_res.status_code == 200:
                 my_selection = my_selection_res.json() or {}
 
             if (
-                current_intent == champion_id
-                or current_champion == champion_id
-                or action_pick_champion == champion_id
-                or my_selection.get("championPickIntent") == champion_id
+                my_selection.get("championPickIntent") == champion_id
                 or my_selection.get("championId") == champion_id
             ):
                 return True
-            time.sleep(0.2)
+            session_hub.wait_for_session_update(
+                seen_session_version, PRESELECT_CONFIRM_TIMEOUT_SECONDS
+            )
 
         if log_errors:
             log_and_discord(
@@ -173,12 +188,12 @@ def execute_preselect_intent(champion_name, champion_id, log_errors=True):
 def execute_pick(action, champion_name, champion_id):
     """Execute a pick action via the League Client API."""
     try:
-        res = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/actions/{action['id']}",
+        started = time.monotonic()
+        res = lcu_patch(
+            f"/lol-champ-select/v1/session/actions/{action['id']}",
             json={"championId": champion_id, "completed": True},
-            auth=get_auth(),
-            verify=False,
         )
+        lock_in_scheduler.record_patch_rtt(time.monotonic() - started)
         if res.status_code == 204:
             print(f"✅ Picked {champion_name}!")
             return True
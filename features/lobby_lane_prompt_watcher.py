@@ -2,47 +2,51 @@
 Show the session lane / chat message prompt when entering a League lobby, not when queueing.
 """
 
-import threading
-import time
-
 from utils import shared_state
-from utils.exceptions import LeagueClientDisconnected
-from utils.rank_utils import get_gameflow_phase
+from utils.poll_scheduler import register_task
 from features.session_lane_prompt import (
     prompt_session_lane_selection,
     dismiss_lane_prompt_for_lobby_exit,
 )
 
+# The prompt only matters around the lobby; stay quiet while a game runs.
+LOBBY_PROMPT_TASK_INTERVALS = {
+    "ChampSelect": 5.0,
+    "InProgress": 30.0,
+}
+
+_was_in_lobby = False
+
+
+def _reset_lobby_state():
+    """Client went down: the next lobby after a restart is a new lobby entry."""
+    global _was_in_lobby
+    _was_in_lobby = False
+
+
+def _check_lobby_prompt(phase):
+    global _was_in_lobby
 
-def _lobby_prompt_loop():
-    was_in_lobby = False
-    while True:
-        try:
-            phase = get_gameflow_phase()
-            if phase is None:
-                time.sleep(1)
-                continue
+    if phase is None:
+        _was_in_lobby = False
+        return
 
-            in_lobby = phase == "Lobby"
+    in_lobby = phase == "Lobby"
 
-            if in_lobby and not was_in_lobby:
-                prompt_session_lane_selection(shared_state.config_preferred_role)
+    if in_lobby and not _was_in_lobby:
+        prompt_session_lane_selection(shared_state.config_preferred_role)
 
-            # Idle at home while a prompt is still open (user left party without confirming).
-            if was_in_lobby and not in_lobby and phase == "None":
-                dismiss_lane_prompt_for_lobby_exit()
+    # Idle at home while a prompt is still open (user left party without confirming).
+    if _was_in_lobby and not in_lobby and phase == "None":
+        dismiss_lane_prompt_for_lobby_exit()
 
-            was_in_lobby = in_lobby
-        except LeagueClientDisconnected:
-            was_in_lobby = False
-            time.sleep(2)
-        except Exception as e:
-            print(f"[Lobby prompt watcher]: {e}")
-            time.sleep(2)
-        time.sleep(1)
+    _was_in_lobby = in_lobby
 
 
 def start_lobby_lane_prompt_watcher():
-    thread = threading.Thread(target=_lobby_prompt_loop, daemon=True)
-    thread.start()
-    return thread
+    return register_task(
+        "lobby_lane_prompt",
+        _check_lobby_prompt,
+        LOBBY_PROMPT_TASK_INTERVALS,
+        on_suspend=_reset_lobby_state,
+    )
@@ -1,12 +1,15 @@
 import time
 import keyboard
 
-from constants import PICK_TIME_LEFT_MS
+from constants import LOCK_IN_SAFETY_MARGIN_MS
 from features.select_default_runes_and_summs import (
     select_default_runes,
     select_summoner_spells,
 )
 from utils.logger import log_and_discord
+from utils import draft_events, lock_in_scheduler, session_hub
+from utils.poll_scheduler import get_draft_poll_interval
+from utils.champ_select_state import get_champ_select_state
 from utils import (
     LeagueClientDisconnected,
     fetch_champion_ids,
@@ -16,13 +19,15 @@ from utils import (
     get_enemy_champions,
     get_locked_in_champion,
     get_owned_champion_ids,
+    get_owned_champion_ids_version,
     get_session,
     is_champion_locked_in,
     is_still_our_turn_to_pick,
     normalize_lcu_lane,
+    resolve_champion_id,
     shared_state,
 )
-from features.select_champion_logic import build_pick_candidate_sources
+from features.select_champion_logic import CandidateSourceCache
 import features.execute_pick_ban as execute_pick_ban
 from features.discord_message import create_discord_message
 
@@ -35,12 +40,42 @@ def _first_owned_default_pick(default_names, champion_ids, owned_champion_ids):
     if not default_names or not owned_champion_ids:
         return None, None
     for name in default_names:
-        cid = champion_ids.get(name)
+        cid = resolve_champion_id(name, champion_ids)
         if cid and cid in owned_champion_ids:
             return name, cid
     return None, None
 
 
+# Draft changes that can alter what pick_and_ban does next. Enemy hovers and
+# swap requests do not wake the loop.
+PICK_BAN_EVENTS = frozenset(
+    {
+        draft_events.ACTION_STARTED,
+        draft_events.ACTION_COMPLETED,
+        draft_events.ALLY_HOVER,
+        draft_events.BAN_COMPLETED,
+        draft_events.ENEMY_LOCK,
+        draft_events.PHASE_CHANGED,
+        draft_events.TIMER_RESET,
+        draft_events.DRAFT_ENDED,
+    }
+)
+
+
+def _wait_for_draft_change(subscription, seen_session_version, session=None):
+    """
+    Sleep until a draft event we act on arrives, at most the scheduler's draft interval.
+
+    Without the session hub no draft events are published; wait for any session
+    update instead.
+    """
+    timeout = get_draft_poll_interval(session)
+    if session_hub.is_session_hub_running():
+        subscription.wait(timeout)
+    else:
+        session_hub.wait_for_session_update(seen_session_version, timeout)
+
+
 def _consume_cycle_request(cycle_state):
     """Consume one queued cycle request from the hotkey callback."""
     if not cycle_state["requested"]:
@@ -173,7 +208,8 @@ def pick_and_ban(config, preferred_role_override=None):
     - Provides success/failure feedback for ban attempts
 
     **Session Monitoring:**
-    - Continuously polls the session every 4 seconds
+    - Re-checks the session whenever the client pushes a session update
+      (falls back to polling every 4 seconds without the event stream)
     - Only processes actions during BAN_PICK or FINALIZATION phases
     - Handles session termination gracefully
 
@@ -206,6 +242,7 @@ def pick_and_ban(config, preferred_role_override=None):
     ownership_warning_logged = False
     active_pick_action_id = None
     pick_candidate_sources = []
+    candidate_cache = CandidateSourceCache()
     current_source_index = 0
     current_candidate_index = 0
     preselected_pick_name = None
@@ -217,10 +254,23 @@ def pick_and_ban(config, preferred_role_override=None):
     if toggle_hotkey_handler is not None:
         hotkey_handlers.append(toggle_hotkey_handler)
     autoselect_runes = config.get("autoselect_runes", True)
+    lock_in_safety_margin_ms = config.get(
+        "lock_in_safety_margin_ms", LOCK_IN_SAFETY_MARGIN_MS
+    )
 
+    draft_subscription = draft_events.subscribe_draft_events(PICK_BAN_EVENTS)
     try:
         while True:
+            seen_session_version = session_hub.get_session_version()
             session = get_session()
+            snapshot = session_hub.get_snapshot()
+            # The hub stamps a session when it first differs; that is the closest
+            # local time to the client's timer stamp.
+            session_received_at = (
+                snapshot.received_at
+                if session_hub.is_session_hub_running() and snapshot
+                else time.time()
+            )
 
             # Check if session is undefined or None
             if not session:
@@ -296,32 +346,23 @@ def pick_and_ban(config, preferred_role_override=None):
 
             # Only proceed if we're in a relevant phase
             if not current_phase or current_phase not in ["BAN_PICK", "FINALIZATION"]:
-                time.sleep(4)
-                session = get_session()
+                _wait_for_draft_change(draft_subscription, seen_session_version, session)
                 continue
 
             assigned_lane = get_assigned_lane(session)
             if not assigned_lane:
                 log_and_discord("Could not determine assigned lane.")
-                time.sleep(4)
+                _wait_for_draft_change(draft_subscription, seen_session_version, session)
                 continue
             lane_key = normalize_lcu_lane(assigned_lane)
             if not lane_key:
-                time.sleep(4)
+                _wait_for_draft_change(draft_subscription, seen_session_version, session)
                 continue
 
-            # Collect all championIds picked (hovered or locked in) by teammates
-            my_team_cell_ids = {p["cellId"] for p in session.get("myTeam", [])}
-            ally_champion_ids = set()
-            for action_group in actions:
-                for action in action_group:
-                    if (
-                        action["type"] == "pick"
-                        and action["actorCellId"] in my_team_cell_ids
-                        and action["actorCellId"] != my_cell_id
-                        and action.get("championId", 0) not in (0, None)
-                    ):
-                        ally_champion_ids.add(action["championId"])
+            # All championIds picked (hovered or locked in) by teammates
+            ally_champion_ids = set(
+                get_champ_select_state(session).ally_pick_champion_ids
+            )
 
             for action_group in actions:
                 for action in action_group:
@@ -335,7 +376,7 @@ def pick_and_ban(config, preferred_role_override=None):
                         if action["type"] == "ban":
                             champions_to_ban = config["bans"].get(lane_key, [])
                             for champ in champions_to_ban:
-                                champ_id = CHAMPION_IDS.get(champ)
+                                champ_id = resolve_champion_id(champ, CHAMPION_IDS)
                                 if champ_id and champ_id not in ally_champion_ids:
                                     if execute_pick_ban.execute_ban(
                                         action, champ, champ_id
@@ -379,7 +420,7 @@ def pick_and_ban(config, preferred_role_override=None):
 
                                 banned_champions_ids = get_banned_champion_ids(session)
 
-                                pick_candidate_sources = build_pick_candidate_sources(
+                                pick_candidate_sources = candidate_cache.get(
                                     config,
                                     lane_key,
                                     enemy_champions,
@@ -388,9 +429,11 @@ def pick_and_ban(config, preferred_role_override=None):
                                     banned_champions_ids,
                                     CHAMPION_IDS,
                                     owned_champion_ids,
+                                    get_owned_champion_ids_version(),
                                 )
                             except Exception as e:
                                 log_and_discord(f"⚠️ Error in pick logic: {e}")
+                                candidate_cache.invalidate()
                                 pick_candidate_sources = []
                                 banned_champions_ids = []  # Fallback to empty list
 
@@ -502,7 +545,9 @@ def pick_and_ban(config, preferred_role_override=None):
                                 continue
 
                             if not is_champion_preselected:
-                                champ_id_to_preselect = CHAMPION_IDS.get(best_pick)
+                                champ_id_to_preselect = resolve_champion_id(
+                                    best_pick, CHAMPION_IDS
+                                )
                                 preselect_success = execute_pick_ban.execute_preselect(
                                     action, best_pick, champ_id_to_preselect
                                 )
@@ -521,24 +566,22 @@ def pick_and_ban(config, preferred_role_override=None):
                                         f"⚠️ Preselect failed for {best_pick}. Will retry on next loop."
                                     )
 
-                            timeLeftToPickMilis = session.get("timer", {}).get(
-                                "adjustedTimeLeftInPhase", 0
-                            )
-
-                            # Calculate sleep time, ensuring it's not negative
-                            sleep_time = max(
-                                0, (timeLeftToPickMilis - PICK_TIME_LEFT_MS) / 1000
+                            timer = session.get("timer", {})
+                            lock_in_scheduler.observe_timer(timer, session_received_at)
+                            lock_in_at = lock_in_scheduler.get_lock_in_time(
+                                timer, lock_in_safety_margin_ms, session_received_at
                             )
 
-                            # Pick when there is 5 seconds left (5000ms) - PICK_TIME_LEFT_MS
-                            if sleep_time > 0:
-                                remaining_sleep = sleep_time
-                                while remaining_sleep > 0:
+                            # Hold the pick until the computed lock-in time; the
+                            # last slice sleeps exactly up to it.
+                            if lock_in_at is not None:
+                                while True:
+                                    remaining_sleep = lock_in_at - time.time()
+                                    if remaining_sleep <= 0:
+                                        break
                                     if not shared_state.auto_pick_enabled:
                                         break
-                                    interval = min(0.2, remaining_sleep)
-                                    time.sleep(interval)
-                                    remaining_sleep -= interval
+                                    time.sleep(min(0.2, remaining_sleep))
 
                                     if not _consume_cycle_request(cycle_state):
                                         continue
@@ -572,8 +615,8 @@ def pick_and_ban(config, preferred_role_override=None):
                                     ):
                                         is_champion_preselected = False
                                         preselected_pick_name = None
-                                        champ_id_to_preselect = CHAMPION_IDS.get(
-                                            best_pick
+                                        champ_id_to_preselect = resolve_champion_id(
+                                            best_pick, CHAMPION_IDS
                                         )
                                         preselect_success = (
                                             execute_pick_ban.execute_preselect(
@@ -607,7 +650,7 @@ def pick_and_ban(config, preferred_role_override=None):
                                 return
 
                             # Re check if its still our turn, we might have switched pick positions on our turn to pick
-                            session = get_session()
+                            session = get_session(fresh=True)
                             is_our_turn = is_still_our_turn_to_pick(
                                 session, session.get("localPlayerCellId")
                             )
@@ -615,18 +658,26 @@ def pick_and_ban(config, preferred_role_override=None):
                                 break
 
                             print(f"Picking {best_pick}")
-                            champ_id = CHAMPION_IDS.get(best_pick)
+                            champ_id = resolve_champion_id(best_pick, CHAMPION_IDS)
                             if not champ_id:
                                 log_and_discord(
                                     f"⚠️ Missing champion ID for {best_pick}. Cannot lock pick."
                                 )
                                 continue
 
-                            lock_deadline = time.time() + 6.0
+                            # Retry until the phase ends; never less than a second
+                            # in case the deadline estimate runs early.
+                            phase_deadline = lock_in_scheduler.get_phase_deadline(
+                                timer, session_received_at
+                            )
+                            lock_deadline = max(
+                                phase_deadline or time.time() + 6.0,
+                                time.time() + 1.0,
+                            )
                             lock_attempts = 0
                             did_lock = False
                             while time.time() < lock_deadline:
-                                current_session = get_session()
+                                current_session = get_session(fresh=True)
                                 if not current_session:
                                     break
 
@@ -636,22 +687,12 @@ def pick_and_ban(config, preferred_role_override=None):
                                 ):
                                     break
 
-                                current_pick_action = None
-                                for action_group in current_session.get("actions", []):
-                                    for current_action in action_group:
-                                        if (
-                                            current_action.get("actorCellId")
-                                            == my_cell_id
-                                            and current_action.get("isInProgress")
-                                            and current_action.get("type") == "pick"
-                                        ):
-                                            current_pick_action = current_action
-                                            break
-                                    if current_pick_action:
-                                        break
-
-                                if not current_pick_action:
+                                in_progress = get_champ_select_state(
+                                    current_session
+                                ).in_progress_action(my_cell_id)
+                                if in_progress is None or in_progress.type != "pick":
                                     break
+                                current_pick_action = in_progress.raw
 
                                 if not shared_state.auto_pick_enabled:
                                     break
@@ -681,8 +722,8 @@ def pick_and_ban(config, preferred_role_override=None):
                                     f"⚠️ Lock-in retries exhausted for {best_pick} after {lock_attempts} attempts."
                                 )
 
-            # Wait 4 seconds before next iteration
-            time.sleep(4)
+            # Wait for the next draft event we act on (at most the draft interval)
+            _wait_for_draft_change(draft_subscription, seen_session_version, session)
 
     except KeyboardInterrupt:
         print("\n🛑 Pick and ban monitoring stopped by user.")
@@ -691,6 +732,12 @@ def pick_and_ban(config, preferred_role_override=None):
     except Exception as e:
         log_and_discord(f"❌ Error in pick and ban loop: {e}")
     finally:
+        draft_subscription.close()
+        if candidate_cache.hits or candidate_cache.misses:
+            print(
+                f"📊 Pick candidates: {candidate_cache.misses} rebuilds, "
+                f"{candidate_cache.hits} reused"
+            )
         for handler in hotkey_handlers:
             try:
                 keyboard.remove_hotkey(handler)
@@ -1,12 +1,14 @@
-import time
 import requests
-from utils import shared_state, LeagueClientDisconnected, get_auth, get_base_url
+from utils import LeagueClientDisconnected, lcu_get
+from utils.json_extract import has_items, response_text
+from utils.poll_scheduler import register_task
 from features.discord_message import get_game_data
-from features.post_game.post_game_utils import sanitize_last_game_data, get_rank_changes
-from features.discord_message import (
-    get_gameflow_phase,
-    send_discord_post_game_message,
+from features.post_game.post_game_utils import (
+    fetch_post_game_data,
+    get_rank_changes,
+    sanitize_last_game_data,
 )
+from features.discord_message import send_discord_post_game_message
 
 # gameflow-phase can flip through EndOfGame in under 3s; polling faster + eog-stats
 # catches post-game reliably. Only trust eog-stats when phase is still post-game-ish,
@@ -22,17 +24,11 @@ _EOG_PHASES_ALLOW_STATS_ENDPOINT = frozenset(
 
 def _eog_stats_block_available():
     try:
-        r = requests.get(
-            f"{get_base_url()}/lol-end-of-game/v1/eog-stats-block",
-            auth=get_auth(),
-            verify=False,
-        )
+        r = lcu_get("/lol-end-of-game/v1/eog-stats-block")
         if r.status_code != 200:
             return False
-        data = r.json()
-        if not isinstance(data, dict):
-            return False
-        return bool(data.get("teams"))
+        # Only whether teams is filled matters; the block is never fully parsed.
+        return has_items(response_text(r), ("teams",))
     except (
         requests.exceptions.ConnectionError,
         requests.exceptions.RequestException,
@@ -43,55 +39,75 @@ def _eog_stats_block_available():
         return False
 
 
+# Seconds between post-game checks: fast around the end of a game, rare while it runs.
+END_OF_GAME_TASK_INTERVALS = {
+    "ChampSelect": 5.0,
+    "InProgress": 20.0,
+    "WaitingForStats": 0.5,
+    "PreEndOfGame": 0.5,
+    "EndOfGame": 0.5,
+    "Lobby": 1.0,
+}
+
+_message_sent = False
+_last_sent_game_id = None
+_POST_GAME_PHASES = _EOG_PHASES_ALLOW_STATS_ENDPOINT | {"Lobby"}
+
+
+def check_end_of_game(gameflow_phase):
+    """Scheduler task: send the post-game message once per finished game."""
+    global _message_sent, _last_sent_game_id
+
+    try:
+        # New game / champ select: allow another post-game message after this match.
+        if gameflow_phase in ("ChampSelect", "InProgress"):
+            _message_sent = False
+
+        if gameflow_phase not in _POST_GAME_PHASES or _message_sent:
+            return
+
+        should_attempt_post_game = (
+            gameflow_phase == "EndOfGame" or _eog_stats_block_available()
+        )
+        if not should_attempt_post_game:
+            return
+
+        # One match-history read shared by the summary and the LP change.
+        post_game = fetch_post_game_data()
+        sanitized_last_game = sanitize_last_game_data(post_game)
+        current_game_id = (
+            sanitized_last_game.get("game_id")
+            if isinstance(sanitized_last_game, dict)
+            else None
+        )
+
+        # Avoid duplicate messages for the same game.
+        if current_game_id and current_game_id == _last_sent_game_id:
+            _message_sent = True
+            return
+
+        game_data = get_game_data()
+        sent = send_discord_post_game_message(
+            sanitized_last_game,
+            get_rank_changes(post_game),
+            game_data.get("summoner_name"),
+        )
+        if sent:
+            print("🟡 END OF GAME gameflow_phase", gameflow_phase)
+            _message_sent = True
+            if current_game_id:
+                _last_sent_game_id = current_game_id
+    except (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.RequestException,
+        RuntimeError,
+    ):
+        # The scheduler suspends its tasks and flags the disconnect for the main loop.
+        raise LeagueClientDisconnected()
+
+
 def start_end_of_game_actions():
-    message_sent = False
-    last_sent_game_id = None
-    post_game_phases = set(_EOG_PHASES_ALLOW_STATS_ENDPOINT) | {"Lobby"}
-    while True:
-        try:
-            gameflow_phase = get_gameflow_phase()
-            # New game / champ select: allow another post-game message after this match.
-            if gameflow_phase in ("ChampSelect", "InProgress"):
-                message_sent = False
-
-            eog_ready = _eog_stats_block_available()
-            should_attempt_post_game = gameflow_phase in post_game_phases and (
-                gameflow_phase == "EndOfGame" or eog_ready
-            )
-
-            if should_attempt_post_game and not message_sent:
-                sanitized_last_game = sanitize_last_game_data()
-                current_game_id = (
-                    sanitized_last_game.get("game_id")
-                    if isinstance(sanitized_last_game, dict)
-                    else None
-                )
-
-                # Avoid duplicate messages for the same game.
-                if current_game_id and current_game_id == last_sent_game_id:
-                    message_sent = True
-                else:
-                    game_data = get_game_data()
-                    sent = send_discord_post_game_message(
-                        sanitized_last_game,
-                        get_rank_changes(),
-                        game_data.get("summoner_name"),
-                    )
-                    if sent:
-                        print("🟡 END OF GAME gameflow_phase", gameflow_phase)
-                        message_sent = True
-                        if current_game_id:
-                            last_sent_game_id = current_game_id
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.RequestException,
-            RuntimeError,
-            LeagueClientDisconnected,
-        ):
-            # Set a flag to indicate the client disconnected (don't print here, main thread handles it)
-            shared_state.client_disconnected = True
-            break
-        except Exception as e:
-            print(f"❌ Error in end game actions: {e}")
-            # Continue running for other types of errors
-        time.sleep(1)
+    """Register the post-game check with the poll scheduler."""
+    return register_task(
+        "end_of_game", check_end_of_game, END_OF_GAME_TASK_INTERVALS
+    )
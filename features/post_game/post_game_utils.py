@@ -1,9 +1,27 @@
-import requests
 from features.discord_message import get_game_data
-from utils import get_auth, get_base_url
+from utils import lcu_get
+from utils.lcu_cache import cached_get
 from utils import get_rank_data, LeagueClientDisconnected
 from utils import shared_state
 from utils.lcu_connection import get_session
+from utils.json_extract import extract, response_text
+
+# Only the latest game is used: request a one-game range instead of the whole
+# match-history page.
+LATEST_MATCH_PATH = (
+    "/lol-match-history/v1/products/lol/current-summoner/matches"
+    "?begIndex=0&endIndex=1"
+)
+# Fields of the latest game read by the post-game message; the rest of the
+# payload (teams, timelines, older games) is never parsed.
+LATEST_MATCH_FIELDS = (
+    "gameId",
+    "gameDuration",
+    "gameMode",
+    "queueId",
+    "participantIdentities",
+    "participants",
+)
 
 
 def save_pre_game_lp(queue_type):
@@ -100,14 +118,22 @@ def fetch_last_game_data():
     Fetch the last game data from the api
     """
     try:
-        response = requests.get(
-            f"{get_base_url()}/lol-match-history/v1/products/lol/current-summoner/matches",
-            auth=get_auth(),
-            verify=False,
+        response = lcu_get(LATEST_MATCH_PATH)
+        if response.status_code >= 400:
+            return {
+                "error": (
+                    "Match history request failed: "
+                    f"{response.status_code} - {response.text[:200]}"
+                )
+            }
+
+        found = extract(
+            response_text(response),
+            [("games", "games", 0, field) for field in LATEST_MATCH_FIELDS],
         )
-
-        match_history = response.json()
-        return match_history["games"]["games"][0]
+        if not found:
+            raise IndexError("match history has no games")
+        return {path[-1]: value for path, value in found.items()}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
@@ -116,18 +142,45 @@ def get_summoner_id():
     """
     Get the summoner id from the api
     """
-    response = requests.get(
-        f"{get_base_url()}/lol-summoner/v1/current-summoner",
-        auth=get_auth(),
-        verify=False,
-    )
+    response = cached_get("/lol-summoner/v1/current-summoner")
     return response.json()["summonerId"]
 
 
-def sanitize_last_game_data():
+class PostGameData:
+    """Latest match and the local player's place in it, fetched and parsed once."""
+
+    __slots__ = ("game", "summoner_id", "participant_id", "win_loss", "error")
+
+    def __init__(self, game, summoner_id):
+        self.game = game
+        # Why the match could not be read (status code or exception text).
+        self.error = game.get("error")
+        self.summoner_id = summoner_id
+        self.participant_id = get_participant_id(game, summoner_id)
+        self.win_loss = (
+            get_win_loss_status(game, self.participant_id)
+            if self.participant_id is not None
+            else None
+        )
+
+
+def fetch_post_game_data():
+    """
+    Fetch the latest match once for one post-game message.
+
+    Pass the result to sanitize_last_game_data() and get_rank_changes() so they
+    share it instead of each downloading the match again.
+    """
+    return PostGameData(fetch_last_game_data(), get_summoner_id())
+
+
+def sanitize_last_game_data(post_game=None):
     """
     Get the last game data and extract win/loss status, champion played, and KDA.
 
+    Args:
+        post_game: PostGameData to reuse; fetched when omitted
+
     Returns:
         Dictionary containing:
         - win_loss: Dictionary with win status and result
@@ -136,17 +189,18 @@ def sanitize_last_game_data():
         - error: Error message if something goes wrong
     """
     try:
-        latest_game_data = fetch_last_game_data()
-        summoner_id = get_summoner_id()
-
-        # Find the current player's participant ID
-        participant_id = get_participant_id(latest_game_data, summoner_id)
+        if post_game is None:
+            post_game = fetch_post_game_data()
+        latest_game_data = post_game.game
+        participant_id = post_game.participant_id
 
+        if post_game.error:
+            return {"error": post_game.error}
         if participant_id is None:
             return {"error": "Could not find current player in the game"}
 
         # Get win/loss status
-        win_loss = get_win_loss_status(latest_game_data, participant_id)
+        win_loss = post_game.win_loss
         if not win_loss:
             return {"error": "Could not get win/loss status"}
 
@@ -173,7 +227,7 @@ def sanitize_last_game_data():
         return {"error": f"Unexpected error: {str(e)}"}
 
 
-def get_rank_changes():
+def get_rank_changes(post_game=None):
     # Get queue type from game_data, with fallback
     game_data = get_game_data()
     queue_type = (
@@ -193,10 +247,9 @@ def get_rank_changes():
     pre_division = shared_state.pre_game_lp.get("division", "Unknown")
     pre_lp = shared_state.pre_game_lp.get("lp", 0)
 
-    latest_game_data = fetch_last_game_data()
-    summoner_id = get_summoner_id()
-    participant_id = get_participant_id(latest_game_data, summoner_id)
-    win_loss = get_win_loss_status(latest_game_data, participant_id)
+    if post_game is None:
+        post_game = fetch_post_game_data()
+    win_loss = post_game.win_loss
     if not isinstance(win_loss, dict):
         return {
             "post_game": {
@@ -1,17 +1,74 @@
 import random
-from utils.logger import log_and_discord
-from utils import is_champion_available
-
-
-def _counter_list_index_for_enemy(counter_list, enemy_champ):
-    """Return list index where an entry matches enemy_champ case-insensitively, or None."""
-    if not counter_list or enemy_champ is None:
-        return None
-    target = str(enemy_champ).casefold()
-    for i, name in enumerate(counter_list):
-        if str(name).casefold() == target:
-            return i
-    return None
+from utils import ChampionAvailability
+
+
+_NON_COUNTER_PICK_SECTIONS = frozenset({"DEFAULT", "RANDOM_MODE"})
+
+# lane key -> (lane_picks_config, compiled index), filled by compile_counter_indexes.
+# The config object is kept to check the index still belongs to the lane config
+# being asked about; configs are not mutated after load.
+_compiled_counter_indexes = {}
+# Served for lanes without counter config, so a missing lane compiles nothing.
+_EMPTY_COUNTER_INDEX = {}
+# Bumped by compile_counter_indexes; identifies the loaded picks config.
+_config_version = 0
+
+
+def compile_counter_index(lane_picks_config):
+    """
+    Invert a lane's counter config into enemy -> ranked counter hits.
+
+    Keys are casefolded enemy names; values are (rank, counter_order, counter_champ)
+    tuples sorted best first, where rank is the enemy's position in the counter's
+    list and counter_order the counter's position in the lane config.
+    """
+    index = {}
+    for counter_order, (counter_champ, counter_list) in enumerate(
+        lane_picks_config.items()
+    ):
+        seen_enemies = set()
+        for rank, enemy in enumerate(counter_list or []):
+            enemy_key = str(enemy).casefold()
+            # Only the first occurrence counts, like a list.index lookup would.
+            if enemy_key in seen_enemies:
+                continue
+            seen_enemies.add(enemy_key)
+            index.setdefault(enemy_key, []).append(
+                (rank, counter_order, counter_champ)
+            )
+    for hits in index.values():
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+    return index
+
+
+def _get_counter_index(lane_picks_config, lane_key=None):
+    if not lane_picks_config:
+        return _EMPTY_COUNTER_INDEX
+    cached = _compiled_counter_indexes.get(lane_key)
+    if cached is not None and cached[0] is lane_picks_config:
+        return cached[1]
+    # Not compiled at load (ad-hoc lane config): compile for this call only.
+    return compile_counter_index(lane_picks_config)
+
+
+def compile_counter_indexes(config):
+    """
+    Compile every lane's counter config once (call right after validate_config).
+
+    get_counter_candidate_lists then looks up the enemy directly instead of
+    scanning every counter list on each pick-turn loop.
+    """
+    global _config_version
+    _config_version += 1
+    _compiled_counter_indexes.clear()
+    for lane, lane_picks_config in config.get("picks", {}).items():
+        if str(lane).upper() in _NON_COUNTER_PICK_SECTIONS:
+            continue
+        if isinstance(lane_picks_config, dict):
+            _compiled_counter_indexes[lane] = (
+                lane_picks_config,
+                compile_counter_index(lane_picks_config),
+            )
 
 
 def _merge_candidates(ranked_counter_candidates, default_candidates):
@@ -33,50 +90,45 @@ def get_counter_candidate_lists(
     banned_champions_ids,
     champion_ids,
     owned_champion_ids=None,
+    availability=None,
+    lane_key=None,
 ):
-    """Return ordered counter candidate lists keyed by source enemy champion."""
+    """
+    Return ordered counter candidate lists keyed by source enemy champion.
+
+    availability: ChampionAvailability for this draft, built from the other
+    arguments when not given.
+    lane_key: lane of lane_picks_config, to reuse the index compiled at load.
+    """
     if not enemy_champions:
         return []
 
+    counter_index = _get_counter_index(lane_picks_config, lane_key)
+    if availability is None:
+        availability = ChampionAvailability(
+            ally_champion_ids,
+            banned_champions_ids,
+            enemy_champions,
+            champion_ids,
+            owned_champion_ids,
+        )
     counter_candidate_lists = []
-    for enemy_order, enemy_champ in enumerate(enemy_champions):
+    for enemy_champ in enemy_champions:
         print(f"Checking enemy champion: {enemy_champ}")
-        ranked_hits = []
-        for counter_order, (counter_champ, counter_list) in enumerate(
-            lane_picks_config.items()
-        ):
-            enemy_index = _counter_list_index_for_enemy(counter_list, enemy_champ)
-            if enemy_index is None:
-                continue
-
-            try:
-                if not is_champion_available(
-                    counter_champ,
-                    ally_champion_ids,
-                    banned_champions_ids,
-                    enemy_champions,
-                    champion_ids,
-                    owned_champion_ids,
-                ):
+        hits = (
+            counter_index.get(str(enemy_champ).casefold(), ())
+            if enemy_champ is not None
+            else ()
+        )
+        counter_champs = [counter_champ for _, _, counter_champ in hits]
+        ranked_candidates = availability.filter(counter_champs)
+        if len(ranked_candidates) < len(counter_champs):
+            available = set(ranked_candidates)
+            for counter_champ in counter_champs:
+                if counter_champ not in available:
                     print(
                         f"Skipping {counter_champ} - not available (ownership, prepicked, banned, or picked by enemies)"
                     )
-                    continue
-                ranked_hits.append((enemy_index, enemy_order, counter_order, counter_champ))
-            except Exception as e:
-                log_and_discord(
-                    f"⚠️ Error in is_champion_available for {counter_champ}: {e}"
-                )
-                continue
-
-        ranked_hits.sort(key=lambda item: (item[0], item[1], item[2]))
-        ranked_candidates = []
-        seen = set()
-        for _, _, _, counter_champ in ranked_hits:
-            if counter_champ in seen:
-                continue
-            seen.add(counter_champ)
-            ranked_candidates.append(counter_champ)
 
         if ranked_candidates:
             counter_candidate_lists.append(
@@ -124,23 +176,21 @@ def get_available_default_picks(
     champion_ids,
     owned_champion_ids=None,
     default_section_key="DEFAULT",
+    availability=None,
 ):
     """Return available fallback picks in configured order."""
     default_picks = (
         config.get("picks", {}).get(default_section_key, {}).get(lane_key, [])
     )
-    available_defaults = []
-    for default_champ in default_picks:
-        if is_champion_available(
-            default_champ,
+    if availability is None:
+        availability = ChampionAvailability(
             ally_champion_ids,
             banned_champions_ids,
             enemy_champions,
             champion_ids,
             owned_champion_ids,
-        ):
-            available_defaults.append(default_champ)
-    return available_defaults
+        )
+    return availability.filter(default_picks)
 
 
 def build_pick_candidates(
@@ -177,6 +227,104 @@ def build_pick_candidates(
     return selected_candidates
 
 
+class CandidateSourceCache:
+    """
+    Reuses build_pick_candidate_sources results while the draft is unchanged.
+
+    The pick-turn loop runs on every session tick, but candidates only depend on
+    the lane, random mode, enemy picks, ally picks, bans and owned champions. The
+    cache fingerprints those inputs (the lane config through the config version
+    set by compile_counter_indexes) and only rebuilds when the fingerprint moves;
+    hits and misses are counted so idle ticks can be checked to do no work.
+    Cached sources are shared between hits: treat them as read-only.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._fingerprint = None
+        self._sources = None
+
+    @staticmethod
+    def fingerprint(
+        config,
+        lane_key,
+        enemy_champions,
+        lane_picks_config,
+        ally_champion_ids,
+        banned_champions_ids,
+        champion_ids,
+        owned_champion_ids=None,
+        owned_champion_ids_version=None,
+    ):
+        if owned_champion_ids is None:
+            owned_key = None
+        elif owned_champion_ids_version is not None:
+            owned_key = owned_champion_ids_version
+        else:
+            owned_key = frozenset(owned_champion_ids)
+        return (
+            lane_key,
+            bool(config.get("random_mode_active")),
+            # Enemy order decides the order of the counter lists.
+            tuple(enemy_champions or ()),
+            frozenset(ally_champion_ids or ()),
+            frozenset(banned_champions_ids or ()),
+            owned_key,
+            _config_version,
+            # The catalog dict is replaced only by a catalog update, which adds
+            # champions.
+            len(champion_ids or ()),
+        )
+
+    def get(
+        self,
+        config,
+        lane_key,
+        enemy_champions,
+        lane_picks_config,
+        ally_champion_ids,
+        banned_champions_ids,
+        champion_ids,
+        owned_champion_ids=None,
+        owned_champion_ids_version=None,
+    ):
+        """build_pick_candidate_sources, served from cache when the draft is unchanged."""
+        fingerprint = self.fingerprint(
+            config,
+            lane_key,
+            enemy_champions,
+            lane_picks_config,
+            ally_champion_ids,
+            banned_champions_ids,
+            champion_ids,
+            owned_champion_ids,
+            owned_champion_ids_version,
+        )
+        if self._sources is not None and fingerprint == self._fingerprint:
+            self.hits += 1
+            return self._sources
+
+        self.misses += 1
+        sources = build_pick_candidate_sources(
+            config,
+            lane_key,
+            enemy_champions,
+            lane_picks_config,
+            ally_champion_ids,
+            banned_champions_ids,
+            champion_ids,
+            owned_champion_ids,
+        )
+        self._fingerprint = fingerprint
+        self._sources = sources
+        return sources
+
+    def invalidate(self):
+        self._fingerprint = None
+        self._sources = None
+
+
 def build_pick_candidate_sources(
     config,
     lane_key,
@@ -194,6 +342,18 @@ def build_pick_candidate_sources(
     - random_mode_active = False: use one counter list per enemy when available; otherwise use DEFAULT picks
     """
     random_mode_active = bool(config.get("random_mode_active"))
+    # One availability for the whole build; the ownership-free view only reports
+    # what ownership excluded.
+    availability = ChampionAvailability(
+        ally_champion_ids,
+        banned_champions_ids,
+        enemy_champions,
+        champion_ids,
+        owned_champion_ids,
+    )
+    availability_without_ownership = (
+        availability.without_ownership() if owned_champion_ids is not None else None
+    )
 
     if random_mode_active:
         random_mode_candidates = get_available_default_picks(
@@ -205,6 +365,7 @@ def build_pick_candidate_sources(
             champion_ids,
             owned_champion_ids,
             "RANDOM_MODE",
+            availability,
         )
         random.shuffle(random_mode_candidates)
         print(f"🎲 Random mode active. RANDOM_MODE candidates: {random_mode_candidates}")
@@ -219,6 +380,7 @@ def build_pick_candidate_sources(
                 champion_ids,
                 None,
                 "RANDOM_MODE",
+                availability_without_ownership,
             )
             ownership_excluded = [
                 champ
@@ -243,6 +405,8 @@ def build_pick_candidate_sources(
             banned_champions_ids,
             champion_ids,
             None,
+            availability_without_ownership,
+            lane_key,
         )
         default_candidates_without_ownership = get_available_default_picks(
             config,
@@ -253,6 +417,7 @@ def build_pick_candidate_sources(
             champion_ids,
             None,
             "DEFAULT",
+            availability_without_ownership,
         )
 
     counter_candidate_lists = get_counter_candidate_lists(
@@ -262,6 +427,8 @@ def build_pick_candidate_sources(
         banned_champions_ids,
         champion_ids,
         owned_champion_ids,
+        availability,
+        lane_key,
     )
 
     default_candidates = get_available_default_picks(
@@ -273,6 +440,7 @@ def build_pick_candidate_sources(
         champion_ids,
         owned_champion_ids,
         "DEFAULT",
+        availability,
     )
 
     selected_sources = (
@@ -357,18 +525,15 @@ def select_default_pick(
     print(f"Default picks: {default_picks}")
     if default_picks:
         # Filter available default picks (not prepicked by teammates)
-        available_defaults = []
-        for default_champ in default_picks:
-            if is_champion_available(
-                default_champ,
-                ally_champion_ids,
-                banned_champions_ids,
-                enemy_champions,
-                champion_ids,
-                owned_champion_ids,
-            ):
-                print(f"Available default: {default_champ}")
-                available_defaults.append(default_champ)
+        available_defaults = ChampionAvailability(
+            ally_champion_ids,
+            banned_champions_ids,
+            enemy_champions,
+            champion_ids,
+            owned_champion_ids,
+        ).filter(default_picks)
+        for default_champ in available_defaults:
+            print(f"Available default: {default_champ}")
 
         if available_defaults:
             if mode == "DEFAULT":
@@ -1,17 +1,11 @@
-import requests
-
 from utils.logger import log_and_discord
-from utils import get_auth, get_base_url, handle_connection_errors
+from utils import handle_connection_errors, lcu_patch, lcu_post
 
 
 @handle_connection_errors
 def select_default_runes():
     try:
-        response = requests.post(
-            f"{get_base_url()}/lol-perks/v1/rune-recommender-auto-select",
-            auth=get_auth(),
-            verify=False,
-        )
+        response = lcu_post("/lol-perks/v1/rune-recommender-auto-select")
 
         if response.status_code == 200 or response.status_code == 204:
             print("✅ Successfully set current rune page to reccommended one")
@@ -31,11 +25,9 @@ def select_summoner_spells(config, champion, assigned_lane):
     champion_summs = summs_config.get(champion, summs_config.get("Default", {}))
 
     try:
-        response = requests.patch(
-            f"{get_base_url()}/lol-champ-select/v1/session/my-selection",
-            auth=get_auth(),
+        response = lcu_patch(
+            "/lol-champ-select/v1/session/my-selection",
             json=champion_summs,
-            verify=False,
         )
 
         if response.status_code == 200 or response.status_code == 204:
@@ -1,9 +1,8 @@
-import requests
 import random
 import json
 import threading
 
-from utils import get_auth, get_base_url
+from utils import lcu_post
 
 
 def send_champ_select_message(session, message_override=None):
@@ -40,8 +39,9 @@ def send_champ_select_message(session, message_override=None):
     elif "chatId" in session:
         chat_id = session["chatId"]
     if chat_id:
-        url = f"{get_base_url()}/lol-chat/v1/conversations/{chat_id}/messages"
-        res = requests.post(url, json={"body": message}, auth=get_auth(), verify=False)
+        res = lcu_post(
+            f"/lol-chat/v1/conversations/{chat_id}/messages", json={"body": message}
+        )
         if res.status_code == 200:
             print(f"[Chat] Sent message: {message}")
         else:
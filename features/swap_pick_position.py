@@ -1,7 +1,14 @@
-import requests
 import time
 from utils.logger import log_and_discord
-from utils import get_auth, get_base_url, get_session, handle_connection_errors
+from utils import get_session, handle_connection_errors, lcu_get, lcu_post
+from utils import session_hub
+from utils.poll_scheduler import get_draft_poll_interval
+
+# Minimum pause between two searches for a pick-order swap target.
+TARGET_SEARCH_INTERVAL_SECONDS = 5
+
+# How long to wait for someone else's pick order swap to finish before going ahead.
+ONGOING_SWAP_TIMEOUT_SECONDS = 30
 
 
 def get_pick_order(session, cell_id):
@@ -62,7 +69,7 @@ def swap_pick_position():
 
     Notes:
         - The function continues running until you reach 5th position or encounter an error
-        - Implements timeout mechanisms for ongoing swaps (up to 15 seconds)
+        - Implements timeout mechanisms for ongoing swaps (up to 30 seconds)
         - Tracks attempted swaps to avoid infinite loops
         - Handles session errors gracefully (e.g., when someone dodges)
         - Prioritizes targets with higher pick orders for more efficient swapping
@@ -106,23 +113,31 @@ def swap_pick_position():
         attempted_cell_ids = set()
         while True:
             # 1. Wait for any ongoing pick order swap to complete
-            wait_count = 0
-            while wait_count < 10:  # Wait up to 30 seconds
+            ongoing_deadline = time.monotonic() + ONGOING_SWAP_TIMEOUT_SECONDS
+            timed_out = False
+            waiting_logged = False
+            while True:
                 try:
-                    ongoing_swap_url = (
-                        f"{get_base_url()}/lol-champ-select/v1/ongoing-pick-order-swap"
-                    )
-                    ongoing_res = requests.get(
-                        ongoing_swap_url, auth=get_auth(), verify=False
+                    ongoing_version = session_hub.get_session_version()
+                    ongoing_res = lcu_get(
+                        "/lol-champ-select/v1/ongoing-pick-order-swap"
                     )
                     if ongoing_res.status_code == 200:
                         ongoing_swap = ongoing_res.json()
                         if ongoing_swap:
-                            print(
-                                f"[Pick Swap] Waiting for ongoing pick order swap to complete... ({wait_count + 1}/10)"
+                            if time.monotonic() >= ongoing_deadline:
+                                timed_out = True
+                                break
+                            if not waiting_logged:
+                                print(
+                                    "[Pick Swap] Waiting for ongoing pick order swap to complete..."
+                                )
+                                waiting_logged = True
+                            # A finished swap shows up as a session update.
+                            session_hub.wait_for_session_update(
+                                ongoing_version,
+                                get_draft_poll_interval(get_session()),
                             )
-                            time.sleep(3)
-                            wait_count += 1
                             continue
                         else:
                             print("[Pick Swap] No ongoing swap detected, proceeding...")
@@ -133,7 +148,7 @@ def swap_pick_position():
                     print(f"[Pick Swap] Failed to check ongoing swap: {e}")
                     break  # Proceed anyway if we can't check
 
-            if wait_count >= 10:
+            if timed_out:
                 print(
                     "[Pick Swap] Timed out waiting for ongoing swap, proceeding anyway..."
                 )
@@ -201,9 +216,9 @@ def swap_pick_position():
                 continue
 
             # 7. Make the swap request
-            url = f"{get_base_url()}/lol-champ-select/v1/session/pick-order-swaps/{swap_id}/request"
+            path = f"/lol-champ-select/v1/session/pick-order-swaps/{swap_id}/request"
             try:
-                res = requests.post(url, auth=get_auth(), verify=False)
+                res = lcu_post(path)
                 if (
                     res.status_code == 200
                     and res.text
@@ -225,6 +240,8 @@ def swap_pick_position():
 
             # 7. Continue to next iteration (which will recalculate everything)
 
-        # After inner loop ends, continue to outer loop to reset and try again
-        # Add a 5-second delay to prevent rapid re-execution when no valid targets are found
-        time.sleep(5)
+        # After inner loop ends, continue to outer loop to reset and try again.
+        # Sleep at least TARGET_SEARCH_INTERVAL_SECONDS so there is no rapid
+        # re-execution (and re-fetching) when no valid targets are found. Waking on
+        # a session update would not do: the timer changes the session every poll.
+        time.sleep(max(get_draft_poll_interval(session), TARGET_SEARCH_INTERVAL_SECONDS))
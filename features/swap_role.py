@@ -1,13 +1,12 @@
-import requests
 import time
 
 from utils.logger import log_and_discord
 from utils import (
     get_assigned_lane,
-    get_auth,
-    get_base_url,
     get_session,
     handle_connection_errors,
+    lcu_get,
+    lcu_post,
     normalize_lcu_lane,
     STANDARD_LCU_LANES,
 )
@@ -146,13 +145,13 @@ def swap_role(session, config, preferred_role_override=None):
         return
 
     # Request the swap using the swap ID
-    request_swap_url = (
-        f"{get_base_url()}/lol-champ-select/v1/session/position-swaps/{swap_id}/request"
+    request_swap_path = (
+        f"/lol-champ-select/v1/session/position-swaps/{swap_id}/request"
     )
-    check_swap_url = f"{get_base_url()}/lol-champ-select/v1/session/position-swaps"
+    check_swap_path = "/lol-champ-select/v1/session/position-swaps"
 
     try:
-        request_res = requests.post(request_swap_url, auth=get_auth(), verify=False)
+        request_res = lcu_post(request_swap_path)
         if request_res.status_code == 204 or request_res.status_code == 200:
             print(
                 f"[Role Swap] Requested swap to take {preferred_role} "
@@ -183,9 +182,7 @@ def swap_role(session, config, preferred_role_override=None):
                         return
 
                     # Check swap state for decline detection
-                    position_swaps_res = requests.get(
-                        check_swap_url, auth=get_auth(), verify=False
-                    )
+                    position_swaps_res = lcu_get(check_swap_path)
                     if (
                         position_swaps_res.status_code == 204
                         or position_swaps_res.status_code == 200
@@ -0,0 +1,75 @@
+from features import accept_queue as accept_queue_module
+from utils import lcu_events, metrics
+
+
+class _Response:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+def test_pushed_pop_is_accepted_without_polling(monkeypatch):
+    metrics.reset_metrics()
+    gets = []
+    posts = []
+
+    def _lcu_get(path):
+        gets.append(path)
+        return _Response(200, {"state": "Invalid"})
+
+    def _lcu_post(path):
+        posts.append(path)
+        return _Response(204)
+
+    def _wait_for_event(event_names, timeout, since=None):
+        # The pop arrives over the event stream while we wait.
+        if not posts:
+            lcu_events.dispatch_event(
+                lcu_events.READY_CHECK_EVENT,
+                {
+                    "data": {"state": "InProgress", "timer": 0.05},
+                    "eventType": "Update",
+                    "uri": "/lol-matchmaking/v1/ready-check",
+                },
+            )
+        return True
+
+    monkeypatch.setattr(accept_queue_module, "lcu_get", _lcu_get)
+    monkeypatch.setattr(accept_queue_module, "lcu_post", _lcu_post)
+    monkeypatch.setattr(lcu_events, "wait_for_event", _wait_for_event)
+    monkeypatch.setattr(
+        accept_queue_module, "get_session", lambda: {"localPlayerCellId": 0}
+    )
+    monkeypatch.setattr(
+        accept_queue_module, "dismiss_lane_prompt_for_game_found", lambda: None
+    )
+    monkeypatch.setattr(
+        accept_queue_module,
+        "send_discord_champ_select_started_message",
+        lambda session: None,
+    )
+
+    accept_queue_module.accept_queue()
+
+    assert gets == ["/lol-matchmaking/v1/ready-check"]
+    assert posts == ["/lol-matchmaking/v1/ready-check/accept"]
+    summary = metrics.get_metric_summary(accept_queue_module.ACCEPT_LATENCY_METRIC)
+    assert summary["count"] == 1
+    assert summary["last"] >= 50
+
+
+def test_poll_interval_is_fast_only_while_queued(monkeypatch):
+    monkeypatch.setattr(lcu_events, "is_event_stream_connected", lambda: False)
+    assert (
+        accept_queue_module._ready_check_poll_interval(True)
+        < accept_queue_module._ready_check_poll_interval(False)
+    )
+    monkeypatch.setattr(lcu_events, "is_event_stream_connected", lambda: True)
+    assert (
+        accept_queue_module._ready_check_poll_interval(True)
+        == accept_queue_module.EVENT_STREAM_POLL_SECONDS
+    )
@@ -0,0 +1,71 @@
+from utils import (
+    get_assigned_lane,
+    get_banned_champion_ids,
+    get_champ_select_state,
+    get_summoner_name,
+    is_still_our_turn_to_pick,
+)
+
+SESSION = {
+    "localPlayerCellId": 1,
+    "timer": {"phase": "ban_pick"},
+    "myTeam": [
+        {"cellId": 0, "championId": 0, "assignedPosition": "top"},
+        {
+            "cellId": 1,
+            "championId": 0,
+            "assignedPosition": "middle",
+            "gameName": "Me",
+            "tagLine": "EUW",
+        },
+    ],
+    "theirTeam": [
+        {"cellId": 5, "championId": 238},
+        {"cellId": 6, "championId": 0},
+    ],
+    "actions": [
+        [
+            {"id": 1, "actorCellId": 0, "type": "ban", "championId": 55, "completed": True},
+            {"id": 2, "actorCellId": 5, "type": "ban", "championId": 0, "completed": False},
+        ],
+        [
+            {"id": 3, "actorCellId": 0, "type": "pick", "championId": 86, "completed": False},
+            {
+                "id": 4,
+                "actorCellId": 1,
+                "type": "pick",
+                "championId": 0,
+                "completed": False,
+                "isInProgress": True,
+            },
+            {"id": 5, "actorCellId": 5, "type": "pick", "championId": 238, "completed": True},
+        ],
+    ],
+}
+
+
+def test_state_indexes_the_session_once():
+    state = get_champ_select_state(SESSION)
+
+    assert state is get_champ_select_state(SESSION)
+    assert state.timer_phase == "BAN_PICK"
+    assert state.local_player.assigned_position == "middle"
+    assert state.banned_champion_ids == (55,)
+    assert state.ally_pick_champion_ids == frozenset({86})
+    assert state.enemy_champion_ids == (238,)
+    assert state.local_pick_action.id == 4
+    assert state.in_progress_action().raw is SESSION["actions"][1][1]
+    assert state.in_progress_action(5) is None
+
+
+def test_helpers_read_from_the_state():
+    assert get_assigned_lane(SESSION) == "middle"
+    assert get_banned_champion_ids(SESSION) == [55]
+    assert get_summoner_name(SESSION) == "Me-EUW"
+    assert is_still_our_turn_to_pick(SESSION, 1)
+    assert not is_still_our_turn_to_pick(SESSION, 0)
+
+    # A new session object gets a new state.
+    moved = dict(SESSION, localPlayerCellId=0)
+    assert get_assigned_lane(moved) == "top"
+    assert get_summoner_name(moved) is None
@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+
+from utils import champion_catalog
+
+_CHAMPIONS = [
+    {"id": "Ahri", "key": 103, "name": "Ahri"},
+    {"id": "MonkeyKing", "key": 62, "name": "Wukong"},
+]
+
+
+@pytest.fixture
+def catalog_env(monkeypatch, tmp_path):
+    cache_file = os.path.join(tmp_path, "champion_catalog.json")
+    monkeypatch.setattr(champion_catalog, "CATALOG_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(champion_catalog, "CATALOG_CACHE_FILE", cache_file)
+    monkeypatch.setattr(champion_catalog, "_catalog", None)
+    monkeypatch.setattr(champion_catalog, "_background_refresh_started", False)
+    monkeypatch.setattr(champion_catalog, "_last_failed_download", None)
+    monkeypatch.setattr(champion_catalog, "_start_background_refresh", lambda: None)
+    downloads = []
+
+    def _download(version):
+        downloads.append(version)
+        return champion_catalog._build_catalog(version, list(_CHAMPIONS))
+
+    monkeypatch.setattr(champion_catalog, "_fetch_latest_version", lambda: "15.1.1")
+    monkeypatch.setattr(champion_catalog, "_download_catalog", _download)
+    return cache_file, downloads
+
+
+def test_downloads_once_and_persists(catalog_env):
+    cache_file, downloads = catalog_env
+
+    first = champion_catalog.get_champion_catalog()
+    second = champion_catalog.get_champion_catalog()
+
+    assert first is second
+    assert downloads == ["15.1.1"]
+    assert first.ids_by_name["Wukong"] == 62
+    assert first.names_by_id[103] == "Ahri"
+    with open(cache_file, encoding="utf-8") as f:
+        assert json.load(f)["version"] == "15.1.1"
+
+
+def test_uses_disk_cache_when_offline(catalog_env, monkeypatch):
+    cache_file, downloads = catalog_env
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump({"version": "14.24.1", "champions": _CHAMPIONS}, f)
+
+    def _offline():
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(champion_catalog, "_fetch_latest_version", _offline)
+
+    catalog = champion_catalog.get_champion_catalog()
+    assert catalog.version == "14.24.1"
+    assert champion_catalog.refresh_champion_catalog()
+    assert champion_catalog.get_champion_catalog().version == "14.24.1"
+    assert downloads == []
+
+
+def test_refresh_replaces_outdated_cache(catalog_env):
+    cache_file, downloads = catalog_env
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump({"version": "14.24.1", "champions": _CHAMPIONS[:1]}, f)
+
+    assert champion_catalog.get_champion_catalog().version == "14.24.1"
+    champion_catalog.refresh_champion_catalog()
+
+    assert downloads == ["15.1.1"]
+    assert champion_catalog.get_champion_catalog().version == "15.1.1"
+
+
+def test_catalog_resolves_aliases_and_case():
+    catalog = champion_catalog.ChampionCatalog(
+        "15.1.1",
+        _CHAMPIONS
+        + [
+            {"id": "Kaisa", "key": 145, "name": "Kai'Sa"},
+            {"id": "DrMundo", "key": 36, "name": "Dr. Mundo"},
+        ],
+    )
+
+    assert catalog.id_for_name("Kai'Sa") == 145
+    assert catalog.id_for_name("Kaisa") == 145
+    assert catalog.id_for_name("kai'sa") == 145
+    assert catalog.id_for_name("MonkeyKing") == 62
+    assert catalog.id_for_name("wukong") == 62
+    assert catalog.id_for_name("Dr Mundo") == 36
+    assert catalog.id_for_name("Teemo") is None
+    assert catalog.name_for_id(62) == "Wukong"
+    assert catalog.canonical_name("kaisa") == "Kai'Sa"
+
+
+def test_resolve_champion_id_only_uses_aliases_for_catalog_mapping(catalog_env):
+    catalog = champion_catalog.get_champion_catalog()
+
+    assert champion_catalog.resolve_champion_id("MonkeyKing", catalog.ids_by_name) == 62
+    assert champion_catalog.resolve_champion_id("MonkeyKing", {}) is None
+    assert champion_catalog.resolve_champion_name(62) == "Wukong"
+    assert champion_catalog.resolve_champion_name(62, {"Wukong": 62}) == "Wukong"
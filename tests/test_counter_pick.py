@@ -2,15 +2,25 @@ from features import select_champion_logic
 from features.pick_and_ban import _get_active_pick, _next_cycle_position
 
 
-def _always_available(*_args, **_kwargs):
-    return True
+class _AlwaysAvailable:
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    def is_available(self, _champion_name):
+        return True
+
+    def filter(self, champion_names):
+        return list(champion_names)
+
+    def without_ownership(self):
+        return self
 
 
 def test_get_ranked_counter_candidates_orders_globally(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     lane_picks_config = {
@@ -34,8 +44,8 @@ def test_get_ranked_counter_candidates_orders_globally(monkeypatch):
 def test_get_ranked_counter_candidates_matches_enemy_case_insensitively(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     lane_picks_config = {
@@ -57,8 +67,8 @@ def test_get_ranked_counter_candidates_matches_enemy_case_insensitively(monkeypa
 def test_get_ranked_counter_candidates_dedupes_candidates(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     lane_picks_config = {
@@ -81,8 +91,8 @@ def test_get_ranked_counter_candidates_dedupes_candidates(monkeypatch):
 def test_build_pick_candidates_uses_counters_only_when_available(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     config = {
@@ -113,8 +123,8 @@ def test_build_pick_candidates_uses_counters_only_when_available(monkeypatch):
 def test_build_pick_candidates_falls_back_to_defaults_when_no_counters(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     config = {
@@ -145,8 +155,8 @@ def test_build_pick_candidates_falls_back_to_defaults_when_no_counters(monkeypat
 def test_build_pick_candidate_sources_creates_one_list_per_enemy(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     config = {
@@ -181,8 +191,8 @@ def test_build_pick_candidate_sources_creates_one_list_per_enemy(monkeypatch):
 def test_build_pick_candidate_sources_falls_back_to_default_source(monkeypatch):
     monkeypatch.setattr(
         select_champion_logic,
-        "is_champion_available",
-        _always_available,
+        "ChampionAvailability",
+        _AlwaysAvailable,
     )
 
     config = {
@@ -212,6 +222,81 @@ def test_build_pick_candidate_sources_falls_back_to_default_source(monkeypatch):
     ]
 
 
+def test_compile_counter_index_ranks_hits_per_enemy():
+    lane_picks_config = {
+        "Diana": ["Yone", "Annie"],
+        "Ahri": ["annie", "Yone", "Annie"],
+        "Fizz": ["Yone"],
+    }
+
+    index = select_champion_logic.compile_counter_index(lane_picks_config)
+
+    assert index == {
+        "yone": [(0, 0, "Diana"), (0, 2, "Fizz"), (1, 1, "Ahri")],
+        "annie": [(0, 1, "Ahri"), (1, 0, "Diana")],
+    }
+
+
+def test_compile_counter_indexes_compiles_each_lane_once(monkeypatch):
+    config = {
+        "picks": {
+            "MIDDLE": {"Counter%d" % i: ["Yone"] for i in range(300)},
+            "DEFAULT": {"MIDDLE": ["Ahri"]},
+        }
+    }
+    select_champion_logic.compile_counter_indexes(config)
+
+    def _fail(_lane_picks_config):
+        raise AssertionError("lane config compiled again")
+
+    monkeypatch.setattr(select_champion_logic, "compile_counter_index", _fail)
+    monkeypatch.setattr(
+        select_champion_logic,
+        "ChampionAvailability",
+        _AlwaysAvailable,
+    )
+
+    lists = select_champion_logic.get_counter_candidate_lists(
+        ["Yone"],
+        config["picks"]["MIDDLE"],
+        ally_champion_ids=set(),
+        banned_champions_ids=[],
+        champion_ids={},
+        lane_key="MIDDLE",
+    )
+
+    assert lists[0]["candidates"] == ["Counter%d" % i for i in range(300)]
+
+
+def test_missing_lane_shares_one_empty_counter_index(monkeypatch):
+    config = {"picks": {"MIDDLE": {"Diana": ["Yone"]}, "DEFAULT": {"TOP": ["Garen"]}}}
+    select_champion_logic.compile_counter_indexes(config)
+
+    def _fail(_lane_picks_config):
+        raise AssertionError("missing lane compiled")
+
+    monkeypatch.setattr(select_champion_logic, "compile_counter_index", _fail)
+    monkeypatch.setattr(
+        select_champion_logic,
+        "ChampionAvailability",
+        _AlwaysAvailable,
+    )
+
+    for _ in range(5):
+        sources = select_champion_logic.build_pick_candidate_sources(
+            config,
+            "TOP",
+            ["Yone"],
+            config["picks"].get("TOP", {}),
+            set(),
+            [],
+            {},
+        )
+        assert sources == [{"source_enemy": "DEFAULT", "candidates": ["Garen"]}]
+
+    assert list(select_champion_logic._compiled_counter_indexes) == ["MIDDLE"]
+
+
 def test_cycle_position_moves_within_list_then_to_next_list():
     candidate_sources = [
         {"source_enemy": "Yone", "candidates": ["Diana", "Fizz"]},
@@ -244,3 +329,122 @@ def test_get_active_pick_returns_source_and_position():
     assert source_enemy == "Annie"
     assert source_idx == 1
     assert candidate_idx == 0
+
+
+def test_champion_availability_masks_blocked_and_unowned_champions():
+    champion_ids = {"Ahri": 103, "Annie": 1, "Yone": 777, "Zed": 238, "Fizz": 105}
+    availability = select_champion_logic.ChampionAvailability(
+        ally_champion_ids={1},
+        banned_champions_ids=[238],
+        enemy_champions=["yone"],
+        champion_ids=champion_ids,
+        owned_champion_ids={103, 1, 777, 238},
+    )
+
+    assert availability.filter(["Zed", "Ahri", "Annie", "Yone", "Fizz", "Teemo"]) == [
+        "Ahri"
+    ]
+    assert availability.allowed_mask(1 << 103 | 1 << 105) == 1 << 103
+    assert availability.without_ownership().filter(["Fizz", "Zed"]) == ["Fizz"]
+
+
+def test_pick_candidate_build_shares_one_availability(monkeypatch):
+    built = []
+    real = select_champion_logic.ChampionAvailability
+
+    def _counting(*args, **kwargs):
+        built.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(select_champion_logic, "ChampionAvailability", _counting)
+    config = {"picks": {"DEFAULT": {"MIDDLE": ["Ahri", "Zed"]}}}
+    champion_ids = {"Ahri": 103, "Zed": 238, "Fizz": 105, "Yone": 777}
+
+    sources = select_champion_logic.build_pick_candidate_sources(
+        config,
+        "MIDDLE",
+        ["Yone"],
+        {"Fizz": ["Yone"]},
+        set(),
+        [238],
+        champion_ids,
+        owned_champion_ids={103, 238},
+    )
+
+    assert sources == [{"source_enemy": "DEFAULT", "candidates": ["Ahri"]}]
+    assert len(built) == 1
+
+
+def test_candidate_source_cache_rebuilds_only_when_draft_changes(monkeypatch):
+    builds = []
+
+    def _build(*args):
+        builds.append(args)
+        return [{"source_enemy": "DEFAULT", "candidates": ["Ahri"]}]
+
+    monkeypatch.setattr(select_champion_logic, "build_pick_candidate_sources", _build)
+    cache = select_champion_logic.CandidateSourceCache()
+    config = {"picks": {"MIDDLE": {}}}
+    args = [config, "MIDDLE", ["Yone"], config["picks"]["MIDDLE"], {1}, [238], {}]
+
+    first = cache.get(*args, owned_champion_ids={103}, owned_champion_ids_version=1)
+    second = cache.get(*args, owned_champion_ids={103}, owned_champion_ids_version=1)
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get(*args, owned_champion_ids={103}, owned_champion_ids_version=2)
+    args[2] = ["Yone", "Zed"]
+    cache.get(*args, owned_champion_ids={103}, owned_champion_ids_version=2)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(builds) == 3
+
+
+def test_champion_availability_logs_unresolvable_candidates(monkeypatch):
+    from utils import champion_utils
+
+    logged = []
+    real_resolve = champion_utils.resolve_champion_id
+
+    def _resolve(name, champion_ids):
+        if name == "Broken":
+            raise ValueError("bad catalog entry")
+        return real_resolve(name, champion_ids)
+
+    monkeypatch.setattr(champion_utils, "resolve_champion_id", _resolve)
+    monkeypatch.setattr(champion_utils, "log_and_discord", logged.append)
+    availability = champion_utils.ChampionAvailability(
+        set(), [], [], {"Ahri": 103}
+    )
+
+    assert availability.filter(["Broken", "Ahri"]) == ["Ahri"]
+    assert logged == ["⚠️ Error resolving champion ID for Broken: bad catalog entry"]
+
+
+def test_candidate_source_cache_hits_for_lane_missing_from_picks(monkeypatch):
+    builds = []
+
+    def _build(*args):
+        builds.append(args)
+        return [{"source_enemy": "DEFAULT", "candidates": ["Garen"]}]
+
+    monkeypatch.setattr(select_champion_logic, "build_pick_candidate_sources", _build)
+    config = {"picks": {"MIDDLE": {"Diana": ["Yone"]}, "DEFAULT": {"TOP": ["Garen"]}}}
+    select_champion_logic.compile_counter_indexes(config)
+    cache = select_champion_logic.CandidateSourceCache()
+
+    for _ in range(5):
+        # A new empty lane config and a new (empty) catalog dict on every tick.
+        cache.get(
+            config,
+            "TOP",
+            ["Yone"],
+            config["picks"].get("TOP", {}),
+            {1},
+            [238],
+            dict(),
+            owned_champion_ids={103},
+            owned_champion_ids_version=1,
+        )
+
+    assert (cache.hits, cache.misses) == (4, 1)
+    assert len(builds) == 1
@@ -0,0 +1,67 @@
+import requests
+
+from features import decline_swap_requests
+from utils.draft_events import DRAFT_ENDED, DraftEvent
+
+
+class _Subscription:
+    """Hands out scripted wait() results; [] stands for the polling fallback."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.closed = False
+
+    def wait(self, _timeout):
+        return self.results.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+def _session(*swap_ids):
+    return {
+        "localPlayerCellId": 0,
+        "myTeam": [{"cellId": 0}],
+        "theirTeam": [],
+        "actions": [],
+        "positionSwaps": [{"id": swap_id, "state": "RECEIVED"} for swap_id in swap_ids],
+    }
+
+
+def _response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+def test_rescan_retries_failed_declines_only(monkeypatch):
+    sessions = [_session(4), _session(4, 5), _session(4, 5)]
+    statuses = [500, 204, 204]
+    posted = []
+    logged = []
+
+    def _lcu_post(path):
+        posted.append(path)
+        return _response(statuses.pop(0))
+
+    subscription = _Subscription([[], [], [DraftEvent(DRAFT_ENDED)]])
+    monkeypatch.setattr(
+        decline_swap_requests, "subscribe_draft_events", lambda _types: subscription
+    )
+    monkeypatch.setattr(decline_swap_requests, "get_session", lambda: sessions.pop(0))
+    monkeypatch.setattr(decline_swap_requests, "get_draft_poll_interval", lambda _s: 0)
+    monkeypatch.setattr(decline_swap_requests, "lcu_post", _lcu_post)
+    monkeypatch.setattr(decline_swap_requests, "log_and_discord", logged.append)
+    monkeypatch.setattr(decline_swap_requests.time, "sleep", lambda _seconds: None)
+
+    decline_swap_requests.decline_incoming_swap_requests()
+
+    # 4 fails, is picked up again by the rescan with the new 5; once both were
+    # declined, the stale "RECEIVED" entries are not posted again.
+    assert posted == [
+        "/lol-champ-select/v1/session/position-swaps/4/decline",
+        "/lol-champ-select/v1/session/position-swaps/5/decline",
+        "/lol-champ-select/v1/session/position-swaps/4/decline",
+    ]
+    assert logged == ["[Swap Decline] Failed to decline position swap: 500"]
+    assert subscription.closed
@@ -0,0 +1,137 @@
+import time
+
+import pytest
+
+from features import discord_message
+from tools.discord_stand_in import DiscordWebhookStandIn
+from utils import discord_dispatcher
+from utils.discord_dispatcher import (
+    flush_discord_dispatcher,
+    get_discord_dispatcher_stats,
+    post_discord_message,
+)
+
+
+@pytest.fixture
+def webhook(monkeypatch):
+    servers = []
+    monkeypatch.setattr(discord_dispatcher, "DISCORD_RETRY_DELAY_SECONDS", 0.05)
+    discord_dispatcher.reset_discord_dispatcher()
+
+    def _start(**kwargs):
+        server = DiscordWebhookStandIn(**kwargs).start()
+        servers.append(server)
+        return server
+
+    yield _start
+    discord_dispatcher.reset_discord_dispatcher()
+    for server in servers:
+        server.stop()
+
+
+def test_post_returns_before_a_slow_webhook_answers(webhook):
+    server = webhook(delay=0.3)
+
+    started = time.perf_counter()
+    assert post_discord_message(server.webhook_url(), "hello")
+    assert time.perf_counter() - started < 0.1
+
+    assert flush_discord_dispatcher(timeout=5)
+    assert [m["content"] for m in server.messages] == ["hello"]
+
+
+def test_waits_for_bucket_reset_instead_of_hitting_429(webhook):
+    server = webhook(rate_limit=2, window=0.3)
+
+    for index in range(5):
+        post_discord_message(server.webhook_url(), f"m{index}")
+
+    assert flush_discord_dispatcher(timeout=5)
+    assert [m["content"] for m in server.messages] == [f"m{i}" for i in range(5)]
+    # Remaining hit 0 after two posts, so the third waited for the reset.
+    assert server.requests == 5
+    assert get_discord_dispatcher_stats()["rate_limited"] == 0
+
+
+def test_retries_429_and_server_errors(webhook):
+    server = webhook()
+    server.fail_next(429, retry_after=0.1)
+    server.fail_next(500)
+
+    post_discord_message(server.webhook_url(), "eventually")
+
+    assert flush_discord_dispatcher(timeout=5)
+    assert [m["content"] for m in server.messages] == ["eventually"]
+    stats = get_discord_dispatcher_stats()
+    assert stats["rate_limited"] == 1 and stats["retried"] == 2 and stats["sent"] == 1
+
+
+def test_rate_limited_webhook_does_not_hold_up_others(webhook):
+    server = webhook()
+    server.fail_next(429, retry_after=1.0)
+
+    post_discord_message(server.webhook_url("main"), "limited")
+    post_discord_message(server.webhook_url("errors"), "other")
+
+    messages = server.wait_for_messages(1, timeout=0.8)
+    assert [m["content"] for m in messages] == ["other"]
+    assert flush_discord_dispatcher(timeout=5)
+    assert [m["content"] for m in server.messages] == ["other", "limited"]
+
+
+def test_gives_up_after_max_attempts(webhook):
+    server = webhook()
+    server.fail_next(500, count=discord_dispatcher.DISCORD_MAX_ATTEMPTS)
+    failures = []
+
+    post_discord_message(server.webhook_url(), "lost", on_failure=failures.append)
+
+    assert flush_discord_dispatcher(timeout=5)
+    assert server.messages == []
+    assert len(failures) == 1 and "500" in failures[0]
+
+
+def test_refused_message_is_not_retried(webhook):
+    server = webhook()
+    server.fail_next(400)
+    server.fail_next(403)
+    failures = []
+    rejections = []
+
+    post_discord_message(server.webhook_url(), "bad", on_failure=failures.append)
+    post_discord_message(
+        server.webhook_url(),
+        "bad too",
+        on_failure=failures.append,
+        on_rejected=lambda status, error: rejections.append(status),
+    )
+
+    assert flush_discord_dispatcher(timeout=5)
+    assert server.messages == []
+    assert server.requests == 2
+    assert len(failures) == 1 and "400" in failures[0]
+    assert rejections == [403]
+
+
+def test_full_queue_drops_new_messages(webhook, monkeypatch):
+    server = webhook(delay=0.2)
+    monkeypatch.setattr(discord_dispatcher, "DISCORD_QUEUE_SIZE", 2)
+
+    results = [post_discord_message(server.webhook_url(), f"m{i}") for i in range(3)]
+
+    assert results == [True, True, False]
+    assert get_discord_dispatcher_stats()["dropped"] == 1
+    assert flush_discord_dispatcher(timeout=5)
+
+
+def test_discord_messages_go_through_the_dispatcher(webhook, monkeypatch):
+    server = webhook()
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", server.webhook_url())
+    monkeypatch.setattr(
+        discord_message, "get_summoner_name", lambda session: "Tester#EUW"
+    )
+
+    discord_message.send_discord_champ_select_started_message({})
+
+    assert flush_discord_dispatcher(timeout=5)
+    assert "Tester#EUW" in server.messages[0]["content"]
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from tools.discord_stand_in import DiscordWebhookStandIn
+from utils import discord_dispatcher, discord_outbox as outbox_module
+from utils.discord_outbox import DiscordOutbox, load_outbox
+
+
+@pytest.fixture
+def webhook(monkeypatch):
+    monkeypatch.setattr(discord_dispatcher, "DISCORD_RETRY_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(outbox_module, "OUTBOX_BACKOFF_SECONDS", (0.05,))
+    discord_dispatcher.reset_discord_dispatcher()
+    server = DiscordWebhookStandIn(rate_limit=50).start()
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", server.webhook_url())
+    yield server
+    discord_dispatcher.reset_discord_dispatcher()
+    server.stop()
+
+
+def test_notification_is_persisted_then_marked_done(webhook, tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    outbox = DiscordOutbox(str(path))
+
+    assert outbox.enqueue("GG")
+    assert outbox.wait_until_empty(timeout=5)
+    outbox.stop(timeout=1)
+
+    assert [m["content"] for m in webhook.messages] == ["GG"]
+    # Drained: nothing left to resend on the next start.
+    assert load_outbox(str(path)) == []
+
+
+def test_failed_delivery_is_retried_with_backoff(webhook, tmp_path):
+    webhook.fail_next(500, count=discord_dispatcher.DISCORD_MAX_ATTEMPTS + 1)
+    outbox = DiscordOutbox(str(tmp_path / "outbox.jsonl"))
+
+    outbox.enqueue("post game")
+
+    assert outbox.wait_until_empty(timeout=5)
+    outbox.stop(timeout=1)
+    assert [m["content"] for m in webhook.messages] == ["post game"]
+    assert webhook.requests == discord_dispatcher.DISCORD_MAX_ATTEMPTS + 2
+
+
+def test_refused_notification_is_dropped_not_retried(webhook, tmp_path, capsys):
+    path = tmp_path / "outbox.jsonl"
+    webhook.fail_next(404)
+    outbox = DiscordOutbox(str(path))
+
+    outbox.enqueue("unknown webhook")
+
+    assert outbox.wait_until_empty(timeout=5)
+    outbox.stop(timeout=1)
+    assert webhook.messages == []
+    assert webhook.requests == 1
+    assert load_outbox(str(path)) == []
+    assert "📮 Dropped Discord notification: refused by Discord" in capsys.readouterr().out
+
+
+def test_pending_entries_survive_a_restart(webhook, tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    lines = [
+        {"op": "add", "id": "a", "webhook_env": "DISCORD_WEBHOOK_URL", "content": "sent", "created_at": 1e12},
+        {"op": "add", "id": "b", "webhook_env": "DISCORD_WEBHOOK_URL", "content": "pending", "created_at": 1e12},
+        {"op": "done", "id": "a"},
+    ]
+    path.write_text(
+        "".join(json.dumps(line) + "\n" for line in lines) + '{"op": "add", "id"',
+        encoding="utf-8",
+    )
+
+    outbox = DiscordOutbox(str(path)).start()
+
+    assert outbox.wait_until_empty(timeout=5)
+    outbox.stop(timeout=1)
+    assert [m["content"] for m in webhook.messages] == ["pending"]
+    assert not path.exists()
+
+
+def test_enqueue_without_webhook_is_refused(tmp_path, monkeypatch):
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+    path = tmp_path / "outbox.jsonl"
+
+    assert not DiscordOutbox(str(path)).enqueue("nobody listens")
+    assert not path.exists()
@@ -0,0 +1,143 @@
+import pytest
+
+from utils import draft_events
+from utils.champ_select_state import ChampSelectState
+from utils.draft_events import (
+    ACTION_COMPLETED,
+    ACTION_STARTED,
+    ALLY_HOVER,
+    BAN_COMPLETED,
+    DRAFT_ENDED,
+    ENEMY_HOVER,
+    ENEMY_LOCK,
+    PHASE_CHANGED,
+    SWAP_RECEIVED,
+    TIMER_RESET,
+    diff_states,
+)
+
+
+def _session(actions=(), phase="BAN_PICK", now_ms=1_000_000, left_ms=30_000, swaps=()):
+    return {
+        "localPlayerCellId": 0,
+        "timer": {
+            "phase": phase,
+            "internalNowInEpochMs": now_ms,
+            "adjustedTimeLeftInPhase": left_ms,
+        },
+        "myTeam": [{"cellId": 0}, {"cellId": 1}],
+        "theirTeam": [{"cellId": 5}],
+        "actions": [list(actions)],
+        "positionSwaps": list(swaps),
+    }
+
+
+def _action(action_id, cell_id, type="pick", champion_id=0, completed=False, in_progress=False):
+    return {
+        "id": action_id,
+        "actorCellId": cell_id,
+        "type": type,
+        "championId": champion_id,
+        "completed": completed,
+        "isInProgress": in_progress,
+    }
+
+
+def _types(previous, current):
+    previous = ChampSelectState(previous) if previous else None
+    current = ChampSelectState(current) if current else None
+    return [event.type for event in diff_states(previous, current)]
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    draft_events.reset_draft_events()
+    yield
+    draft_events.reset_draft_events()
+
+
+def test_first_session_reports_phase_and_running_actions():
+    session = _session([_action(1, 0, "ban", in_progress=True)])
+
+    assert _types(None, session) == [PHASE_CHANGED, ACTION_STARTED]
+
+
+def test_unchanged_session_has_no_events():
+    session = _session([_action(1, 0, in_progress=True)])
+
+    assert _types(session, _session([_action(1, 0, in_progress=True)])) == []
+
+
+def test_completed_actions_by_type_and_team():
+    before = _session(
+        [_action(1, 5, "ban", 10, in_progress=True), _action(2, 5, champion_id=20, in_progress=True)]
+    )
+    after = _session(
+        [_action(1, 5, "ban", 10, completed=True), _action(2, 5, champion_id=20, completed=True)]
+    )
+
+    assert _types(before, after) == [
+        ACTION_COMPLETED,
+        BAN_COMPLETED,
+        ACTION_COMPLETED,
+        ENEMY_LOCK,
+    ]
+
+
+def test_hovers_from_others_only():
+    before = _session([_action(1, 0), _action(2, 1), _action(3, 5)])
+    after = _session(
+        [_action(1, 0, champion_id=7), _action(2, 1, champion_id=8), _action(3, 5, champion_id=9)]
+    )
+
+    assert _types(before, after) == [ALLY_HOVER, ENEMY_HOVER]
+
+
+def test_timer_reset_and_phase_change():
+    before = _session(now_ms=1_000_000, left_ms=5_000)
+    # Same phase, deadline pushed back by 25 seconds.
+    reset = _session(now_ms=1_001_000, left_ms=29_000)
+    finalization = _session(phase="FINALIZATION")
+
+    assert _types(before, reset) == [TIMER_RESET]
+    # The clock ticking down is not a reset.
+    assert _types(before, _session(now_ms=1_001_000, left_ms=4_000)) == []
+    assert _types(reset, finalization) == [PHASE_CHANGED]
+
+
+def test_new_received_swaps_only():
+    sent = {"id": 3, "state": "SENT"}
+    received = {"id": 4, "state": "RECEIVED"}
+    before = _session(swaps=[sent])
+    after = _session(swaps=[sent, received])
+
+    events = diff_states(ChampSelectState(before), ChampSelectState(after))
+
+    assert [(e.type, e.action_id, e.data["kind"]) for e in events] == [
+        (SWAP_RECEIVED, 4, "position")
+    ]
+    assert _types(after, _session(swaps=[sent, received])) == []
+
+
+def test_subscribers_receive_only_their_types():
+    swaps = draft_events.subscribe_draft_events({SWAP_RECEIVED, DRAFT_ENDED})
+    actions = draft_events.subscribe_draft_events({ACTION_STARTED})
+    try:
+        draft_events.publish_session(_session([_action(1, 0, in_progress=True)]))
+        draft_events.publish_session(
+            _session(
+                [_action(1, 0, in_progress=True)],
+                swaps=[{"id": 9, "state": "RECEIVED"}],
+            )
+        )
+        draft_events.publish_session(None)
+
+        assert [e.type for e in swaps.wait(0)] == [SWAP_RECEIVED, DRAFT_ENDED]
+        assert [e.type for e in actions.wait(0)] == [ACTION_STARTED]
+        assert actions.wait(0) == []
+    finally:
+        swaps.close()
+        actions.close()
+
+    draft_events.publish_session(_session([_action(2, 0, in_progress=True)]))
+    assert swaps.wait(0) == []
@@ -0,0 +1,71 @@
+import time
+
+from utils import logger as logger_module
+from utils.error_aggregator import ErrorAggregator, error_fingerprint
+
+
+def _collector():
+    sent = []
+    return sent, lambda error, summoner_name=None: sent.append((error, summoner_name))
+
+
+def _wait_for(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_fingerprint_masks_numbers():
+    assert error_fingerprint("port 51234 failed") == error_fingerprint("port 9 failed")
+    assert error_fingerprint("a", "Me") != error_fingerprint("a", "Other")
+
+
+def test_repeats_are_coalesced_into_one_summary():
+    sent, send = _collector()
+    aggregator = ErrorAggregator(send, window_seconds=0.2)
+
+    for attempt in range(5):
+        aggregator.report(f"❌ Failed to decline swap {attempt}", "Me")
+
+    assert sent == [("❌ Failed to decline swap 0", "Me")]
+    assert _wait_for(lambda: len(sent) == 2)
+    assert sent[1] == ("❌ Failed to decline swap 4 (×4 in the last 0.2s)", "Me")
+
+
+def test_single_report_has_no_summary():
+    sent, send = _collector()
+    aggregator = ErrorAggregator(send, window_seconds=0.05)
+
+    aggregator.report("once")
+    time.sleep(0.2)
+
+    assert sent == [("once", None)]
+    # The window closed, so the next occurrence is reported right away.
+    aggregator.report("once")
+    assert len(sent) == 2
+
+
+def test_rate_cap_defers_reports_to_flush():
+    sent, send = _collector()
+    aggregator = ErrorAggregator(send, window_seconds=60, max_per_minute=2)
+
+    for name in ("a", "b", "c", "d"):
+        aggregator.report(f"error {name}")
+
+    assert [error for error, _ in sent] == ["error a", "error b"]
+    aggregator.flush()
+    assert sorted(error for error, _ in sent[2:]) == ["error c", "error d"]
+
+
+def test_log_and_discord_reports_through_aggregator(monkeypatch, capsys):
+    sent, send = _collector()
+    monkeypatch.setattr(
+        logger_module, "error_aggregator", ErrorAggregator(send, window_seconds=60)
+    )
+
+    for _ in range(3):
+        logger_module.log_and_discord("❌ Error fetching owned champions: 500", "Me")
+
+    assert len(sent) == 1
+    assert capsys.readouterr().out.count("Error fetching owned champions") == 3
@@ -0,0 +1,94 @@
+import threading
+
+import utils.lcu_connection as lcu
+from features import execute_pick_ban
+
+
+class _Response:
+    status_code = 204
+    text = ""
+
+
+def test_preselect_intent_writes_champion_id_after_intents(monkeypatch):
+    session = {
+        "localPlayerCellId": 1,
+        "myTeam": [{"cellId": 1, "championPickIntent": 0, "championId": 0}],
+        "actions": [[{"id": 7, "type": "pick", "actorCellId": 1, "completed": False}]],
+    }
+    # Each batch of two writes must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    sent = []
+    lock = threading.Lock()
+
+    def _lcu_request(method, path, **kwargs):
+        barrier.wait()
+        with lock:
+            sent.append((path, tuple(kwargs["json"])))
+        session["myTeam"][0]["championPickIntent"] = 103
+        return _Response()
+
+    def _get_session(fresh=False):
+        return session
+
+    monkeypatch.setattr(lcu, "lcu_request", _lcu_request)
+    monkeypatch.setattr(execute_pick_ban, "get_session", _get_session)
+
+    assert execute_pick_ban.execute_preselect_intent("Ahri", 103)
+    intents, champion = sorted(sent[:2]), sorted(sent[2:])
+    assert intents == [
+        ("/lol-champ-select/v1/session/my-selection", ("championPickIntent",)),
+        ("/lol-champ-select/v1/session/my-selection", ("intentChampionId",)),
+    ]
+    assert champion == [
+        ("/lol-champ-select/v1/session/actions/7", ("championId", "completed")),
+        ("/lol-champ-select/v1/session/my-selection", ("championId",)),
+    ]
+
+
+def test_preselect_uses_only_the_latest_pick_action_read(monkeypatch):
+    pending_action = {"id": 7, "type": "pick", "actorCellId": 1, "completed": False}
+    reads = [
+        # Looking up the pick action to patch.
+        {"localPlayerCellId": 1, "myTeam": [{"cellId": 1}], "actions": [[pending_action]]},
+        # First confirmation read: the action briefly shows another champion.
+        {
+            "localPlayerCellId": 1,
+            "myTeam": [{"cellId": 1}],
+            "actions": [[dict(pending_action, championId=55)]],
+        },
+        # Later reads no longer list our pending action.
+        {"localPlayerCellId": 1, "myTeam": [{"cellId": 1}], "actions": []},
+        {"localPlayerCellId": 1, "myTeam": [{"cellId": 1}], "actions": []},
+    ]
+    logged = []
+
+    class _Selection(_Response):
+        status_code = 200
+
+        def json(self):
+            return {}
+
+    monkeypatch.setattr(lcu, "lcu_request", lambda method, path, **kwargs: _Response())
+    monkeypatch.setattr(
+        execute_pick_ban, "get_session", lambda fresh=False: reads.pop(0)
+    )
+    monkeypatch.setattr(execute_pick_ban, "lcu_get", lambda path: _Selection())
+    monkeypatch.setattr(
+        execute_pick_ban.session_hub, "wait_for_session_update", lambda *args: None
+    )
+    monkeypatch.setattr(execute_pick_ban, "log_and_discord", logged.append)
+
+    assert not execute_pick_ban.execute_preselect_intent("Ahri", 103)
+    assert "pickActionChampionId=0," in logged[0]
+
+
+def test_lcu_request_all_keeps_call_order(monkeypatch):
+    monkeypatch.setattr(
+        lcu, "lcu_request", lambda method, path, **kwargs: (method, path, kwargs)
+    )
+
+    responses = lcu.lcu_request_all(
+        [("GET", "/a", None), ("PATCH", "/b", {"json": {"x": 1}})]
+    )
+
+    assert responses == [("GET", "/a", {}), ("PATCH", "/b", {"json": {"x": 1}})]
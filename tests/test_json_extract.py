@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from utils.json_extract import extract, extract_value, has_items, iter_array
+
+DOC = {
+    "accountId": 1,
+    "games": {
+        "gameCount": 2,
+        "games": [
+            {"gameId": 10, "participants": [{"participantId": 1, "stats": {"win": True}}]},
+            {"gameId": 11, "participants": []},
+        ],
+    },
+    "note": "braces { and [ \"quotes\" inside strings",
+}
+TEXT = json.dumps(DOC, indent=2)
+
+
+def test_extract_matches_full_parse():
+    found = extract(
+        TEXT,
+        [
+            ("games", "games", 0, "gameId"),
+            ("games", "games", 1, "participants"),
+            ("note",),
+            ("games", "missing"),
+            ("accountId", "nested"),
+        ],
+    )
+
+    assert found == {
+        ("games", "games", 0, "gameId"): 10,
+        ("games", "games", 1, "participants"): [],
+        ("note",): DOC["note"],
+    }
+    assert extract_value(TEXT, ("games", "games", 0, "participants", 0, "stats")) == {
+        "win": True
+    }
+    assert extract_value(TEXT, ("games", "games", 5), "absent") == "absent"
+
+
+def test_shorter_path_covers_longer_one():
+    found = extract(TEXT, [("games", "games", 0), ("games", "games", 0, "gameId")])
+    assert found == {("games", "games", 0): DOC["games"]["games"][0]}
+
+
+def test_stops_reading_after_the_last_requested_path():
+    # Everything after the first game is garbage: it must never be parsed.
+    text = '{"games": {"games": [{"gameId": 10}, not json at all'
+    assert extract_value(text, ("games", "games", 0, "gameId")) == 10
+    with pytest.raises(ValueError):
+        extract_value(text, ("games", "games", 1))
+
+
+def test_skipped_values_are_stepped_over_without_decoding():
+    text = (
+        '{"skip": {"s": "a \\" ] } [ {", "n": [1, -2.5e3, true, null, {"x": "\\\\"}]},'
+        ' "after": "} fake", "want": 7}'
+    )
+    assert extract_value(text, ("want",)) == 7
+    assert has_items(text, ("after",)) is False
+    with pytest.raises(ValueError):
+        extract_value('{"skip": {"s": "never closed}, "want": 7}', ("want",))
+    with pytest.raises(ValueError):
+        extract_value('{"skip": [1, 2, "want": 7', ("want",))
+
+
+def test_iter_array_and_has_items():
+    assert [game["gameId"] for game in iter_array(TEXT, ("games", "games"))] == [10, 11]
+    assert list(iter_array(TEXT, ("accountId",))) == []
+    assert list(iter_array("[]")) == []
+
+    assert has_items(TEXT, ("games", "games"))
+    assert not has_items(TEXT, ("games", "games", 1, "participants"))
+    assert not has_items('{"teams": []}', ("teams",))
+    assert not has_items("[1, 2]", ("teams",))
+
+
+def test_benchmark_cases_agree_with_full_parse():
+    from tools.bench_json_extract import run_benchmark, synthetic_payloads
+
+    rows = run_benchmark(synthetic_payloads(), repeat=1)
+
+    assert {row[0] for row in rows} == {
+        "match_history.json",
+        "eog_stats_block.json",
+        "champions_minimal.json",
+    }
@@ -0,0 +1,73 @@
+import pytest
+import requests
+
+from utils import lcu_cache
+from utils.lcu_cache import (
+    DISCONNECT,
+    cached_get,
+    get_lcu_cache_stats,
+    invalidate_lcu_cache,
+    notify_phase_change,
+)
+
+
+@pytest.fixture
+def lcu_calls(monkeypatch):
+    calls = []
+
+    def _lcu_get(path):
+        calls.append(path)
+        response = requests.Response()
+        response.status_code = 404 if "missing" in path else 200
+        response._content = b'{"summonerId": 7}'
+        return response
+
+    monkeypatch.setattr(lcu_cache, "lcu_get", _lcu_get)
+    lcu_cache.reset_lcu_cache()
+    yield calls
+    lcu_cache.reset_lcu_cache()
+
+
+def test_policy_endpoints_are_served_from_memory(lcu_calls):
+    for _ in range(3):
+        assert cached_get("/lol-summoner/v1/current-summoner").json()["summonerId"] == 7
+    cached_get("/lol-gameflow/v1/gameflow-phase")
+    cached_get("/lol-gameflow/v1/gameflow-phase")
+
+    assert lcu_calls.count("/lol-summoner/v1/current-summoner") == 1
+    assert lcu_calls.count("/lol-gameflow/v1/gameflow-phase") == 2
+    assert get_lcu_cache_stats()["hits"] == 2
+
+
+def test_events_only_drop_matching_policies(lcu_calls):
+    cached_get("/lol-summoner/v1/current-summoner")
+    cached_get("/lol-ranked/v1/current-ranked-stats")
+
+    notify_phase_change("EndOfGame")
+    cached_get("/lol-summoner/v1/current-summoner")
+    cached_get("/lol-ranked/v1/current-ranked-stats")
+    assert lcu_calls.count("/lol-summoner/v1/current-summoner") == 1
+    assert lcu_calls.count("/lol-ranked/v1/current-ranked-stats") == 2
+
+    invalidate_lcu_cache(DISCONNECT)
+    cached_get("/lol-summoner/v1/current-summoner")
+    assert lcu_calls.count("/lol-summoner/v1/current-summoner") == 2
+
+
+def test_expired_and_failed_responses_are_refetched(lcu_calls, monkeypatch):
+    monkeypatch.setitem(
+        lcu_cache.CACHE_POLICIES,
+        "/lol-summoner/v1/missing",
+        lcu_cache.CachePolicy(60),
+    )
+    monkeypatch.setitem(
+        lcu_cache.CACHE_POLICIES,
+        "/lol-summoner/v1/current-summoner",
+        lcu_cache.CachePolicy(0),
+    )
+    cached_get("/lol-summoner/v1/missing")
+    cached_get("/lol-summoner/v1/missing")
+    cached_get("/lol-summoner/v1/current-summoner")
+    cached_get("/lol-summoner/v1/current-summoner")
+
+    assert len(lcu_calls) == 4
@@ -0,0 +1,55 @@
+import requests
+
+import utils.lcu_connection as lcu
+
+
+class _Response:
+    status_code = 200
+
+
+def _fake_credentials(monkeypatch, port="2999", token="secret"):
+    monkeypatch.setattr(lcu, "get_lcu_credentials", lambda: (port, token))
+    lcu.reset_lcu_connection()
+
+
+def test_pooled_client_is_reused_until_reset(monkeypatch):
+    _fake_credentials(monkeypatch)
+    try:
+        client = lcu.get_lcu_client()
+        assert lcu.get_lcu_client() is client
+        assert client.auth.password == "secret"
+
+        lcu.reset_lcu_connection()
+        _fake_credentials(monkeypatch, port="3000", token="new")
+        rebuilt = lcu.get_lcu_client()
+
+        assert rebuilt is not client
+        assert rebuilt.auth.password == "new"
+        assert lcu.get_base_url() == "https://127.0.0.1:3000"
+    finally:
+        lcu.reset_lcu_connection()
+
+
+def test_requests_skip_certificate_checks_per_call(monkeypatch):
+    _fake_credentials(monkeypatch)
+    calls = []
+
+    def _request(self, method, url, **kwargs):
+        calls.append((self, method, url, kwargs))
+        return _Response()
+
+    monkeypatch.setattr(requests.Session, "request", _request)
+    try:
+        assert lcu.lcu_get("/lol-gameflow/v1/gameflow-phase").status_code == 200
+        lcu.lcu_post("/lol-matchmaking/v1/ready-check/accept")
+
+        sessions = {call[0] for call in calls}
+        assert sessions == {lcu.get_lcu_client()}
+        assert calls[0][1:3] == (
+            "GET",
+            "https://127.0.0.1:2999/lol-gameflow/v1/gameflow-phase",
+        )
+        # REQUESTS_CA_BUNDLE would override Session.verify, so it is per request.
+        assert all(call[3]["verify"] is False for call in calls)
+    finally:
+        lcu.reset_lcu_connection()
@@ -0,0 +1,59 @@
+import json
+
+import requests
+
+import utils.lcu_connection as lcu
+from utils import lcu_events
+from tools.lcu_ws_stand_in import LcuWebSocketStandIn
+
+
+def test_handle_message_dispatches_wamp_events():
+    received = []
+    lcu_events.subscribe("OnJsonApiEvent_test", received.append)
+    try:
+        since = lcu_events.get_event_count("OnJsonApiEvent_test")
+        lcu_events.handle_message(
+            json.dumps([8, "OnJsonApiEvent_test", {"data": {"state": "InProgress"}}])
+        )
+        lcu_events.handle_message(json.dumps([0, "session-id", 1, "RiotRemoting"]))
+        lcu_events.handle_message("not json")
+    finally:
+        lcu_events.unsubscribe("OnJsonApiEvent_test", received.append)
+
+    assert received == [{"data": {"state": "InProgress"}}]
+    assert lcu_events.wait_for_event("OnJsonApiEvent_test", 0, since=since)
+
+
+def test_wait_for_event_times_out_without_events():
+    assert not lcu_events.wait_for_event("OnJsonApiEvent_never_sent", 0.05)
+
+
+def test_listener_receives_events_from_stand_in(monkeypatch):
+    stand_in = LcuWebSocketStandIn(auth_token="secret").start()
+    monkeypatch.setattr(lcu, "_port", stand_in.port)
+    monkeypatch.setattr(lcu, "_token", "secret")
+    monkeypatch.setattr(lcu, "_base_url", stand_in.base_url)
+    monkeypatch.setattr(lcu, "_auth", requests.auth.HTTPBasicAuth("riot", "secret"))
+
+    received = []
+    lcu_events.subscribe(lcu_events.READY_CHECK_EVENT, received.append)
+    try:
+        lcu_events.start_event_listener()
+        assert stand_in.wait_for_subscription(lcu_events.READY_CHECK_EVENT, timeout=5)
+
+        since = lcu_events.get_event_count(lcu_events.READY_CHECK_EVENT)
+        stand_in.publish(
+            lcu_events.READY_CHECK_EVENT,
+            {"state": "InProgress"},
+            "/lol-matchmaking/v1/ready-check",
+        )
+        assert lcu_events.wait_for_event(
+            lcu_events.READY_CHECK_EVENT, timeout=5, since=since
+        )
+    finally:
+        lcu_events.unsubscribe(lcu_events.READY_CHECK_EVENT, received.append)
+        lcu_events.stop_event_listener()
+        stand_in.stop()
+
+    assert received[-1]["data"] == {"state": "InProgress"}
+    assert received[-1]["uri"] == "/lol-matchmaking/v1/ready-check"
@@ -0,0 +1,87 @@
+import pytest
+import requests
+
+from utils import lcu_connection
+from utils.lcu_connection import endpoint_template, lcu_get, lcu_patch
+from utils.metrics import (
+    format_histogram_report,
+    get_histogram_summary,
+    record_histogram,
+    reset_metrics,
+)
+
+
+class _FakeClient:
+    def __init__(self, status_code=200, error=None):
+        self.status_code = status_code
+        self.error = error
+
+    def request(self, method, url, **kwargs):
+        if self.error:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status_code
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics(monkeypatch):
+    monkeypatch.setattr(lcu_connection, "get_base_url", lambda: "http://lcu")
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def test_endpoint_template_groups_ids():
+    assert (
+        endpoint_template("/lol-champ-select/v1/session/actions/12")
+        == "/lol-champ-select/v1/session/actions/{id}"
+    )
+    assert (
+        endpoint_template("/lol-summoner/v2/summoners/puuid/0d4c2a3e-8b1f-4c6d-9e2a-1b3c4d5e6f70?x=1")
+        == "/lol-summoner/v2/summoners/puuid/{id}"
+    )
+    assert endpoint_template("/lol-gameflow/v1/gameflow-phase") == "/lol-gameflow/v1/gameflow-phase"
+    assert (
+        endpoint_template("/lol-chat/v1/conversations/a1b2c3%40champ-select.pvp.net/messages")
+        == "/lol-chat/v1/conversations/{id}/messages"
+    )
+
+
+def test_histogram_percentiles_come_from_buckets():
+    for value in [4] * 90 + [40] * 9 + [2500]:
+        record_histogram("h", value, error=value > 1000)
+
+    summary = get_histogram_summary("h")
+    assert summary["count"] == 100
+    assert summary["errors"] == 1
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (5, 50, 50)
+    assert summary["max"] == 2500
+    assert get_histogram_summary("missing") is None
+
+
+def test_lcu_requests_are_counted_per_endpoint(monkeypatch):
+    monkeypatch.setattr(lcu_connection, "get_lcu_client", lambda: _FakeClient(204))
+    lcu_patch("/lol-champ-select/v1/session/actions/3", json={})
+    lcu_patch("/lol-champ-select/v1/session/actions/4", json={})
+
+    monkeypatch.setattr(lcu_connection, "get_lcu_client", lambda: _FakeClient(404))
+    # Not in champ select: an answer, not an error.
+    lcu_get("/lol-champ-select/v1/session")
+    lcu_get("/lol-champions/v1/inventories/7/champions-minimal")
+
+    failing = _FakeClient(error=requests.exceptions.ConnectionError("down"))
+    monkeypatch.setattr(lcu_connection, "get_lcu_client", lambda: failing)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        lcu_get("/lol-champ-select/v1/session")
+
+    patches = get_histogram_summary("lcu PATCH /lol-champ-select/v1/session/actions/{id}")
+    assert (patches["count"], patches["errors"]) == (2, 0)
+    gets = get_histogram_summary("lcu GET /lol-champ-select/v1/session")
+    assert (gets["count"], gets["errors"]) == (2, 1)
+    inventory = get_histogram_summary("lcu GET /lol-champions/v1/inventories/{id}/champions-minimal")
+    assert (inventory["count"], inventory["errors"]) == (1, 1)
+
+    report = format_histogram_report("lcu ")
+    assert len(report) == 3
+    assert any(line.startswith("GET /lol-champ-select/v1/session: n=2 err=1") for line in report)
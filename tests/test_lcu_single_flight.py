@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from utils import lcu_connection
+from utils.lcu_connection import lcu_get, lcu_patch
+
+
+class _SlowClient:
+    """Answers after release is set and counts requests per path."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        if method == "GET":
+            self.release.wait(2)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'"ChampSelect"'
+        return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = _SlowClient()
+    monkeypatch.setattr(lcu_connection, "get_base_url", lambda: "http://lcu")
+    monkeypatch.setattr(lcu_connection, "get_lcu_client", lambda: client)
+    yield client
+    lcu_connection._flights.clear()
+
+
+def _get_concurrently(path, count):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(lcu_get(path).json()))
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_gets_share_one_request(client):
+    threads, results = _get_concurrently("/lol-champ-select/v1/session", 5)
+    time.sleep(0.1)
+    client.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(client.calls) == 1
+    assert results == ["ChampSelect"] * 5
+    # Not in a freshness window: the next GET goes to the client again.
+    lcu_get("/lol-champ-select/v1/session")
+    assert len(client.calls) == 2
+
+
+def test_freshness_window_and_writes(client, monkeypatch):
+    monkeypatch.setitem(
+        lcu_connection.SINGLE_FLIGHT_WINDOWS, "/lol-gameflow/v1/gameflow-phase", 60
+    )
+    client.release.set()
+
+    lcu_get("/lol-gameflow/v1/gameflow-phase")
+    lcu_get("/lol-gameflow/v1/gameflow-phase")
+    assert len(client.calls) == 1
+
+    lcu_patch("/lol-champ-select/v1/session/actions/1", json={})
+    lcu_get("/lol-gameflow/v1/gameflow-phase")
+    assert [method for method, _ in client.calls] == ["GET", "PATCH", "GET"]
+
+
+def test_followers_see_the_leaders_error(monkeypatch):
+    entered = threading.Event()
+
+    class _FailingClient:
+        def request(self, method, url, **kwargs):
+            entered.set()
+            time.sleep(0.1)
+            raise requests.exceptions.ConnectionError("down")
+
+    monkeypatch.setattr(lcu_connection, "get_base_url", lambda: "http://lcu")
+    monkeypatch.setattr(lcu_connection, "get_lcu_client", lambda: _FailingClient())
+    errors = []
+
+    def _get():
+        try:
+            lcu_get("/lol-gameflow/v1/gameflow-phase")
+        except requests.exceptions.ConnectionError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=_get)
+    leader.start()
+    entered.wait(1)
+    _get()
+    leader.join()
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+    assert not lcu_connection._flights
@@ -0,0 +1,81 @@
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+import utils.lcu_connection as lcu
+from features import accept_queue as accept_queue_module
+from features import execute_pick_ban
+from tools.lcu_stand_in import LcuStandIn, load_scenario, make_self_signed_cert
+
+_SCENARIO = os.path.join(
+    os.path.dirname(__file__), "..", "tools", "scenarios", "draft_mid.json"
+)
+
+
+@pytest.fixture
+def stand_in():
+    servers = []
+
+    def _start(**kwargs):
+        server = LcuStandIn(auth_token="secret", **kwargs).start()
+        servers.append(server)
+        lcu.set_lcu_endpoint(server.base_url, "secret")
+        return server
+
+    yield _start
+    for server in servers:
+        server.stop()
+    lcu.reset_lcu_connection()
+
+
+def test_accept_queue_against_scripted_queue_pop(stand_in, monkeypatch):
+    server = stand_in(scenario=load_scenario(_SCENARIO), speed=10)
+    monkeypatch.setattr(
+        accept_queue_module, "dismiss_lane_prompt_for_game_found", lambda: None
+    )
+    monkeypatch.setattr(
+        accept_queue_module,
+        "send_discord_champ_select_started_message",
+        lambda session: None,
+    )
+
+    worker = threading.Thread(target=accept_queue_module.accept_queue, daemon=True)
+    worker.start()
+    worker.join(10)
+
+    assert not worker.is_alive()
+    assert server.wait_for_request("POST", "/lol-matchmaking/v1/ready-check/accept")
+    assert server.get_state("gameflow_phase") == "ChampSelect"
+    assert lcu.get_session()["localPlayerCellId"] == 2
+
+
+def test_ban_patch_updates_the_session(stand_in):
+    server = stand_in(scenario=load_scenario(_SCENARIO), speed=100)
+    # Accept right away so the scenario moves on to champ select.
+    lcu.lcu_post("/lol-matchmaking/v1/ready-check/accept")
+
+    session = None
+    for _ in range(100):
+        session = lcu.get_session()
+        if session and session["timer"]["phase"] == "BAN_PICK":
+            break
+        time.sleep(0.05)
+    action = session["actions"][0][0]
+
+    assert execute_pick_ban.execute_ban(action, "Nami", 267)
+    assert server.wait_for_request("PATCH", "/lol-champ-select/v1/session/actions/1")
+    assert lcu.get_session()["actions"][0][0]["completed"]
+
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="needs openssl")
+def test_serves_https_like_the_client(stand_in, tmp_path):
+    certfile, keyfile = make_self_signed_cert(str(tmp_path))
+    stand_in(certfile=certfile, keyfile=keyfile)
+
+    response = lcu.lcu_get("/lol-gameflow/v1/gameflow-phase")
+
+    assert lcu.get_base_url().startswith("https://")
+    assert response.json() == "None"
@@ -0,0 +1,75 @@
+import pytest
+
+from utils import lock_in_scheduler
+from utils.config_validation import validate_config
+
+
+@pytest.fixture(autouse=True)
+def _reset_scheduler():
+    lock_in_scheduler.reset_lock_in_scheduler()
+    yield
+    lock_in_scheduler.reset_lock_in_scheduler()
+
+
+def test_clock_offset_uses_tightest_sample():
+    # Client clock runs 5s ahead; reads arrive 300ms and 50ms late (the first
+    # stamp is only a starting point).
+    lock_in_scheduler.observe_timer({"internalNowInEpochMs": 104_000}, received_at=90.0)
+    lock_in_scheduler.observe_timer({"internalNowInEpochMs": 105_000}, received_at=100.3)
+    lock_in_scheduler.observe_timer({"internalNowInEpochMs": 106_000}, received_at=101.05)
+    # The same stamp read again later must not lower the estimate.
+    lock_in_scheduler.observe_timer({"internalNowInEpochMs": 106_000}, received_at=103.0)
+
+    assert lock_in_scheduler.get_clock_offset() == pytest.approx(4.95)
+
+
+def test_lock_in_time_leaves_margin_and_round_trip():
+    timer = {"internalNowInEpochMs": 105_000, "adjustedTimeLeftInPhase": 30_000}
+    lock_in_scheduler.observe_timer({"internalNowInEpochMs": 104_000}, received_at=99.0)
+    lock_in_scheduler.observe_timer(timer, received_at=100.0)
+    lock_in_scheduler.record_patch_rtt(0.1)
+
+    # Read 200ms late: the offset from the earlier stamp gives the earlier deadline.
+    assert lock_in_scheduler.get_phase_deadline(timer, 100.2) == pytest.approx(130.0)
+    assert lock_in_scheduler.get_lock_in_time(timer, 1000, 100.2) == pytest.approx(128.8)
+
+
+def test_single_stale_stamp_is_not_trusted_as_offset():
+    # Started mid-draft: the only stamp was taken 8s before we saw it.
+    timer = {"internalNowInEpochMs": 92_000, "adjustedTimeLeftInPhase": 20_000}
+    lock_in_scheduler.observe_timer(timer, received_at=100.0)
+
+    assert lock_in_scheduler.get_clock_offset() is None
+    assert lock_in_scheduler.get_phase_deadline(timer, 100.0) == pytest.approx(120.0)
+    lock_in_at = lock_in_scheduler.get_lock_in_time(timer, received_at=100.0)
+    assert lock_in_at == pytest.approx(
+        116.0 - 2 * lock_in_scheduler.DEFAULT_PATCH_RTT_SECONDS
+    )
+
+
+def test_lock_in_time_without_client_stamp_uses_receipt_time():
+    timer = {"adjustedTimeLeftInPhase": 10_000}
+
+    lock_in_at = lock_in_scheduler.get_lock_in_time(timer, 1500, received_at=50.0)
+
+    expected = 58.5 - 2 * lock_in_scheduler.DEFAULT_PATCH_RTT_SECONDS
+    assert lock_in_at == pytest.approx(expected)
+    assert lock_in_scheduler.get_lock_in_time({}, 1500) is None
+
+
+def test_config_validation_checks_safety_margin():
+    config = {
+        "bans": {},
+        "picks": {"DEFAULT": {}, "RANDOM_MODE": {}},
+        "summs": {},
+        "random_mode_active": False,
+        "autoselect_runes": False,
+        "preferred_role": "MIDDLE",
+    }
+    assert validate_config(dict(config, lock_in_safety_margin_ms=1500))[0] == []
+
+    errors, _ = validate_config(dict(config, lock_in_safety_margin_ms=-1))
+    assert any("lock_in_safety_margin_ms" in error for error in errors)
+
+    errors, warnings = validate_config(dict(config, lock_in_safety_margin_ms=200))
+    assert errors == [] and len(warnings) == 1
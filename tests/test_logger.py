@@ -0,0 +1,78 @@
+import os
+import time
+
+import pytest
+
+from utils import logger as logger_module
+from utils.logger import Logger
+
+
+def _read(path):
+    if not os.path.exists(path):
+        return ""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _wait_for(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    loggers = []
+
+    def _make():
+        log = Logger(log_dir=str(tmp_path))
+        loggers.append(log)
+        return log
+
+    yield _make
+    for log in loggers:
+        log.stop_logging()
+
+
+def test_prints_are_batched_and_timestamped(make_logger, monkeypatch, capsys):
+    monkeypatch.setattr(logger_module, "LOG_FLUSH_INTERVAL_SECONDS", 60)
+    log = make_logger()
+
+    print("hello world", file=log)
+
+    # Nothing hits the disk on the calling thread, only once the batch is flushed.
+    assert _read(log.log_file) == ""
+    log.flush()
+    assert _wait_for(lambda: "hello world\n" in _read(log.log_file))
+    assert _read(log.log_file).startswith("[")
+    assert capsys.readouterr().out == "hello world\n"
+
+
+def test_flush_and_stop_write_pending_lines(make_logger, monkeypatch):
+    monkeypatch.setattr(logger_module, "LOG_FLUSH_INTERVAL_SECONDS", 60)
+    log = make_logger()
+
+    print("urgent", file=log)
+    log.flush()
+    assert _wait_for(lambda: "urgent" in _read(log.log_file))
+
+    print("last words", file=log)
+    log.stop_logging()
+    assert "last words" in _read(log.log_file)
+
+
+def test_log_file_rotates_at_size_limit(make_logger, monkeypatch):
+    monkeypatch.setattr(logger_module, "LOG_MAX_BYTES", 200)
+    monkeypatch.setattr(logger_module, "LOG_BACKUP_COUNT", 2)
+    log = make_logger()
+
+    for index in range(5):
+        print("x" * 200 + str(index), file=log)
+        log.flush()
+        assert _wait_for(lambda: str(index) in _read(f"{log.log_file}.1"))
+    log.stop_logging()
+
+    assert "x4" in _read(f"{log.log_file}.1")
+    assert "x3" in _read(f"{log.log_file}.2")
+    assert _read(log.log_file) == ""
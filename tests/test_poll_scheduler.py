@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from utils import LeagueClientDisconnected, poll_scheduler, shared_state
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    state = {"phase": "InProgress"}
+
+    def _get_gameflow_phase():
+        if state["phase"] == "down":
+            raise LeagueClientDisconnected()
+        return state["phase"]
+
+    monkeypatch.setattr(poll_scheduler, "get_gameflow_phase", _get_gameflow_phase)
+    monkeypatch.setattr(poll_scheduler, "_tasks", {})
+    monkeypatch.setattr(poll_scheduler, "_client_down", False)
+    monkeypatch.setattr(shared_state, "client_disconnected", False)
+    yield state
+    poll_scheduler.stop_poll_scheduler()
+
+
+def test_task_runs_with_phase_and_again_on_phase_change(scheduler):
+    seen = []
+    ran = threading.Event()
+
+    def _task(phase):
+        seen.append(phase)
+        ran.set()
+
+    poll_scheduler.register_task("test", _task, {"InProgress": 60})
+    poll_scheduler.start_poll_scheduler()
+    assert ran.wait(2)
+
+    ran.clear()
+    scheduler["phase"] = "EndOfGame"
+    poll_scheduler._wake_scheduler()
+    assert ran.wait(2)
+    assert seen == ["InProgress", "EndOfGame"]
+
+
+def test_tasks_are_suspended_while_client_is_down(scheduler):
+    scheduler["phase"] = "down"
+    calls = []
+    poll_scheduler.register_task("test", calls.append)
+
+    poll_scheduler.start_poll_scheduler()
+    deadline = time.monotonic() + 2
+    while not shared_state.client_disconnected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    poll_scheduler.stop_poll_scheduler()
+
+    assert shared_state.client_disconnected
+    assert calls == []
+    assert poll_scheduler.get_current_phase() is None
+
+
+def test_lobby_prompt_shows_again_after_client_restart(scheduler, monkeypatch):
+    from features import lobby_lane_prompt_watcher
+
+    prompts = []
+    monkeypatch.setattr(
+        lobby_lane_prompt_watcher,
+        "prompt_session_lane_selection",
+        lambda role: prompts.append(role),
+    )
+    monkeypatch.setattr(lobby_lane_prompt_watcher, "_was_in_lobby", False)
+    scheduler["phase"] = "Lobby"
+
+    lobby_lane_prompt_watcher.start_lobby_lane_prompt_watcher()
+    poll_scheduler.start_poll_scheduler()
+    deadline = time.monotonic() + 2
+    while not prompts and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(prompts) == 1
+
+    # Client closed while in the lobby, then back in a lobby after the restart.
+    scheduler["phase"] = "down"
+    poll_scheduler._wake_scheduler()
+    while not shared_state.client_disconnected and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not lobby_lane_prompt_watcher._was_in_lobby
+    scheduler["phase"] = "Lobby"
+    poll_scheduler._wake_scheduler()
+    deadline = time.monotonic() + 2
+    while len(prompts) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(prompts) == 2
+
+
+def test_draft_interval_is_short_only_when_we_must_act():
+    session = {
+        "localPlayerCellId": 2,
+        "actions": [[{"actorCellId": 2, "isInProgress": False}]],
+        "timer": {"phase": "BAN_PICK"},
+    }
+    assert (
+        poll_scheduler.get_draft_poll_interval(session)
+        == poll_scheduler.DRAFT_BAN_PICK_INTERVAL_SECONDS
+    )
+
+    session["actions"][0][0]["isInProgress"] = True
+    assert (
+        poll_scheduler.get_draft_poll_interval(session)
+        == poll_scheduler.DRAFT_ACTIVE_INTERVAL_SECONDS
+    )
+
+    session["actions"][0][0]["isInProgress"] = False
+    session["trades"] = [{"id": 1, "state": "RECEIVED"}]
+    assert (
+        poll_scheduler.get_draft_poll_interval(session)
+        == poll_scheduler.DRAFT_ACTIVE_INTERVAL_SECONDS
+    )
+    assert (
+        poll_scheduler.get_draft_poll_interval(None)
+        == poll_scheduler.DRAFT_IDLE_INTERVAL_SECONDS
+    )
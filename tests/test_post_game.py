@@ -0,0 +1,77 @@
+import json
+
+import requests
+
+import features.post_game.post_game_utils as post_game_utils
+from utils import shared_state
+
+GAME = {
+    "gameId": 42,
+    "gameDuration": 1800,
+    "gameMode": "CLASSIC",
+    "queueId": 420,
+    "participantIdentities": [
+        {"participantId": 1, "player": {"summonerId": 99}},
+        {"participantId": 2, "player": {"summonerId": 7}},
+    ],
+    "participants": [
+        {"participantId": 1, "stats": {"win": False}},
+        {"participantId": 2, "stats": {"win": True, "kills": 5, "deaths": 2, "assists": 3}},
+    ],
+}
+
+
+def _response(payload, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def test_one_latest_match_read_serves_summary_and_lp_change(monkeypatch):
+    paths = []
+
+    def _lcu_get(path):
+        paths.append(path)
+        return _response({"games": {"games": [GAME]}})
+
+    monkeypatch.setattr(post_game_utils, "lcu_get", _lcu_get)
+    monkeypatch.setattr(
+        post_game_utils, "cached_get", lambda path: _response({"summonerId": 7})
+    )
+    monkeypatch.setattr(
+        post_game_utils,
+        "get_rank_data",
+        lambda queue: {"tier": "GOLD", "division": "II", "lp": 40},
+    )
+    monkeypatch.setattr(post_game_utils, "get_game_data", lambda: {"queueType": "RANKED_SOLO_5x5"})
+    monkeypatch.setattr(shared_state, "pre_game_lp", {"division": "II", "lp": 20})
+
+    post_game = post_game_utils.fetch_post_game_data()
+    summary = post_game_utils.sanitize_last_game_data(post_game)
+    rank_changes = post_game_utils.get_rank_changes(post_game)
+
+    assert paths == [post_game_utils.LATEST_MATCH_PATH]
+    assert "begIndex=0&endIndex=1" in paths[0]
+    assert summary["win_loss"] == {"won": True, "result": "Victory"}
+    assert summary["kda"]["kda_ratio"] == 4.0
+    assert summary["game_id"] == 42
+    assert rank_changes["lp_change"] == 20
+
+
+def test_failed_match_history_request_reports_status(monkeypatch):
+    monkeypatch.setattr(
+        post_game_utils,
+        "lcu_get",
+        lambda path: _response({"message": "not ready"}, status_code=503),
+    )
+    monkeypatch.setattr(
+        post_game_utils, "cached_get", lambda path: _response({"summonerId": 7})
+    )
+
+    post_game = post_game_utils.fetch_post_game_data()
+    summary = post_game_utils.sanitize_last_game_data(post_game)
+
+    assert post_game.participant_id is None
+    assert summary["error"].startswith("Match history request failed: 503 - ")
+    assert "not ready" in summary["error"]
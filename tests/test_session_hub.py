@@ -0,0 +1,53 @@
+import pytest
+
+from utils import LeagueClientDisconnected, get_session, session_hub
+
+
+@pytest.fixture
+def fake_lcu(monkeypatch):
+    state = {"session": {"localPlayerCellId": 0, "timer": {"phase": "BAN_PICK"}}}
+    calls = []
+
+    def _fetch_session():
+        calls.append(1)
+        if state["session"] == "disconnected":
+            raise LeagueClientDisconnected()
+        return state["session"]
+
+    monkeypatch.setattr(session_hub, "fetch_session", _fetch_session)
+    yield state, calls
+    session_hub.stop_session_hub()
+
+
+def test_workers_share_one_snapshot(fake_lcu):
+    state, calls = fake_lcu
+    session_hub.start_session_hub(interval=60)
+
+    sessions = [get_session() for _ in range(5)]
+
+    assert len(calls) == 1
+    assert all(s is sessions[0] for s in sessions)
+    assert session_hub.get_snapshot().version == 1
+
+
+def test_version_only_moves_when_session_changes(fake_lcu):
+    state, calls = fake_lcu
+    session_hub.start_session_hub(interval=60)
+
+    same = session_hub.get_fresh_snapshot(timeout=2)
+    assert same.version == 1
+    assert len(calls) == 2
+
+    state["session"] = {"localPlayerCellId": 0, "timer": {"phase": "FINALIZATION"}}
+    assert get_session(fresh=True)["timer"]["phase"] == "FINALIZATION"
+    assert session_hub.get_session_version() == 2
+    assert session_hub.wait_for_session_update(1, timeout=0)
+
+
+def test_disconnect_is_raised_to_consumers(fake_lcu):
+    state, _ = fake_lcu
+    session_hub.start_session_hub(interval=60)
+    state["session"] = "disconnected"
+
+    with pytest.raises(LeagueClientDisconnected):
+        get_session(fresh=True)
@@ -0,0 +1,59 @@
+import gzip
+import json
+import time
+
+import pytest
+
+from utils import fetch_session, get_session, session_hub
+from utils import lcu_connection
+from utils.session_trace import (
+    SessionTraceRecorder,
+    SessionTraceReplayer,
+    load_trace,
+)
+
+BAN = {"localPlayerCellId": 0, "timer": {"phase": "BAN_PICK"}}
+FINAL = {"localPlayerCellId": 0, "timer": {"phase": "FINALIZATION"}}
+
+
+@pytest.fixture(autouse=True)
+def _unhook():
+    yield
+    session_hub.stop_session_hub()
+    lcu_connection.set_session_fetcher(None)
+    lcu_connection.set_session_recorder(None)
+
+
+def test_recorder_writes_compact_trace(tmp_path):
+    sessions = iter([BAN, BAN, FINAL, None])
+    lcu_connection.set_session_fetcher(lambda: next(sessions))
+    path = tmp_path / "trace.jsonl.gz"
+
+    recorder = SessionTraceRecorder(str(path)).start()
+    for _ in range(4):
+        fetch_session()
+    recorder.stop()
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[0]["trace"] == "champ_select_session"
+    # The repeated BAN_PICK read only stores its timestamp.
+    assert ["session" in line for line in lines[1:]] == [True, False, True, True]
+    assert [session for _, session in load_trace(path)] == [BAN, BAN, FINAL, None]
+
+
+def test_replay_serves_trace_through_get_session_at_speed(tmp_path):
+    entries = [(1000.0, BAN), (1002.0, FINAL), (1004.0, None)]
+    replayer = SessionTraceReplayer(entries, speed=20.0)
+    assert replayer.duration == pytest.approx(0.2)
+
+    replayer.start()
+    assert get_session() == BAN
+    time.sleep(0.12)
+    assert get_session() == FINAL
+
+    # Through the hub as well, as the draft workers would read it.
+    session_hub.start_session_hub(interval=0.02)
+    time.sleep(0.15)
+    assert replayer.is_finished()
+    assert get_session(fresh=True) is None
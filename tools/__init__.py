@@ -0,0 +1,4 @@
+"""
+Local development tools: stand-ins for the League client and Discord so features
+can be exercised without a running game client.
+"""
@@ -0,0 +1,289 @@
+"""
+Benchmark utils.json_extract against a full response.json() parse.
+
+Runs the three post-game / inventory reads on recorded LCU payloads and prints
+the mean parse time and the tracemalloc peak of both ways:
+
+    match_history.json      latest game fields (fetch_last_game_data)
+    eog_stats_block.json    "are teams filled" check (_eog_stats_block_available)
+    champions_minimal.json  owned champion ids (get_owned_champion_ids); every
+                            entry is needed there, so it keeps response.json()
+
+Usage:
+    python -m tools.bench_json_extract --record payloads/   # save from a running client
+    python -m tools.bench_json_extract --payload-dir payloads/
+    python -m tools.bench_json_extract                      # synthetic payloads
+
+Without --payload-dir, payloads shaped like the LCU responses (full 20-game
+match-history page, 10-player eog block, 170-champion inventory) are generated.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import tracemalloc
+
+from features.post_game.post_game_utils import LATEST_MATCH_FIELDS
+from utils.json_extract import extract, has_items, iter_array
+
+PAYLOAD_ENDPOINTS = {
+    "match_history.json": "/lol-match-history/v1/products/lol/current-summoner/matches",
+    "eog_stats_block.json": "/lol-end-of-game/v1/eog-stats-block",
+    "champions_minimal.json": "/lol-champions/v1/inventories/{summoner_id}/champions-minimal",
+}
+
+
+def _player_stats(rng, count):
+    return {f"STAT_{index}": rng.randint(0, 50_000) for index in range(count)}
+
+
+def _synthetic_match_history(rng, games=20):
+    def participant(index):
+        stats = _player_stats(rng, 110)
+        stats.update(win=index < 5, kills=rng.randint(0, 15), deaths=rng.randint(0, 15))
+        return {
+            "participantId": index + 1,
+            "championId": rng.randint(1, 950),
+            "spell1Id": 4,
+            "spell2Id": 14,
+            "stats": stats,
+            "teamId": 100 if index < 5 else 200,
+            "timeline": {
+                "lane": "MIDDLE",
+                "role": "SOLO",
+                "creepsPerMinDeltas": {"0-10": 7.1, "10-20": 8.3},
+                "xpPerMinDeltas": {"0-10": 410.5, "10-20": 520.2},
+            },
+        }
+
+    def game(game_index):
+        return {
+            "gameCreation": 1_700_000_000_000 - game_index,
+            "gameCreationDate": "2024-01-01T00:00:00.000Z",
+            "gameDuration": rng.randint(900, 2400),
+            "gameId": 7_000_000_000 - game_index,
+            "gameMode": "CLASSIC",
+            "gameType": "MATCHED_GAME",
+            "gameVersion": "14.1.555.5555",
+            "mapId": 11,
+            "participantIdentities": [
+                {
+                    "participantId": index + 1,
+                    "player": {
+                        "summonerId": 1000 + index,
+                        "summonerName": f"Player{index}",
+                        "puuid": f"{index:02d}" * 39,
+                        "platformId": "EUW1",
+                        "profileIcon": rng.randint(1, 6000),
+                    },
+                }
+                for index in range(10)
+            ],
+            "participants": [participant(index) for index in range(10)],
+            "platformId": "EUW1",
+            "queueId": 420,
+            "seasonId": 14,
+            "teams": [
+                {
+                    "teamId": team_id,
+                    "win": "Win" if team_id == 100 else "Fail",
+                    "bans": [{"championId": rng.randint(1, 950), "pickTurn": turn} for turn in range(5)],
+                    "baronKills": 1,
+                    "dragonKills": 3,
+                    "towerKills": 8,
+                }
+                for team_id in (100, 200)
+            ],
+        }
+
+    return {
+        "accountId": 1,
+        "platformId": "EUW1",
+        "games": {
+            "gameCount": games,
+            "gameIndexBegin": 0,
+            "gameIndexEnd": games - 1,
+            "games": [game(index) for index in range(games)],
+        },
+    }
+
+
+def _synthetic_eog_stats_block(rng):
+    return {
+        "basePoints": 0,
+        "gameId": 7_000_000_000,
+        "gameLength": 1800,
+        "localPlayer": {"championId": 103, "stats": _player_stats(rng, 120)},
+        "teams": [
+            {
+                "teamId": team_id,
+                "isWinningTeam": team_id == 100,
+                "players": [
+                    {
+                        "championId": rng.randint(1, 950),
+                        "summonerName": f"Player{index}",
+                        "items": [rng.randint(1000, 7000) for _ in range(7)],
+                        "stats": _player_stats(rng, 120),
+                    }
+                    for index in range(5)
+                ],
+                "stats": _player_stats(rng, 40),
+            }
+            for team_id in (100, 200)
+        ],
+    }
+
+
+def _synthetic_champions_minimal(rng, count=170):
+    return [
+        {
+            "id": champion_id,
+            "name": f"Champion{champion_id}",
+            "alias": f"Champion{champion_id}",
+            "title": "the Benchmark",
+            "squarePortraitPath": f"/lol-game-data/assets/v1/champion-icons/{champion_id}.png",
+            "roles": ["mage", "support"],
+            "active": True,
+            "botEnabled": False,
+            "freeToPlay": rng.random() < 0.1,
+            "ownership": {
+                "owned": rng.random() < 0.7,
+                "rental": {"endDate": 0, "purchaseDate": 0, "rented": False, "winCountRemaining": 0},
+            },
+            "disabledQueues": [],
+            "purchased": 1_600_000_000_000,
+        }
+        for champion_id in range(1, count + 1)
+    ]
+
+
+def synthetic_payloads(seed=7):
+    rng = random.Random(seed)
+    return {
+        "match_history.json": json.dumps(_synthetic_match_history(rng)),
+        "eog_stats_block.json": json.dumps(_synthetic_eog_stats_block(rng)),
+        "champions_minimal.json": json.dumps(_synthetic_champions_minimal(rng)),
+    }
+
+
+def load_payloads(directory):
+    payloads = {}
+    for name in PAYLOAD_ENDPOINTS:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                payloads[name] = f.read()
+    return payloads
+
+
+def record_payloads(directory):
+    """Save the raw responses of a running client for later benchmarks."""
+    from utils import get_current_summoner_id, lcu_get
+
+    os.makedirs(directory, exist_ok=True)
+    summoner_id = get_current_summoner_id()
+    for name, path in PAYLOAD_ENDPOINTS.items():
+        response = lcu_get(path.format(summoner_id=summoner_id))
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(response.content)
+        print(f"💾 {name}: {response.status_code}, {len(response.content)} bytes")
+
+
+def _full_latest_game(text):
+    game = json.loads(text)["games"]["games"][0]
+    return {field: game[field] for field in LATEST_MATCH_FIELDS}
+
+
+def _extract_latest_game(text):
+    found = extract(text, [("games", "games", 0, field) for field in LATEST_MATCH_FIELDS])
+    return {path[-1]: value for path, value in found.items()}
+
+
+def _full_teams_filled(text):
+    data = json.loads(text)
+    return isinstance(data, dict) and bool(data.get("teams"))
+
+
+def _extract_teams_filled(text):
+    return has_items(text, ("teams",))
+
+
+def _owned_ids(champions):
+    return {
+        champion.get("id")
+        for champion in champions
+        if (champion.get("ownership") or {}).get("owned")
+    }
+
+
+def _full_owned_ids(text):
+    return _owned_ids(json.loads(text) or [])
+
+
+def _extract_owned_ids(text):
+    return _owned_ids(iter_array(text))
+
+
+CASES = {
+    "match_history.json": ("latest game", _full_latest_game, _extract_latest_game),
+    "eog_stats_block.json": ("teams filled", _full_teams_filled, _extract_teams_filled),
+    "champions_minimal.json": ("owned ids", _full_owned_ids, _extract_owned_ids),
+}
+
+
+def _measure(func, text, repeat):
+    func(text)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    mean_ms = (time.perf_counter() - started) / repeat * 1000
+    tracemalloc.start()
+    func(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return mean_ms, peak
+
+
+def run_benchmark(payloads, repeat=50):
+    """Return rows of (payload, case, size, full_ms, extract_ms, full_peak, extract_peak)."""
+    rows = []
+    for name, text in payloads.items():
+        label, full, lazy = CASES[name]
+        if full(text) != lazy(text):
+            raise AssertionError(f"{name}: extraction differs from full parse")
+        full_ms, full_peak = _measure(full, text, repeat)
+        lazy_ms, lazy_peak = _measure(lazy, text, repeat)
+        rows.append((name, label, len(text), full_ms, lazy_ms, full_peak, lazy_peak))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming JSON extraction")
+    parser.add_argument("--payload-dir", help="directory with recorded payloads")
+    parser.add_argument("--record", metavar="DIR", help="record payloads from the client")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.record:
+        record_payloads(args.record)
+        return
+    payloads = load_payloads(args.payload_dir) if args.payload_dir else synthetic_payloads()
+    if not payloads:
+        print("No payloads found.")
+        return
+
+    print(f"{'payload':<24}{'read':<14}{'size':>9}  {'full':>16}  {'extract':>16}")
+    for name, label, size, full_ms, lazy_ms, full_peak, lazy_peak in run_benchmark(
+        payloads, args.repeat
+    ):
+        print(
+            f"{name:<24}{label:<14}{size // 1024:>7}KB  "
+            f"{full_ms:>7.2f}ms {full_peak // 1024:>5}KB  "
+            f"{lazy_ms:>7.2f}ms {lazy_peak // 1024:>5}KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Local stand-in for Discord webhooks.
+
+Accepts POST /api/webhooks/<id>/<token>, records the JSON body and answers 204
+with X-RateLimit-* headers. Each webhook path is its own bucket of rate_limit
+messages per window seconds; going over answers 429 with retry_after like
+Discord. fail_next() scripts error answers and delay slows every answer down,
+so the dispatcher's retries and rate limiting can be tested without Discord.
+
+Usage:
+    python -m tools.discord_stand_in --rate-limit 5 --window 2
+
+Point the bot at it with DISCORD_WEBHOOK_URL=http://127.0.0.1:<port>/api/webhooks/1/main
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+WEBHOOK_PATH_PREFIX = "/api/webhooks/"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        path = urlsplit(self.path).path
+        if not path.startswith(WEBHOOK_PATH_PREFIX):
+            self._respond(404, {"message": "Unknown Webhook", "code": 10015}, {})
+            return
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            self._respond(400, {"message": "Cannot send an empty message"}, {})
+            return
+        status, payload, headers = self.server.stand_in.handle_post(path, body)
+        self._respond(status, payload, headers)
+
+    def _respond(self, status, payload, headers):
+        data = b"" if status == 204 else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class DiscordWebhookStandIn:
+    """
+    In-process Discord webhook stand-in.
+
+    messages holds {"path", "content", "at"} for every accepted post; requests
+    counts every post including rejected ones.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, rate_limit=5, window=2.0, delay=0.0):
+        self.rate_limit = rate_limit
+        self.window = window
+        self.delay = delay
+        self.messages = []
+        self.requests = 0
+        self._failures = []
+        self._windows = {}
+        self._condition = threading.Condition()
+        self._server = _Server((host, port), _Handler)
+        self._server.stand_in = self
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def webhook_url(self, name="main"):
+        return f"{self.base_url}{WEBHOOK_PATH_PREFIX}1/{name}"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def fail_next(self, status, count=1, retry_after=0.1, is_global=False):
+        """Answer the next count posts with status (429 carries retry_after)."""
+        with self._condition:
+            self._failures.extend([(status, retry_after, is_global)] * count)
+
+    def wait_for_messages(self, count, timeout=5):
+        """Block until count messages were accepted; returns them."""
+        with self._condition:
+            self._condition.wait_for(lambda: len(self.messages) >= count, timeout)
+            return list(self.messages)
+
+    def handle_post(self, path, body):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._condition:
+            self.requests += 1
+            now = time.monotonic()
+            if self._failures:
+                status, retry_after, is_global = self._failures.pop(0)
+                if status == 429:
+                    return self._rate_limited(retry_after, is_global, {})
+                return status, {"message": "Stand-in failure", "code": 0}, {}
+
+            started, used = self._windows.get(path, (now, 0))
+            if now - started >= self.window:
+                started, used = now, 0
+            reset_after = max(self.window - (now - started), 0.0)
+            if used >= self.rate_limit:
+                headers = self._bucket_headers(path, 0, reset_after)
+                return self._rate_limited(reset_after, False, headers)
+            used += 1
+            self._windows[path] = (started, used)
+            self.messages.append(
+                {"path": path, "content": (body or {}).get("content"), "at": now}
+            )
+            self._condition.notify_all()
+            headers = self._bucket_headers(path, self.rate_limit - used, reset_after)
+            return 204, None, headers
+
+    def _bucket_headers(self, path, remaining, reset_after):
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Bucket": f"bucket{path}",
+        }
+
+    def _rate_limited(self, retry_after, is_global, headers):
+        headers = dict(headers)
+        if is_global:
+            headers["X-RateLimit-Global"] = "true"
+        headers["Retry-After"] = f"{retry_after:.3f}"
+        payload = {
+            "message": "You are being rate limited.",
+            "retry_after": retry_after,
+            "global": is_global,
+        }
+        return 429, payload, headers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Discord webhook stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2999)
+    parser.add_argument("--rate-limit", type=int, default=5, help="messages per window")
+    parser.add_argument("--window", type=float, default=2.0, help="window in seconds")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds per answer")
+    args = parser.parse_args()
+
+    stand_in = DiscordWebhookStandIn(
+        args.host, args.port, args.rate_limit, args.window, args.delay
+    ).start()
+    print(f"🔌 Discord webhook stand-in listening on {stand_in.base_url}")
+    print(f"   DISCORD_WEBHOOK_URL={stand_in.webhook_url()}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.stop()
+        for message in stand_in.messages:
+            print(f"{message['path']}: {message['content']}")
+
+
+if __name__ == "__main__":
+    main()
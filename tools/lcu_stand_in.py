@@ -0,0 +1,559 @@
+"""
+Local stand-in for the LCU REST API, driven by scripted scenarios.
+
+Serves the endpoints the bot uses (gameflow phase, ready-check, champ-select
+session and its action/selection/swap writes, summoner, owned champions, ranked
+stats, match history, end-of-game stats, runes and chat) from in-memory state.
+A scenario file moves that state along a timeline, e.g. queue pop -> champ select
+-> our pick turn, so features can be run end to end without a League client.
+Every request is recorded for assertions and latency measurements.
+
+Usage:
+    python -m tools.lcu_stand_in --scenario tools/scenarios/draft_mid.json --tls
+
+Point the bot at it with LCU_BASE_URL / LCU_AUTH_TOKEN (see README), or in
+process with utils.lcu_connection.set_lcu_endpoint(stand_in.base_url, token).
+
+Scenario format (JSON):
+    {
+      "name": "...",
+      "initial": {<state keys>},
+      "steps": [
+        {"at": 1.5, "gameflow_phase": "ReadyCheck", "ready_check": {...}},
+        {"after_request": {"method": "PATCH",
+                           "path": "/lol-champ-select/v1/session/actions/12",
+                           "body": {"completed": true}},
+         "session_update": {...}, "timer": {"phase": "FINALIZATION", "time_left_ms": 30000}}
+      ]
+    }
+
+State keys: gameflow_phase, ready_check, session, current_summoner,
+owned_champion_ids, ranked_stats, match_history, eog_stats_block. A step may set
+any of them, merge top-level session keys with "session_update" and restart the
+champ-select timer with "timer". "at" is seconds from scenario start;
+"after_request" holds the step until a matching request was received: either
+"METHOD /path" (a trailing * matches a path prefix) or {"method", "path",
+"body"} where body must be a subset of the request body. A value of null
+removes the resource (the endpoint answers 404).
+"""
+
+import argparse
+import base64
+import copy
+import json
+import os
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+GAMEFLOW_EVENT = "OnJsonApiEvent_lol-gameflow_v1_gameflow-phase"
+READY_CHECK_EVENT = "OnJsonApiEvent_lol-matchmaking_v1_ready-check"
+SESSION_EVENT = "OnJsonApiEvent_lol-champ-select_v1_session"
+
+_ACTION_PATH = re.compile(r"^/lol-champ-select/v1/session/actions/(\d+)$")
+_SWAP_PATH = re.compile(
+    r"^/lol-champ-select/v1/session/(position-swaps|pick-order-swaps|trades)"
+    r"/(\d+)/(request|decline|accept)$"
+)
+_INVENTORY_PATH = re.compile(
+    r"^/lol-champions/v1/inventories/(\d+)/champions-minimal$"
+)
+_CHAT_PATH = re.compile(r"^/lol-chat/v1/conversations/([^/]+)/messages$")
+
+DEFAULT_STATE = {
+    "gameflow_phase": "None",
+    "ready_check": None,
+    "session": None,
+    "current_summoner": {
+        "summonerId": 1,
+        "gameName": "StandIn",
+        "tagLine": "EUW",
+        "displayName": "StandIn",
+    },
+    "owned_champion_ids": [],
+    "ranked_stats": {"queueMap": {}},
+    "match_history": {"games": {"games": []}},
+    "eog_stats_block": None,
+}
+
+
+def _not_found(path):
+    return 404, {
+        "errorCode": "RPC_ERROR",
+        "httpStatus": 404,
+        "message": f"No resource at {path}",
+    }
+
+
+def _request_matches(request, trigger):
+    if isinstance(trigger, str):
+        method, _, path = trigger.partition(" ")
+        trigger = {"method": method, "path": path}
+    if request["method"] != trigger.get("method", request["method"]):
+        return False
+    path = trigger.get("path", "")
+    if path.endswith("*"):
+        if not request["path"].startswith(path[:-1]):
+            return False
+    elif request["path"] != path:
+        return False
+    body = request["body"] if isinstance(request["body"], dict) else {}
+    return all(body.get(k) == v for k, v in (trigger.get("body") or {}).items())
+
+
+def load_scenario(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_self_signed_cert(directory):
+    """Write a throwaway localhost cert/key pair with the openssl CLI; returns paths."""
+    if shutil.which("openssl") is None:
+        raise RuntimeError("openssl is required to generate a certificate for --tls")
+    certfile = os.path.join(directory, "stand_in_cert.pem")
+    keyfile = os.path.join(directory, "stand_in_key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-keyout",
+            keyfile,
+            "-out",
+            certfile,
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        stand_in = self.server.stand_in
+        authorization = self.headers.get("Authorization")
+        if stand_in.expected_auth and authorization != stand_in.expected_auth:
+            self._respond(401, {"errorCode": "UNAUTHORIZED", "httpStatus": 401})
+            return
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            self._respond(400, {"errorCode": "BAD_REQUEST", "httpStatus": 400})
+            return
+        path = urlsplit(self.path).path
+        status, payload = stand_in.handle_request(method, path, body)
+        self._respond(status, payload)
+
+    def _respond(self, status, payload):
+        data = b"" if status == 204 else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LcuStandIn:
+    """
+    In-process LCU REST stand-in.
+
+    events: optional tools.lcu_ws_stand_in.LcuWebSocketStandIn that gets the
+    gameflow, ready-check and session changes published as WAMP events.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        auth_token="stand-in",
+        scenario=None,
+        certfile=None,
+        keyfile=None,
+        speed=1.0,
+        events=None,
+    ):
+        self.auth_token = auth_token
+        self.expected_auth = None
+        if auth_token:
+            credentials = base64.b64encode(f"riot:{auth_token}".encode()).decode()
+            self.expected_auth = f"Basic {credentials}"
+        self.scenario = scenario or {"steps": []}
+        self.speed = speed
+        self.events = events
+        self.requests = []
+        self._condition = threading.Condition()
+        self._state = copy.deepcopy(DEFAULT_STATE)
+        self._apply(copy.deepcopy(self.scenario.get("initial") or {}))
+        self._stop = threading.Event()
+        self._server = _Server((host, port), _Handler)
+        self._server.stand_in = self
+        self._scheme = "http"
+        if certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+            self._server.socket = context.wrap_socket(
+                self._server.socket, server_side=True
+            )
+            self._scheme = "https"
+        self._threads = []
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def base_url(self):
+        return f"{self._scheme}://127.0.0.1:{self.port}"
+
+    def start(self):
+        """Serve requests and play the scenario in background threads."""
+        for target in (self._server.serve_forever, self._play_scenario):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        self._server.shutdown()
+        self._server.server_close()
+
+    # -- state -----------------------------------------------------------------
+
+    def get_state(self, key):
+        with self._condition:
+            return copy.deepcopy(self._state.get(key))
+
+    def set_state(self, **values):
+        """Change state directly (same keys as a scenario step)."""
+        with self._condition:
+            self._apply(values)
+            self._condition.notify_all()
+
+    def wait_for_request(self, method, path_prefix, timeout=5, since=0):
+        """Block until a matching request (index >= since) was received; returns it."""
+        with self._condition:
+            found = self._condition.wait_for(
+                lambda: self._find_request(method, path_prefix, since), timeout
+            )
+            return found or None
+
+    def _find_request(self, method, path_prefix, since=0):
+        for request in self.requests[since:]:
+            if request["method"] == method and request["path"].startswith(path_prefix):
+                return request
+        return None
+
+    def _stamp_timer(self, timer):
+        time_left_ms = int(timer.get("time_left_ms", 30000) / self.speed)
+        return {
+            "phase": timer.get("phase", "BAN_PICK"),
+            "adjustedTimeLeftInPhase": time_left_ms,
+            "totalTimeInPhase": time_left_ms,
+            "internalNowInEpochMs": int(time.time() * 1000),
+            "isInfinite": False,
+        }
+
+    def _apply(self, step):
+        """Apply one scenario step to the state. Caller holds the condition."""
+        changed = set()
+        for key in DEFAULT_STATE:
+            if key in step:
+                self._state[key] = copy.deepcopy(step[key])
+                changed.add(key)
+        if step.get("session_update"):
+            session = self._state.get("session") or {}
+            session.update(copy.deepcopy(step["session_update"]))
+            self._state["session"] = session
+            changed.add("session")
+        if step.get("timer") and self._state.get("session") is not None:
+            self._state["session"]["timer"] = self._stamp_timer(step["timer"])
+            changed.add("session")
+        self._publish(changed)
+
+    def _publish(self, changed):
+        if self.events is None:
+            return
+        topics = {
+            "gameflow_phase": (GAMEFLOW_EVENT, "/lol-gameflow/v1/gameflow-phase"),
+            "ready_check": (READY_CHECK_EVENT, "/lol-matchmaking/v1/ready-check"),
+            "session": (SESSION_EVENT, "/lol-champ-select/v1/session"),
+        }
+        for key in changed & set(topics):
+            event_name, uri = topics[key]
+            data = self._state.get(key)
+            self.events.publish(
+                event_name,
+                copy.deepcopy(data),
+                uri,
+                "Delete" if data is None else "Update",
+            )
+
+    def _play_scenario(self):
+        started = time.monotonic()
+        request_cursor = 0
+        for step in self.scenario.get("steps", []):
+            delay = started + step.get("at", 0) / self.speed - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                return
+            trigger = step.get("after_request")
+            if trigger:
+                with self._condition:
+                    while not self._stop.is_set():
+                        match = next(
+                            (
+                                index
+                                for index in range(request_cursor, len(self.requests))
+                                if _request_matches(self.requests[index], trigger)
+                            ),
+                            None,
+                        )
+                        if match is not None:
+                            request_cursor = match + 1
+                            break
+                        self._condition.wait(0.5)
+                if self._stop.is_set():
+                    return
+            with self._condition:
+                self._apply(step)
+                self._condition.notify_all()
+
+    # -- requests --------------------------------------------------------------
+
+    def handle_request(self, method, path, body):
+        with self._condition:
+            self.requests.append(
+                {"method": method, "path": path, "body": body, "at": time.time()}
+            )
+            try:
+                return self._route(method, path, body)
+            finally:
+                self._condition.notify_all()
+
+    def _local_player(self):
+        session = self._state.get("session") or {}
+        cell_id = session.get("localPlayerCellId")
+        return next(
+            (p for p in session.get("myTeam", []) if p.get("cellId") == cell_id), None
+        )
+
+    def _route(self, method, path, body):
+        state = self._state
+        if path == "/lol-gameflow/v1/gameflow-phase" and method == "GET":
+            return 200, state["gameflow_phase"]
+
+        if path == "/lol-matchmaking/v1/ready-check":
+            if state["ready_check"] is None:
+                return _not_found(path)
+            return 200, state["ready_check"]
+        if path.startswith("/lol-matchmaking/v1/ready-check/") and method == "POST":
+            if state["ready_check"] is None:
+                return _not_found(path)
+            response = "Accepted" if path.endswith("/accept") else "Declined"
+            state["ready_check"]["playerResponse"] = response
+            self._publish({"ready_check"})
+            return 204, None
+
+        session = state["session"]
+        if path.startswith("/lol-champ-select/") and session is None:
+            return _not_found(path)
+        if path == "/lol-champ-select/v1/session" and method == "GET":
+            return 200, session
+        if path == "/lol-champ-select/v1/session/my-selection":
+            player = self._local_player()
+            if player is None:
+                return _not_found(path)
+            if method == "GET":
+                return 200, player
+            selection = dict(body or {})
+            if "intentChampionId" in selection:
+                selection["championPickIntent"] = selection.pop("intentChampionId")
+            player.update(selection)
+            self._publish({"session"})
+            return 204, None
+        action_match = _ACTION_PATH.match(path)
+        if action_match and method == "PATCH":
+            return self._patch_action(int(action_match.group(1)), body or {})
+        if path == "/lol-champ-select/v1/current-champion":
+            player = self._local_player() or {}
+            return 200, self._locked_champion_id(player.get("cellId"))
+        if path in (
+            "/lol-champ-select/v1/ongoing-pick-order-swap",
+            "/lol-champ-select/v1/ongoing-position-swap",
+            "/lol-champ-select/v1/ongoing-trade",
+        ):
+            key = {
+                "/lol-champ-select/v1/ongoing-pick-order-swap": "pickOrderSwaps",
+                "/lol-champ-select/v1/ongoing-position-swap": "positionSwaps",
+                "/lol-champ-select/v1/ongoing-trade": "trades",
+            }[path]
+            ongoing = [
+                s for s in session.get(key, []) if s.get("state") in ("SENT", "RECEIVED")
+            ]
+            return (200, ongoing[0]) if ongoing else _not_found(path)
+        swap_match = _SWAP_PATH.match(path)
+        if swap_match and method == "POST":
+            return self._update_swap(*swap_match.groups())
+
+        if path == "/lol-summoner/v1/current-summoner":
+            return 200, state["current_summoner"]
+        if _INVENTORY_PATH.match(path):
+            return 200, [
+                {"id": champion_id, "ownership": {"owned": True}}
+                for champion_id in state["owned_champion_ids"]
+            ]
+        if path == "/lol-ranked/v1/current-ranked-stats":
+            return 200, state["ranked_stats"]
+        if path.startswith("/lol-match-history/v1/products/lol/current-summoner/matches"):
+            return 200, state["match_history"]
+        if path == "/lol-end-of-game/v1/eog-stats-block":
+            if state["eog_stats_block"] is None:
+                return _not_found(path)
+            return 200, state["eog_stats_block"]
+        if path == "/lol-perks/v1/rune-recommender-auto-select" and method == "POST":
+            return 204, None
+        if _CHAT_PATH.match(path) and method == "POST":
+            return 200, {"body": (body or {}).get("body"), "type": "groupchat"}
+        return _not_found(path)
+
+    def _locked_champion_id(self, cell_id):
+        for action_group in (self._state["session"] or {}).get("actions", []):
+            for action in action_group:
+                if (
+                    action.get("type") == "pick"
+                    and action.get("actorCellId") == cell_id
+                    and action.get("completed")
+                ):
+                    return action.get("championId", 0)
+        return 0
+
+    def _patch_action(self, action_id, body):
+        session = self._state["session"]
+        for action_group in session.get("actions", []):
+            for action in action_group:
+                if action.get("id") != action_id:
+                    continue
+                if action.get("completed"):
+                    return 500, {
+                        "errorCode": "RPC_ERROR",
+                        "httpStatus": 500,
+                        "message": "Action already completed",
+                    }
+                action.update(
+                    {k: v for k, v in body.items() if k in ("championId", "completed")}
+                )
+                if action.get("completed"):
+                    action["isInProgress"] = False
+                if action.get("type") == "pick":
+                    for player in session.get("myTeam", []):
+                        if player.get("cellId") == action.get("actorCellId"):
+                            player["championId"] = action.get("championId", 0)
+                self._publish({"session"})
+                return 204, None
+        return _not_found(f"/lol-champ-select/v1/session/actions/{action_id}")
+
+    def _update_swap(self, kind, swap_id, verb):
+        key = {
+            "position-swaps": "positionSwaps",
+            "pick-order-swaps": "pickOrderSwaps",
+            "trades": "trades",
+        }[kind]
+        for swap in self._state["session"].get(key, []):
+            if swap.get("id") == int(swap_id):
+                swap["state"] = {
+                    "request": "SENT",
+                    "decline": "DECLINED",
+                    "accept": "ACCEPTED",
+                }[verb]
+                self._publish({"session"})
+                return 200, swap
+        return _not_found(f"/lol-champ-select/v1/session/{kind}/{swap_id}/{verb}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local LCU REST stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2998)
+    parser.add_argument("--token", default="stand-in", help="riot:<token> basic auth")
+    parser.add_argument("--scenario", help="Scenario JSON file to play")
+    parser.add_argument("--speed", type=float, default=1.0, help="Timeline speed-up")
+    parser.add_argument("--tls", action="store_true", help="Serve HTTPS like the client")
+    parser.add_argument("--certfile")
+    parser.add_argument("--keyfile")
+    args = parser.parse_args()
+
+    certfile, keyfile = args.certfile, args.keyfile
+    cert_dir = None
+    if args.tls and not certfile:
+        cert_dir = tempfile.mkdtemp(prefix="lcu_stand_in_")
+        certfile, keyfile = make_self_signed_cert(cert_dir)
+
+    scenario = load_scenario(args.scenario) if args.scenario else None
+    stand_in = LcuStandIn(
+        args.host,
+        args.port,
+        args.token,
+        scenario,
+        certfile,
+        keyfile,
+        args.speed,
+    ).start()
+    print(f"🔌 LCU stand-in listening on {stand_in.base_url}")
+    print(f"   LCU_BASE_URL={stand_in.base_url} LCU_AUTH_TOKEN={args.token}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.stop()
+        if cert_dir:
+            shutil.rmtree(cert_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
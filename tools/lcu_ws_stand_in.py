@@ -0,0 +1,284 @@
+"""
+Local stand-in for the LCU WebSocket (WAMP) event stream.
+
+Speaks just enough RFC 6455 to accept the subscriptions sent by
+utils.lcu_events and push `[8, eventName, payload]` frames back, so the event
+listener can be tested without a League client.
+
+Usage:
+    python -m tools.lcu_ws_stand_in --port 2999 --demo
+
+Point the bot at it by making utils.lcu_connection resolve to
+http://127.0.0.1:<port> (the listener then connects to ws://127.0.0.1:<port>).
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import socketserver
+import struct
+import threading
+import time
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_OPCODE_TEXT = 0x1
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+
+WAMP_SUBSCRIBE = 5
+WAMP_UNSUBSCRIBE = 6
+WAMP_EVENT = 8
+
+
+def _read_exact(sock_file, size):
+    data = sock_file.read(size)
+    if data is None or len(data) < size:
+        raise ConnectionError("connection closed")
+    return data
+
+
+def encode_frame(payload, opcode=_OPCODE_TEXT):
+    """Encode an unmasked server-to-client frame."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 65536:
+        header += bytes([126]) + struct.pack("!H", length)
+    else:
+        header += bytes([127]) + struct.pack("!Q", length)
+    return header + payload
+
+
+def read_frame(sock_file):
+    """Read one client frame; returns (opcode, payload bytes)."""
+    first, second = _read_exact(sock_file, 2)
+    opcode = first & 0x0F
+    masked = second & 0x80
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", _read_exact(sock_file, 2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", _read_exact(sock_file, 8))
+    mask = _read_exact(sock_file, 4) if masked else None
+    payload = _read_exact(sock_file, length) if length else b""
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+class _Connection:
+    def __init__(self, handler):
+        self.handler = handler
+        self.subscriptions = set()
+        self.send_lock = threading.Lock()
+
+    def send_text(self, text):
+        with self.send_lock:
+            self.handler.wfile.write(encode_frame(text))
+            self.handler.wfile.flush()
+
+
+class _WampHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        headers = self._read_handshake()
+        if headers is None:
+            return
+
+        expected_auth = self.server.stand_in.expected_auth
+        if expected_auth and headers.get("authorization") != expected_auth:
+            self.wfile.write(b"HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\n\r\n")
+            return
+
+        accept = base64.b64encode(
+            hashlib.sha1(
+                (headers.get("sec-websocket-key", "") + _WEBSOCKET_GUID).encode()
+            ).digest()
+        ).decode()
+        self.wfile.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode()
+        )
+        self.wfile.flush()
+
+        connection = _Connection(self)
+        self.server.stand_in._add_connection(connection)
+        try:
+            while True:
+                opcode, payload = read_frame(self.rfile)
+                if opcode == _OPCODE_CLOSE:
+                    with connection.send_lock:
+                        self.wfile.write(encode_frame(b"", _OPCODE_CLOSE))
+                    return
+                if opcode == _OPCODE_PING:
+                    with connection.send_lock:
+                        self.wfile.write(encode_frame(payload, _OPCODE_PONG))
+                    continue
+                if opcode == _OPCODE_TEXT:
+                    self.server.stand_in._handle_client_message(connection, payload)
+        except (ConnectionError, OSError):
+            return
+        finally:
+            self.server.stand_in._remove_connection(connection)
+
+    def _read_handshake(self):
+        request_line = self.rfile.readline()
+        if not request_line:
+            return None
+        headers = {}
+        while True:
+            line = self.rfile.readline().decode("latin-1").strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+        return headers
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class LcuWebSocketStandIn:
+    """In-process WAMP event server. Use publish() to push events to subscribers."""
+
+    def __init__(self, host="127.0.0.1", port=0, auth_token=None):
+        self.expected_auth = None
+        if auth_token:
+            credentials = base64.b64encode(f"riot:{auth_token}".encode()).decode()
+            self.expected_auth = f"Basic {credentials}"
+        self._server = _ThreadingServer((host, port), _WampHandler)
+        self._server.stand_in = self
+        self._connections = []
+        self._lock = threading.Condition()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def publish(self, event_name, data, uri=None, event_type="Update"):
+        """Send an event to every connection subscribed to event_name."""
+        message = json.dumps(
+            [
+                WAMP_EVENT,
+                event_name,
+                {"data": data, "eventType": event_type, "uri": uri or ""},
+            ]
+        )
+        with self._lock:
+            targets = [c for c in self._connections if event_name in c.subscriptions]
+        for connection in targets:
+            try:
+                connection.send_text(message)
+            except OSError:
+                self._remove_connection(connection)
+        return len(targets)
+
+    def wait_for_subscription(self, event_name, timeout=5):
+        """Block until some client subscribed to event_name."""
+        with self._lock:
+            return self._lock.wait_for(
+                lambda: any(event_name in c.subscriptions for c in self._connections),
+                timeout,
+            )
+
+    def _add_connection(self, connection):
+        with self._lock:
+            self._connections.append(connection)
+            self._lock.notify_all()
+
+    def _remove_connection(self, connection):
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+            self._lock.notify_all()
+
+    def _handle_client_message(self, connection, payload):
+        try:
+            message = json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            return
+        if not isinstance(message, list) or len(message) < 2:
+            return
+        with self._lock:
+            if message[0] == WAMP_SUBSCRIBE:
+                connection.subscriptions.add(message[1])
+            elif message[0] == WAMP_UNSUBSCRIBE:
+                connection.subscriptions.discard(message[1])
+            self._lock.notify_all()
+
+
+def _run_demo(stand_in, interval):
+    """Publish a queue pop -> champ select sequence once a client is listening."""
+    gameflow = "OnJsonApiEvent_lol-gameflow_v1_gameflow-phase"
+    ready_check = "OnJsonApiEvent_lol-matchmaking_v1_ready-check"
+    session = "OnJsonApiEvent_lol-champ-select_v1_session"
+
+    print("⏳ Waiting for a subscriber...")
+    stand_in.wait_for_subscription(gameflow, timeout=None)
+    steps = [
+        (gameflow, "Matchmaking", "/lol-gameflow/v1/gameflow-phase"),
+        (gameflow, "ReadyCheck", "/lol-gameflow/v1/gameflow-phase"),
+        (ready_check, {"state": "InProgress", "timer": 0.0}, "/lol-matchmaking/v1/ready-check"),
+        (gameflow, "ChampSelect", "/lol-gameflow/v1/gameflow-phase"),
+        (
+            session,
+            {"localPlayerCellId": 0, "timer": {"phase": "BAN_PICK"}},
+            "/lol-champ-select/v1/session",
+        ),
+    ]
+    for event_name, data, uri in steps:
+        time.sleep(interval)
+        delivered = stand_in.publish(event_name, data, uri)
+        print(f"📤 {event_name} -> {delivered} subscriber(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local LCU WebSocket stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2999)
+    parser.add_argument("--token", default=None, help="Require riot:<token> basic auth")
+    parser.add_argument("--demo", action="store_true", help="Publish a demo sequence")
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    stand_in = LcuWebSocketStandIn(args.host, args.port, args.token).start()
+    print(f"🔌 LCU WebSocket stand-in listening on ws://{args.host}:{stand_in.port}")
+    try:
+        if args.demo:
+            _run_demo(stand_in, args.interval)
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Replay a recorded champ-select session trace through the session hub.
+
+Serves the trace through get_session() at the chosen speed, follows the hub
+like the draft workers do and reports, per session change, how late the hub saw
+it and when the lock-in scheduler would have locked in. Useful to reproduce a
+late lock-in from a real champ select without a client.
+
+Usage:
+    python -m tools.replay_session_trace logs/traces/champ_select_<stamp>.jsonl.gz --speed 4
+"""
+
+import argparse
+import time
+
+from utils import lock_in_scheduler, session_hub
+from utils.metrics import get_metric_summary, record_metric, reset_metrics
+from utils.session_trace import SessionTraceReplayer
+
+HUB_LAG_METRIC = "replay.hub_lag_ms"
+STEP_METRIC = "replay.step_ms"
+# Poll the replayed session much faster than the live hub so lag reflects the trace.
+REPLAY_HUB_INTERVAL_SECONDS = 0.05
+
+
+def _describe(session):
+    if not session:
+        return "no session"
+    timer = session.get("timer") or {}
+    my_cell_id = session.get("localPlayerCellId")
+    active = [
+        action.get("type")
+        for group in session.get("actions", [])
+        for action in group
+        if action.get("actorCellId") == my_cell_id and action.get("isInProgress")
+    ]
+    state = f"{timer.get('phase', '?')} {timer.get('adjustedTimeLeftInPhase', '?')}ms left"
+    return f"{state}, our turn: {active[0]}" if active else state
+
+
+def replay(path, speed=1.0, safety_margin_ms=None):
+    replayer = SessionTraceReplayer(path, speed=speed)
+    if not replayer.entries:
+        print("Trace is empty.")
+        return
+
+    reset_metrics()
+    lock_in_scheduler.reset_lock_in_scheduler()
+    margin = (
+        safety_margin_ms
+        if safety_margin_ms is not None
+        else lock_in_scheduler.LOCK_IN_SAFETY_MARGIN_MS
+    )
+    # Local time at which each session became current on the scaled timeline.
+    changes = []
+    first_t = replayer.entries[0][0]
+    previous = object()
+    for t, session in replayer.entries:
+        if session != previous:
+            changes.append((t - first_t) / speed)
+            previous = session
+
+    print(
+        f"▶️ Replaying {len(replayer.entries)} fetches ({len(changes)} changes) "
+        f"over {replayer.duration:.1f}s at {speed}x"
+    )
+    replayer.start()
+    replay_started = time.time()
+    session_hub.start_session_hub(interval=REPLAY_HUB_INTERVAL_SECONDS)
+    try:
+        seen_version = 0
+        change_index = 0
+        while not replayer.is_finished() or session_hub.get_session_version() > seen_version:
+            snapshot = session_hub.wait_for_snapshot(seen_version, 0.5)
+            if snapshot is None or snapshot.version <= seen_version:
+                continue
+            seen_version = snapshot.version
+
+            step_started = time.perf_counter()
+            elapsed = replayer.elapsed()
+            while change_index + 1 < len(changes) and changes[change_index + 1] <= elapsed:
+                change_index += 1
+            became_current = replay_started + changes[change_index]
+            record_metric(HUB_LAG_METRIC, (snapshot.received_at - became_current) * 1000)
+
+            session = snapshot.session
+            timer = (session or {}).get("timer") or {}
+            lock_in_scheduler.observe_timer(timer, snapshot.received_at)
+            lock_in_at = lock_in_scheduler.get_lock_in_time(
+                timer, margin, snapshot.received_at
+            )
+            record_metric(STEP_METRIC, (time.perf_counter() - step_started) * 1000)
+
+            plan = (
+                f", lock-in in {lock_in_at - time.time():.2f}s"
+                if lock_in_at is not None and session
+                else ""
+            )
+            print(f"[{elapsed:7.2f}s] v{snapshot.version}: {_describe(session)}{plan}")
+    finally:
+        session_hub.stop_session_hub()
+        replayer.stop()
+
+    for name in (HUB_LAG_METRIC, STEP_METRIC):
+        summary = get_metric_summary(name)
+        if summary:
+            print(
+                f"📊 {name}: n={summary['count']} mean={summary['mean']:.2f} "
+                f"min={summary['min']:.2f} max={summary['max']:.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a champ-select session trace")
+    parser.add_argument("trace", help="path to a .jsonl.gz trace")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--margin-ms", type=int, default=None)
+    args = parser.parse_args()
+    replay(args.trace, speed=args.speed, safety_margin_ms=args.margin_ms)
+
+
+if __name__ == "__main__":
+    main()
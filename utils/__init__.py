@@ -9,8 +9,17 @@ from .lcu_connection import (
     get_auth,
     get_base_url,
     get_current_champion_id_lcu,
+    get_lcu_client,
     get_lcu_credentials,
     get_session,
+    fetch_session,
+    lcu_get,
+    lcu_patch,
+    lcu_post,
+    lcu_request,
+    lcu_request_all,
+    log_lcu_request_stats,
+    reset_lcu_connection,
 )
 from .rank_utils import get_rank_data, get_gameflow_phase
 from .session_utils import (
@@ -21,17 +30,27 @@ from .session_utils import (
     get_queueType,
     is_still_our_turn_to_pick,
     get_summoner_name,
+    get_champion_name_by_id,
     normalize_lcu_lane,
     STANDARD_LCU_LANES,
 )
+from .champion_catalog import (
+    ChampionCatalog,
+    get_champion_catalog,
+    resolve_champion_id,
+    resolve_champion_name,
+)
+from .champ_select_state import ChampSelectState, get_champ_select_state
 from .champion_utils import (
+    ChampionAvailability,
+    champion_mask,
     fetch_champion_ids,
     fetch_champion_names,
-    get_champion_name_by_id,
     get_current_summoner_id,
     get_final_local_champion_id_from_session,
     get_final_local_champion_name,
     get_owned_champion_ids,
+    get_owned_champion_ids_version,
     is_champion_available,
     is_champion_locked_in,
     get_locked_in_champion,
@@ -46,8 +65,17 @@ __all__ = [
     "get_auth",
     "get_base_url",
     "get_current_champion_id_lcu",
+    "get_lcu_client",
     "get_lcu_credentials",
     "get_session",
+    "fetch_session",
+    "lcu_get",
+    "lcu_patch",
+    "lcu_post",
+    "lcu_request",
+    "lcu_request_all",
+    "log_lcu_request_stats",
+    "reset_lcu_connection",
     # Rank and Gameflow
     "get_rank_data",
     "get_gameflow_phase",
@@ -61,7 +89,17 @@ __all__ = [
     "get_summoner_name",
     "normalize_lcu_lane",
     "STANDARD_LCU_LANES",
+    # Champion catalog
+    "ChampionCatalog",
+    "get_champion_catalog",
+    "resolve_champion_id",
+    "resolve_champion_name",
+    # Champ-select state
+    "ChampSelectState",
+    "get_champ_select_state",
     # Champion utilities
+    "ChampionAvailability",
+    "champion_mask",
     "fetch_champion_ids",
     "fetch_champion_names",
     "get_champion_name_by_id",
@@ -69,6 +107,7 @@ __all__ = [
     "get_final_local_champion_id_from_session",
     "get_final_local_champion_name",
     "get_owned_champion_ids",
+    "get_owned_champion_ids_version",
     "is_champion_available",
     "is_champion_locked_in",
     "get_locked_in_champion",
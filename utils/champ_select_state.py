@@ -0,0 +1,182 @@
+"""
+Parsed champ-select session with the indexes the draft helpers need.
+
+The raw session is a nested dict; answering "what is my lane", "is it my turn",
+"which champions are banned" used to mean walking myTeam or every action group
+again for each question. ChampSelectState walks the session once and keeps
+__slots__ records plus lookups by cell and by actor.
+
+get_champ_select_state(session) caches the state of the last session object it
+saw. Hub snapshots hand the same dict to every worker, so all helpers reading
+one snapshot share a single parse. Sessions must be treated as read-only.
+"""
+
+import threading
+
+# Session keys holding swap requests, with the kind names used for them.
+SWAP_KINDS = (
+    ("positionSwaps", "position"),
+    ("pickOrderSwaps", "pick_order"),
+    ("trades", "trade"),
+)
+
+
+class ParticipantRecord:
+    __slots__ = (
+        "cell_id",
+        "champion_id",
+        "champion_pick_intent",
+        "assigned_position",
+        "game_name",
+        "tag_line",
+        "is_ally",
+    )
+
+    def __init__(self, player, is_ally):
+        self.cell_id = player.get("cellId")
+        self.champion_id = player.get("championId") or 0
+        self.champion_pick_intent = player.get("championPickIntent") or 0
+        self.assigned_position = player.get("assignedPosition")
+        self.game_name = player.get("gameName", "")
+        self.tag_line = player.get("tagLine", "")
+        self.is_ally = is_ally
+
+
+class ActionRecord:
+    """One session action; raw is the action dict for the LCU write helpers."""
+
+    __slots__ = (
+        "id",
+        "actor_cell_id",
+        "type",
+        "champion_id",
+        "completed",
+        "is_in_progress",
+        "raw",
+    )
+
+    def __init__(self, action):
+        self.raw = action
+        self.id = action.get("id")
+        self.actor_cell_id = action.get("actorCellId")
+        self.type = action.get("type")
+        self.champion_id = action.get("championId", 0)
+        self.completed = action.get("completed", False)
+        self.is_in_progress = action.get("isInProgress", False)
+
+
+class ChampSelectState:
+    """
+    One champ-select session, parsed once.
+
+    participants       cellId -> ParticipantRecord (both teams)
+    local_player       our ParticipantRecord (from myTeam), or None
+    in_progress        actorCellId -> ActionRecord currently in progress
+    local_pick_action  the local player's first pick action, or None
+    banned_champion_ids      championIds of completed bans, in action order
+    ally_pick_champion_ids   champions on teammates' pick actions (hovered or locked)
+    enemy_champion_ids       non-zero championIds on theirTeam, in team order
+    received_swaps     (kind, id) of swap/trade requests waiting for our answer
+    phase_deadline_ms  client time the timer phase ends, or None
+    """
+
+    __slots__ = (
+        "session",
+        "local_cell_id",
+        "timer_phase",
+        "phase_deadline_ms",
+        "participants",
+        "local_player",
+        "actions",
+        "in_progress",
+        "local_pick_action",
+        "banned_champion_ids",
+        "ally_pick_champion_ids",
+        "enemy_champion_ids",
+        "received_swaps",
+    )
+
+    def __init__(self, session):
+        self.session = session
+        self.local_cell_id = session.get("localPlayerCellId")
+        timer = session.get("timer") or {}
+        self.timer_phase = (timer.get("phase") or "").upper()
+        client_now_ms = timer.get("internalNowInEpochMs")
+        time_left_ms = timer.get("adjustedTimeLeftInPhase")
+        self.phase_deadline_ms = (
+            client_now_ms + time_left_ms
+            if client_now_ms and time_left_ms is not None
+            else None
+        )
+
+        participants = {}
+        enemy_champion_ids = []
+        for player in session.get("myTeam") or ():
+            record = ParticipantRecord(player, True)
+            participants[record.cell_id] = record
+        for player in session.get("theirTeam") or ():
+            record = ParticipantRecord(player, False)
+            participants.setdefault(record.cell_id, record)
+            if record.champion_id:
+                enemy_champion_ids.append(record.champion_id)
+        self.participants = participants
+        local_player = participants.get(self.local_cell_id)
+        self.local_player = local_player if local_player and local_player.is_ally else None
+        self.enemy_champion_ids = tuple(enemy_champion_ids)
+
+        actions = []
+        in_progress = {}
+        banned = []
+        ally_picks = set()
+        local_pick_action = None
+        for action_group in session.get("actions") or ():
+            for raw_action in action_group:
+                action = ActionRecord(raw_action)
+                actions.append(action)
+                if action.is_in_progress:
+                    in_progress.setdefault(action.actor_cell_id, action)
+                if action.type == "ban":
+                    if action.completed:
+                        banned.append(action.champion_id)
+                elif action.type == "pick":
+                    if action.actor_cell_id == self.local_cell_id:
+                        if local_pick_action is None:
+                            local_pick_action = action
+                    elif action.champion_id:
+                        participant = participants.get(action.actor_cell_id)
+                        if participant is not None and participant.is_ally:
+                            ally_picks.add(action.champion_id)
+        self.actions = tuple(actions)
+        self.in_progress = in_progress
+        self.local_pick_action = local_pick_action
+        self.banned_champion_ids = tuple(banned)
+        self.ally_pick_champion_ids = frozenset(ally_picks)
+        self.received_swaps = tuple(
+            (kind, swap.get("id"))
+            for key, kind in SWAP_KINDS
+            for swap in session.get(key) or ()
+            if swap.get("state") == "RECEIVED"
+        )
+
+    def in_progress_action(self, cell_id=None):
+        """Action in progress for cell_id (default: the local player), or None."""
+        return self.in_progress.get(self.local_cell_id if cell_id is None else cell_id)
+
+
+_cache_lock = threading.Lock()
+_cached_state = None
+
+
+def get_champ_select_state(session):
+    """ChampSelectState for session, reused while the same session object is passed."""
+    global _cached_state
+    if not session:
+        return None
+    state = _cached_state
+    # The cached state holds the session, so its id cannot be reused meanwhile.
+    if state is not None and state.session is session:
+        return state
+    state = ChampSelectState(session)
+    with _cache_lock:
+        _cached_state = state
+    return state
@@ -0,0 +1,265 @@
+"""
+Data Dragon champion catalog cached on disk and in memory.
+
+The champion list only changes with a new patch, so it is stored in
+cache/champion_catalog.json together with the Data Dragon version it came from.
+Lookups are served from an in-memory ChampionCatalog singleton; the network is
+only touched when there is no cached copy yet, plus one background version
+check per run. If Data Dragon is unreachable the last cached version keeps
+working.
+"""
+
+import json
+import os
+import threading
+import time
+
+import requests
+
+from .logger import log_and_discord
+
+CATALOG_CACHE_DIR = "cache"
+CATALOG_CACHE_FILE = os.path.join(CATALOG_CACHE_DIR, "champion_catalog.json")
+DDRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+DDRAGON_CHAMPIONS_URL = (
+    "https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
+)
+_DDRAGON_TIMEOUT = (4, 15)
+# Without any cached copy, don't hammer Data Dragon from the pick loop while offline.
+_DOWNLOAD_RETRY_SECONDS = 60
+
+_lock = threading.Lock()
+_catalog = None
+_background_refresh_started = False
+_last_failed_download = None
+
+
+def normalize_champion_alias(name):
+    """Alias key ignoring case, spaces and punctuation: "Kai'Sa" -> "kaisa"."""
+    return "".join(ch for ch in str(name).casefold() if ch.isalnum())
+
+
+class ChampionCatalog:
+    """
+    Bidirectional champion index for one Data Dragon patch.
+
+    Built once per patch; every lookup is a dict hit. Names are resolved by exact
+    display name first, then case-insensitively, then by alias, which covers the
+    Data Dragon ids ("MonkeyKing", "Kaisa") and spelling variants ("kai'sa",
+    "Dr Mundo").
+    """
+
+    __slots__ = (
+        "version",
+        "champions",
+        "ids_by_name",
+        "names_by_id",
+        "_ids_by_casefold",
+        "_ids_by_alias",
+    )
+
+    def __init__(self, version, champions):
+        """champions: list of {"id", "key", "name"} entries from champion.json."""
+        self.version = version
+        self.champions = champions
+        self.ids_by_name = {}
+        self.names_by_id = {}
+        self._ids_by_casefold = {}
+        self._ids_by_alias = {}
+        for champ in champions:
+            champion_id = int(champ["key"])
+            name = champ["name"]
+            self.ids_by_name[name] = champion_id
+            self.names_by_id[champion_id] = name
+            self._ids_by_casefold[name.casefold()] = champion_id
+            self._ids_by_casefold.setdefault(champ["id"].casefold(), champion_id)
+            self._ids_by_alias.setdefault(normalize_champion_alias(name), champion_id)
+            self._ids_by_alias.setdefault(
+                normalize_champion_alias(champ["id"]), champion_id
+            )
+
+    def __len__(self):
+        return len(self.names_by_id)
+
+    def id_for_name(self, name):
+        """Champion ID for a display name, Data Dragon id or alias; None if unknown."""
+        if not name:
+            return None
+        champion_id = self.ids_by_name.get(name)
+        if champion_id is not None:
+            return champion_id
+        name = str(name)
+        champion_id = self._ids_by_casefold.get(name.casefold())
+        if champion_id is not None:
+            return champion_id
+        return self._ids_by_alias.get(normalize_champion_alias(name))
+
+    def name_for_id(self, champion_id):
+        """Display name for a champion ID; None if unknown."""
+        return self.names_by_id.get(champion_id)
+
+    def canonical_name(self, name):
+        """Display name for any accepted spelling of a champion; None if unknown."""
+        return self.names_by_id.get(self.id_for_name(name))
+
+
+def _build_catalog(version, champions):
+    return ChampionCatalog(version, champions)
+
+
+def _load_from_disk():
+    try:
+        with open(CATALOG_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        return _build_catalog(data["version"], data["champions"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable champion catalog cache: {e}")
+        return None
+
+
+def _save_to_disk(catalog):
+    try:
+        os.makedirs(CATALOG_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{CATALOG_CACHE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": catalog.version, "champions": catalog.champions}, f)
+        os.replace(tmp_path, CATALOG_CACHE_FILE)
+    except Exception as e:
+        print(f"⚠️ Could not write champion catalog cache: {e}")
+
+
+def _fetch_latest_version():
+    return requests.get(DDRAGON_VERSIONS_URL, timeout=_DDRAGON_TIMEOUT).json()[0]
+
+
+def _download_catalog(version):
+    champ_data = requests.get(
+        DDRAGON_CHAMPIONS_URL.format(version=version), timeout=_DDRAGON_TIMEOUT
+    ).json()
+    champions = [
+        {"id": champ["id"], "key": int(champ["key"]), "name": champ["name"]}
+        for champ in champ_data["data"].values()
+    ]
+    return _build_catalog(version, champions)
+
+
+def _set_catalog(catalog):
+    global _catalog
+    with _lock:
+        _catalog = catalog
+
+
+def refresh_champion_catalog():
+    """
+    Download the catalog if Data Dragon has a newer version than the cached one.
+
+    Returns True when the in-memory catalog is usable afterwards.
+    """
+    current = _catalog
+    try:
+        version = _fetch_latest_version()
+        if current is not None and current.version == version:
+            return True
+        catalog = _download_catalog(version)
+    except Exception as e:
+        if current is not None:
+            print(
+                f"⚠️ Could not refresh champion catalog, using cached patch "
+                f"{current.version}: {e}"
+            )
+            return True
+        raise
+
+    _set_catalog(catalog)
+    _save_to_disk(catalog)
+    if current is not None:
+        print(f"🔄 Champion catalog updated to patch {catalog.version}")
+    return True
+
+
+def _start_background_refresh():
+    global _background_refresh_started
+    with _lock:
+        if _background_refresh_started:
+            return
+        _background_refresh_started = True
+    thread = threading.Thread(target=refresh_champion_catalog, daemon=True)
+    thread.start()
+
+
+def get_champion_catalog():
+    """
+    Return the in-memory ChampionCatalog.
+
+    First call loads the disk cache (or downloads it if there is none) and starts
+    one background version check for this run. Returns None if no catalog could
+    be loaded at all.
+    """
+    global _last_failed_download, _background_refresh_started
+
+    catalog = _catalog
+    if catalog is not None:
+        return catalog
+
+    catalog = _load_from_disk()
+    if catalog is not None:
+        _set_catalog(catalog)
+        _start_background_refresh()
+        return catalog
+
+    if (
+        _last_failed_download is not None
+        and time.monotonic() - _last_failed_download < _DOWNLOAD_RETRY_SECONDS
+    ):
+        return None
+    try:
+        with _lock:
+            # This download doubles as the once-per-run version check.
+            _background_refresh_started = True
+        refresh_champion_catalog()
+        _last_failed_download = None
+    except Exception as e:
+        _last_failed_download = time.monotonic()
+        log_and_discord(f"⚠️ Error fetching champion catalog: {e}")
+        return None
+    return _catalog
+
+
+def resolve_champion_id(champion_name, champion_ids=None):
+    """
+    Champion ID for a configured name.
+
+    Uses champion_ids first; when that is the catalog's own mapping (or None) it
+    falls back to the catalog's case-insensitive and alias indexes, so config
+    spellings like "Kaisa" or "wukong" still resolve.
+    """
+    if champion_ids:
+        champion_id = champion_ids.get(champion_name)
+        if champion_id:
+            return champion_id
+    catalog = get_champion_catalog() if champion_ids is None else _catalog
+    if catalog is None or (
+        champion_ids is not None and champion_ids is not catalog.ids_by_name
+    ):
+        return None
+    return catalog.id_for_name(champion_name)
+
+
+def resolve_champion_name(champion_id, champion_ids=None):
+    """
+    Champion name for an ID.
+
+    With the catalog's own mapping (or None) this is an O(1) index hit; a custom
+    name->ID mapping is searched directly.
+    """
+    catalog = get_champion_catalog() if champion_ids is None else _catalog
+    if champion_ids is None or (
+        catalog is not None and champion_ids is catalog.ids_by_name
+    ):
+        return catalog.name_for_id(champion_id) if catalog is not None else None
+    for name, mapped_id in champion_ids.items():
+        if mapped_id == champion_id:
+            return name
+    return None
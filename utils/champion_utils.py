@@ -1,60 +1,40 @@
-import requests
+import copy
+
 from .logger import log_and_discord
-from .lcu_connection import get_session, get_base_url, get_auth
+from .lcu_cache import cached_get
+from .lcu_connection import get_session, lcu_get
+from .champ_select_state import get_champ_select_state
+from .champion_catalog import get_champion_catalog, resolve_champion_id
 
 _cached_owned_summoner_id = None
 _cached_owned_champion_ids = set()
+_owned_champion_ids_version = 0
 
 
 def fetch_champion_ids():
-    """Fetch champion name to ID mapping from Data Dragon API."""
-    try:
-        version = requests.get(
-            "https://ddragon.leagueoflegends.com/api/versions.json"
-        ).json()[0]
-        champ_data = requests.get(
-            f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
-        ).json()
-        return {
-            champ["name"]: int(champ["key"]) for champ in champ_data["data"].values()
-        }
-    except Exception as e:
-        log_and_discord(f"⚠️ Error fetching champion IDs: {e}")
-        return {}
+    """
+    Champion name to ID mapping from the cached Data Dragon catalog.
 
+    The returned dict is shared; treat it as read-only.
+    """
+    catalog = get_champion_catalog()
+    return catalog.ids_by_name if catalog else {}
 
-def fetch_champion_names():
-    """Fetch champion ID to name mapping from Data Dragon API."""
-    try:
-        version = requests.get(
-            "https://ddragon.leagueoflegends.com/api/versions.json"
-        ).json()[0]
-        champ_data = requests.get(
-            f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
-        ).json()
-        return {
-            int(champ["key"]): champ["name"] for champ in champ_data["data"].values()
-        }
-    except Exception as e:
-        log_and_discord(f"⚠️ Error fetching champion names: {e}")
-        return {}
 
+def fetch_champion_names():
+    """
+    Champion ID to name mapping from the cached Data Dragon catalog.
 
-def get_champion_name_by_id(champion_id, champion_ids):
-    """Convert champion ID to name using the reverse mapping from champion_ids."""
-    # Create reverse mapping from the existing champion_ids dict
-    id_to_name = {v: k for k, v in champion_ids.items()}
-    return id_to_name.get(champion_id)
+    The returned dict is shared; treat it as read-only.
+    """
+    catalog = get_champion_catalog()
+    return catalog.names_by_id if catalog else {}
 
 
 def get_current_summoner_id():
     """Return the currently logged-in summoner ID from LCU."""
     try:
-        response = requests.get(
-            f"{get_base_url()}/lol-summoner/v1/current-summoner",
-            auth=get_auth(),
-            verify=False,
-        )
+        response = cached_get("/lol-summoner/v1/current-summoner")
         if response.status_code != 200:
             return None
         payload = response.json() or {}
@@ -72,6 +52,7 @@ def get_owned_champion_ids(force_refresh=False):
     /lol-champions/v1/inventories/{summonerId}/champions-minimal
     """
     global _cached_owned_summoner_id, _cached_owned_champion_ids
+    global _owned_champion_ids_version
 
     summoner_id = get_current_summoner_id()
     if not summoner_id:
@@ -85,10 +66,8 @@ def get_owned_champion_ids(force_refresh=False):
         return set(_cached_owned_champion_ids)
 
     try:
-        response = requests.get(
-            f"{get_base_url()}/lol-champions/v1/inventories/{summoner_id}/champions-minimal",
-            auth=get_auth(),
-            verify=False,
+        response = lcu_get(
+            f"/lol-champions/v1/inventories/{summoner_id}/champions-minimal"
         )
         if response.status_code != 200:
             log_and_discord(
@@ -96,6 +75,8 @@ def get_owned_champion_ids(force_refresh=False):
             )
             return set()
 
+        # Every entry is needed: one response.json() beats decoding them one by
+        # one (tools/bench_json_extract.py).
         champions = response.json() or []
         owned_ids = set()
         for champion in champions:
@@ -105,6 +86,11 @@ def get_owned_champion_ids(force_refresh=False):
             if isinstance(champion_id, int) and champion_id > 0:
                 owned_ids.add(champion_id)
 
+        if (
+            _cached_owned_summoner_id != summoner_id
+            or _cached_owned_champion_ids != owned_ids
+        ):
+            _owned_champion_ids_version += 1
         _cached_owned_summoner_id = summoner_id
         _cached_owned_champion_ids = owned_ids
         return set(owned_ids)
@@ -113,11 +99,99 @@ def get_owned_champion_ids(force_refresh=False):
         return set()
 
 
-def _name_in_list_case_insensitive(name, names):
-    if not name or not names:
-        return False
-    target = str(name).casefold()
-    return any(str(n).casefold() == target for n in names)
+def get_owned_champion_ids_version():
+    """Counter bumped whenever get_owned_champion_ids caches a different set."""
+    return _owned_champion_ids_version
+
+
+def champion_mask(champion_ids):
+    """Bitset of champion IDs: bit N is set when champion ID N is in champion_ids."""
+    mask = 0
+    for champion_id in champion_ids or ():
+        if isinstance(champion_id, int) and champion_id > 0:
+            mask |= 1 << champion_id
+    return mask
+
+
+class ChampionAvailability:
+    """
+    Pick availability for one draft state, as champion ID bitsets.
+
+    Allies, bans and enemies are folded into one blocked mask and ownership into
+    an owned mask once. filter() builds the mask of a whole candidate list and
+    ANDs it with them a single time instead of scanning lists per candidate.
+    Build one per draft state and pass it to every helper that filters.
+    """
+
+    __slots__ = ("champion_ids", "blocked_mask", "owned_mask", "_enemy_names", "_ids")
+
+    def __init__(
+        self,
+        ally_champion_ids,
+        banned_champions_ids,
+        enemy_champions,
+        champion_ids,
+        owned_champion_ids=None,
+    ):
+        self.champion_ids = champion_ids
+        self._ids = {}
+        enemy_ids = (self._champion_id(name) for name in enemy_champions or ())
+        self.blocked_mask = (
+            champion_mask(ally_champion_ids)
+            | champion_mask(banned_champions_ids)
+            | champion_mask(enemy_ids)
+        )
+        self.owned_mask = (
+            champion_mask(owned_champion_ids)
+            if owned_champion_ids is not None
+            else None
+        )
+        # Enemies come in as names; keep them for names the ID map can't resolve.
+        self._enemy_names = frozenset(
+            str(name).casefold() for name in enemy_champions or () if name
+        )
+
+    def without_ownership(self):
+        """The same draft state with ownership ignored (to report unowned picks)."""
+        view = copy.copy(self)
+        view.owned_mask = None
+        return view
+
+    def _champion_id(self, champion_name):
+        if champion_name in self._ids:
+            return self._ids[champion_name]
+        try:
+            champion_id = resolve_champion_id(champion_name, self.champion_ids)
+        except Exception as e:
+            log_and_discord(f"⚠️ Error resolving champion ID for {champion_name}: {e}")
+            champion_id = None
+        self._ids[champion_name] = champion_id
+        return champion_id
+
+    def allowed_mask(self, candidate_mask):
+        """The subset of candidate_mask that is free to pick."""
+        mask = candidate_mask & ~self.blocked_mask
+        if self.owned_mask is not None:
+            mask &= self.owned_mask
+        return mask
+
+    def is_available(self, champion_name):
+        return bool(self.filter((champion_name,)))
+
+    def filter(self, champion_names):
+        """Available names from champion_names, in their original order."""
+        candidates = [(name, self._champion_id(name)) for name in champion_names]
+        allowed = self.allowed_mask(
+            champion_mask(champion_id for _, champion_id in candidates)
+        )
+        return [
+            name
+            for name, champion_id in candidates
+            if isinstance(champion_id, int)
+            and champion_id > 0
+            and allowed >> champion_id & 1
+            and str(name).casefold() not in self._enemy_names
+        ]
 
 
 def is_champion_available(
@@ -128,30 +202,28 @@ def is_champion_available(
     champion_ids,
     owned_champion_ids=None,
 ):
-    """Check if a champion is available for picking."""
-    try:
-        champion_id = champion_ids.get(champion_name)
+    """
+    Check if a champion is available for picking.
 
-        # Check if champion exists in our ID mapping
+    For one-off checks; filtering several candidates against the same draft is
+    cheaper with one ChampionAvailability.
+    """
+    try:
+        champion_id = resolve_champion_id(champion_name, champion_ids)
         if not champion_id:
             return False
-
-        # Check if champion is owned by the current account
         if owned_champion_ids is not None and champion_id not in owned_champion_ids:
             return False
-
-        # Check if champion is picked by teammates
-        if champion_id in ally_champion_ids:
+        if champion_id in (ally_champion_ids or ()):
             return False
-
-        # Check if champion is banned
-        if champion_id in banned_champions_ids:
+        if champion_id in (banned_champions_ids or ()):
             return False
-
-        # Check if champion is picked by enemies
-        if _name_in_list_case_insensitive(champion_name, enemy_champions):
-            return False
-
+        champion_key = str(champion_name).casefold()
+        for enemy in enemy_champions or ():
+            if str(enemy).casefold() == champion_key or (
+                resolve_champion_id(enemy, champion_ids) == champion_id
+            ):
+                return False
         return True
     except Exception as e:
         log_and_discord(f"⚠️ Error in is_champion_available for {champion_name}: {e}")
@@ -160,16 +232,11 @@ def is_champion_available(
 
 def _pick_action_champion_id_for_local_player(session):
     """Pick action championId for the local player (may be stale after a champion trade)."""
-    if not session:
-        return None
-    my_id = session.get("localPlayerCellId")
-    if my_id is None:
+    state = get_champ_select_state(session)
+    if state is None or state.local_cell_id is None:
         return None
-    for actions in session.get("actions", []):
-        for a in actions:
-            if a.get("actorCellId") == my_id and a.get("type") == "pick":
-                return a.get("championId", 0)
-    return None
+    action = state.local_pick_action
+    return action.champion_id if action is not None else None
 
 
 def get_final_local_champion_id_from_session(session):
@@ -179,16 +246,12 @@ def get_final_local_champion_id_from_session(session):
     Prefers myTeam[].championId for the local cell (updated after champion trades),
     then falls back to the completed pick action's championId.
     """
-    if not session:
+    state = get_champ_select_state(session)
+    if state is None or state.local_cell_id is None:
         return None
-    my_cell_id = session.get("localPlayerCellId")
-    if my_cell_id is None:
-        return None
-    for p in session.get("myTeam", []):
-        if p.get("cellId") == my_cell_id:
-            cid = p.get("championId") or 0
-            if cid:
-                return cid
+    player = state.local_player
+    if player is not None and player.champion_id:
+        return player.champion_id
     pick_cid = _pick_action_champion_id_for_local_player(session)
     return pick_cid if pick_cid else None
 
@@ -208,13 +271,8 @@ def get_final_local_champion_name(session):
 
 def is_champion_locked_in():
     """Check if a champion is already locked in."""
-    session = get_session()
-    my_id = session["localPlayerCellId"]
-    for actions in session["actions"]:
-        for a in actions:
-            if a.get("actorCellId") == my_id and a.get("type") == "pick":
-                return a.get("completed", False)
-    return False
+    action = get_champ_select_state(get_session()).local_pick_action
+    return action.completed if action is not None else False
 
 
 def get_locked_in_champion():
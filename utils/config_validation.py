@@ -191,4 +191,27 @@ def validate_config(config):
                 "'toggle_auto_pick_hotkey' must be a non-empty string (example: 'f9')."
             )
 
+    if "lcu_stats_hotkey" in config:
+        lcu_stats_hotkey = config.get("lcu_stats_hotkey")
+        if not isinstance(lcu_stats_hotkey, str) or not lcu_stats_hotkey.strip():
+            errors.append(
+                "'lcu_stats_hotkey' must be a non-empty string (example: 'f10')."
+            )
+
+    if "record_session_traces" in config and not isinstance(
+        config.get("record_session_traces"), bool
+    ):
+        errors.append("'record_session_traces' must be true or false.")
+
+    if "lock_in_safety_margin_ms" in config:
+        margin = config.get("lock_in_safety_margin_ms")
+        if isinstance(margin, bool) or not isinstance(margin, int) or margin < 0:
+            errors.append(
+                "'lock_in_safety_margin_ms' must be a non-negative integer (example: 1500)."
+            )
+        elif margin < 500:
+            warnings.append(
+                "'lock_in_safety_margin_ms' below 500 may miss the pick timer on a slow client."
+            )
+
     return errors, warnings
@@ -0,0 +1,343 @@
+"""
+Background delivery of Discord webhook messages.
+
+Posting used to happen inline and time.sleep() through 429s and retries, on the
+main loop and on champ-select workers, so one slow webhook could delay the next
+queue accept. post_discord_message() only enqueues and returns; one daemon
+thread sends over a pooled session and follows Discord's rate limits:
+
+- X-RateLimit-Remaining / X-RateLimit-Reset-After of each bucket
+  (X-RateLimit-Bucket, learned per webhook URL): a drained bucket waits for its
+  reset before the next send;
+- 429 retry_after (body, then Retry-After), for every webhook when "global";
+- 5xx answers and connection errors are retried after DISCORD_RETRY_DELAY_SECONDS;
+  other 4xx answers are final (the same payload would be refused again).
+
+A message waiting on its bucket does not hold up other webhooks. The queue is
+bounded: once DISCORD_QUEUE_SIZE messages are pending, new ones are dropped and
+post_discord_message() returns False.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DISCORD_QUEUE_SIZE = 100
+DISCORD_MAX_ATTEMPTS = 3
+DISCORD_RETRY_DELAY_SECONDS = 1.5
+DISCORD_REQUEST_TIMEOUT = (4, 10)
+
+
+class DiscordMessage:
+    __slots__ = (
+        "webhook_url",
+        "payload",
+        "label",
+        "on_sent",
+        "on_failure",
+        "on_rejected",
+        "attempts",
+    )
+
+    def __init__(self, webhook_url, payload, label, on_sent, on_failure, on_rejected=None):
+        self.webhook_url = webhook_url
+        self.payload = payload
+        self.label = label
+        self.on_sent = on_sent
+        self.on_failure = on_failure
+        self.on_rejected = on_rejected
+        self.attempts = 0
+
+
+class _RateLimitBucket:
+    __slots__ = ("remaining", "reset_at")
+
+    def __init__(self):
+        self.remaining = None
+        self.reset_at = 0.0
+
+
+_condition = threading.Condition()
+# (ready_at, seq, DiscordMessage); ready_at is time.monotonic().
+_pending = []
+_seq = itertools.count()
+_in_flight = 0
+_thread = None
+_stopping = False
+_client = None
+_bucket_by_url = {}
+_buckets = {}
+_global_reset_at = 0.0
+_stats = {"sent": 0, "failed": 0, "dropped": 0, "retried": 0, "rate_limited": 0}
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        client = requests.Session()
+        # A single sender thread: one keep-alive socket per webhook host is enough.
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=1)
+        client.mount("https://", adapter)
+        client.mount("http://", adapter)
+        _client = client
+    return _client
+
+
+def post_discord_message(
+    webhook_url,
+    content,
+    on_failure=None,
+    label="discord message",
+    on_sent=None,
+    on_rejected=None,
+):
+    """
+    Queue content for webhook_url and return immediately.
+
+    Returns False without a webhook URL or when the queue is full. From the sender
+    thread, on_sent() is called once Discord accepted the message and
+    on_failure(text) if it is finally given up on; without on_failure the failure
+    is printed. When Discord refused the message with a 4xx other than 429,
+    on_rejected(status_code, text) is called instead of on_failure if given.
+    """
+    if not webhook_url:
+        return False
+    message = DiscordMessage(
+        webhook_url, {"content": content}, label, on_sent, on_failure, on_rejected
+    )
+    with _condition:
+        if len(_pending) + _in_flight >= DISCORD_QUEUE_SIZE:
+            _stats["dropped"] += 1
+            queued = False
+        else:
+            heapq.heappush(_pending, (time.monotonic(), next(_seq), message))
+            _ensure_worker()
+            _condition.notify_all()
+            queued = True
+    if not queued:
+        print(f"⚠️ Discord queue full, dropped {label}")
+    return queued
+
+
+def _ensure_worker():
+    """Start the sender thread if needed (called with _condition held)."""
+    global _thread, _stopping
+    if _thread is not None and _thread.is_alive():
+        return
+    _stopping = False
+    _thread = threading.Thread(target=_run, name="discord-dispatcher", daemon=True)
+    _thread.start()
+
+
+def _blocked_until(webhook_url):
+    """Monotonic time before which webhook_url must not be posted to (lock held)."""
+    until = _global_reset_at
+    bucket = _buckets.get(_bucket_by_url.get(webhook_url, webhook_url))
+    if bucket is not None and bucket.remaining is not None and bucket.remaining <= 0:
+        until = max(until, bucket.reset_at)
+    return until
+
+
+def _next_message():
+    """Wait for the next message allowed to be sent; None once stopped and drained."""
+    global _in_flight
+    with _condition:
+        while True:
+            if not _pending:
+                if _stopping:
+                    return None
+                _condition.wait()
+                continue
+            ready_at, seq, message = _pending[0]
+            now = time.monotonic()
+            ready_at = max(ready_at, _blocked_until(message.webhook_url))
+            if ready_at > now:
+                # Re-sort behind its bucket reset so other webhooks can go first.
+                heapq.heapreplace(_pending, (ready_at, seq, message))
+                if _pending[0][2] is message:
+                    _condition.wait(ready_at - now)
+                continue
+            heapq.heappop(_pending)
+            _in_flight += 1
+            return message
+
+
+def _run():
+    global _in_flight
+    while True:
+        message = _next_message()
+        if message is None:
+            return
+        try:
+            _send(message)
+        except Exception as e:
+            _give_up(message, f"❌ Error sending {message.label}: {e}")
+        finally:
+            with _condition:
+                _in_flight -= 1
+                _condition.notify_all()
+
+
+def _send(message):
+    message.attempts += 1
+    try:
+        response = _get_client().post(
+            message.webhook_url,
+            json=message.payload,
+            timeout=DISCORD_REQUEST_TIMEOUT,
+        )
+    except requests.exceptions.RequestException as e:
+        if message.attempts < DISCORD_MAX_ATTEMPTS:
+            _retry(message, DISCORD_RETRY_DELAY_SECONDS)
+        else:
+            _give_up(message, f"❌ Error sending {message.label} after retries: {e}")
+        return
+
+    _update_bucket(message.webhook_url, response)
+    if response.status_code in (200, 204):
+        with _condition:
+            _stats["sent"] += 1
+        if message.on_sent is not None:
+            message.on_sent()
+        return
+
+    if response.status_code == 429:
+        retry_after, is_global = _parse_rate_limit(response)
+        _block(message.webhook_url, response, retry_after, is_global)
+        if message.attempts < DISCORD_MAX_ATTEMPTS:
+            _retry(message, retry_after)
+            return
+    elif 500 <= response.status_code < 600 and message.attempts < DISCORD_MAX_ATTEMPTS:
+        _retry(message, DISCORD_RETRY_DELAY_SECONDS)
+        return
+
+    error = f"❌ Error sending {message.label}: {response.status_code} - {response.text}"
+    if 400 <= response.status_code < 500 and response.status_code != 429:
+        _give_up(message, error, rejected_status=response.status_code)
+    else:
+        _give_up(message, error)
+
+
+def _retry(message, delay_seconds):
+    with _condition:
+        _stats["retried"] += 1
+        heapq.heappush(
+            _pending, (time.monotonic() + delay_seconds, next(_seq), message)
+        )
+
+
+def _give_up(message, error, rejected_status=None):
+    with _condition:
+        _stats["failed"] += 1
+    if rejected_status is not None and message.on_rejected is not None:
+        message.on_rejected(rejected_status, error)
+    elif message.on_failure is not None:
+        message.on_failure(error)
+    else:
+        print(error)
+
+
+def _header_float(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _update_bucket(webhook_url, response):
+    """Remember the bucket state Discord reported for webhook_url."""
+    headers = response.headers
+    remaining = _header_float(headers, "X-RateLimit-Remaining")
+    reset_after = _header_float(headers, "X-RateLimit-Reset-After")
+    if remaining is None or reset_after is None:
+        return
+    bucket_id = headers.get("X-RateLimit-Bucket") or webhook_url
+    with _condition:
+        _bucket_by_url[webhook_url] = bucket_id
+        bucket = _buckets.setdefault(bucket_id, _RateLimitBucket())
+        bucket.remaining = remaining
+        bucket.reset_at = time.monotonic() + reset_after
+
+
+def _parse_rate_limit(response):
+    """(retry_after seconds, is_global) of a 429 answer."""
+    retry_after = None
+    is_global = response.headers.get("X-RateLimit-Global", "").lower() == "true"
+    if response.headers.get("Content-Type", "").startswith("application/json"):
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+        retry_after = payload.get("retry_after")
+        is_global = is_global or bool(payload.get("global"))
+    if retry_after is None:
+        retry_after = _header_float(response.headers, "Retry-After")
+    if retry_after is None:
+        retry_after = DISCORD_RETRY_DELAY_SECONDS
+    return max(float(retry_after), 0.0), is_global
+
+
+def _block(webhook_url, response, retry_after, is_global):
+    """Hold back the webhook's bucket (or every webhook) for retry_after seconds."""
+    global _global_reset_at
+    reset_at = time.monotonic() + retry_after
+    with _condition:
+        _stats["rate_limited"] += 1
+        if is_global:
+            _global_reset_at = max(_global_reset_at, reset_at)
+            return
+        bucket_id = (
+            response.headers.get("X-RateLimit-Bucket")
+            or _bucket_by_url.get(webhook_url)
+            or webhook_url
+        )
+        _bucket_by_url[webhook_url] = bucket_id
+        bucket = _buckets.setdefault(bucket_id, _RateLimitBucket())
+        bucket.remaining = 0
+        bucket.reset_at = max(bucket.reset_at, reset_at)
+
+
+def flush_discord_dispatcher(timeout=None):
+    """Wait until every queued message was sent or given up; False on timeout."""
+    with _condition:
+        return _condition.wait_for(lambda: not _pending and not _in_flight, timeout)
+
+
+def stop_discord_dispatcher(timeout=None):
+    """Send what is queued (up to timeout) and stop the sender thread."""
+    global _stopping
+    with _condition:
+        _stopping = True
+        _condition.notify_all()
+        thread = _thread
+    if thread is not None:
+        thread.join(timeout)
+
+
+def get_discord_dispatcher_stats():
+    with _condition:
+        stats = dict(_stats)
+        stats["queued"] = len(_pending) + _in_flight
+    return stats
+
+
+def reset_discord_dispatcher():
+    """Drop queued messages, rate-limit state and counters (tests)."""
+    global _global_reset_at, _client
+    with _condition:
+        _pending.clear()
+        _condition.notify_all()
+    stop_discord_dispatcher(timeout=5)
+    with _condition:
+        _bucket_by_url.clear()
+        _buckets.clear()
+        _global_reset_at = 0.0
+        for key in _stats:
+            _stats[key] = 0
+        client, _client = _client, None
+    if client is not None:
+        client.close()
@@ -0,0 +1,271 @@
+"""
+Durable outbox for the Discord notifications that must not get lost.
+
+Pre-game and post-game reports used to be dropped once the webhook failed three
+times in a row. DiscordOutbox appends each notification to a JSONL file before
+it is handed to the dispatcher and appends a "done" record once Discord accepted
+it, so short network outages and restarts only delay a report:
+
+    {"op": "add", "id": "...", "webhook_env": "DISCORD_WEBHOOK_URL", "content": "...", "created_at": 1700000000.0}
+    {"op": "done", "id": "..."}
+
+A background thread drains pending entries through utils.discord_dispatcher and
+retries failed ones (429, 5xx, connection errors) with OUTBOX_BACKOFF_SECONDS
+(capped at the last step). Entries Discord refuses with another 4xx (bad
+payload, deleted webhook) and entries older than OUTBOX_MAX_AGE_SECONDS are
+dropped. The file stores the name
+of the environment variable holding the webhook, not the webhook URL itself, and
+is rewritten with only the pending entries on start and once it drains.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+
+from .discord_dispatcher import post_discord_message
+
+DISCORD_OUTBOX_PATH = os.path.join("logs", "discord_outbox.jsonl")
+OUTBOX_BACKOFF_SECONDS = (5, 15, 60, 300)
+OUTBOX_MAX_AGE_SECONDS = 24 * 3600
+
+
+class OutboxEntry:
+    __slots__ = (
+        "id",
+        "webhook_env",
+        "content",
+        "created_at",
+        "failures",
+        "next_attempt_at",
+        "in_flight",
+    )
+
+    def __init__(self, id, webhook_env, content, created_at):
+        self.id = id
+        self.webhook_env = webhook_env
+        self.content = content
+        self.created_at = created_at
+        self.failures = 0
+        self.next_attempt_at = 0.0
+        self.in_flight = False
+
+    def to_record(self):
+        return {
+            "op": "add",
+            "id": self.id,
+            "webhook_env": self.webhook_env,
+            "content": self.content,
+            "created_at": self.created_at,
+        }
+
+
+def load_outbox(path):
+    """Pending entries of the outbox file, in the order they were added."""
+    pending = {}
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash mid-append.
+                continue
+            if record.get("op") == "add":
+                pending[record["id"]] = OutboxEntry(
+                    record["id"],
+                    record.get("webhook_env", "DISCORD_WEBHOOK_URL"),
+                    record.get("content", ""),
+                    record.get("created_at", time.time()),
+                )
+            elif record.get("op") == "done":
+                pending.pop(record.get("id"), None)
+    return list(pending.values())
+
+
+class DiscordOutbox:
+    """Append-only notification outbox at path, drained by a daemon thread."""
+
+    def __init__(self, path=DISCORD_OUTBOX_PATH, post=post_discord_message):
+        self.path = path
+        self._post = post
+        self._condition = threading.Condition()
+        self._entries = {}
+        self._loaded = False
+        self._thread = None
+        self._stopping = False
+
+    def start(self):
+        """Load entries left by a previous run and start draining them."""
+        with self._condition:
+            self._load()
+            self._stopping = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="discord-outbox", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return self
+
+    def stop(self, timeout=None):
+        """Stop draining; entries not delivered yet stay on disk for the next start."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def enqueue(self, content, webhook_env="DISCORD_WEBHOOK_URL"):
+        """
+        Persist content for the webhook in webhook_env and return immediately.
+
+        Returns False when the webhook is not configured or the entry could not be
+        written.
+        """
+        if not os.getenv(webhook_env):
+            return False
+        entry = OutboxEntry(uuid.uuid4().hex, webhook_env, content, time.time())
+        try:
+            with self._condition:
+                self._load()
+                self._append(entry.to_record())
+                self._entries[entry.id] = entry
+                self._condition.notify_all()
+        except OSError as e:
+            print(f"❌ Error writing discord outbox: {e}")
+            return False
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        return True
+
+    def pending_count(self):
+        with self._condition:
+            return len(self._entries)
+
+    def wait_until_empty(self, timeout=None):
+        """Block until every entry was delivered or dropped; False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._entries, timeout)
+
+    # -- file ----------------------------------------------------------------
+
+    def _load(self):
+        """Read pending entries once and rewrite the file with only them (lock held)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        for entry in load_outbox(self.path):
+            self._entries.setdefault(entry.id, entry)
+        if self._entries:
+            print(f"📮 {len(self._entries)} Discord notification(s) pending from last run")
+        self._rewrite()
+
+    def _append(self, record):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite(self):
+        """Replace the file with the pending entries only (lock held)."""
+        if not self._entries:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry.to_record(), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def _finish(self, entry, reason=None):
+        with self._condition:
+            if self._entries.pop(entry.id, None) is None:
+                return
+            try:
+                if self._entries:
+                    self._append({"op": "done", "id": entry.id})
+                else:
+                    self._rewrite()
+            except OSError as e:
+                print(f"❌ Error writing discord outbox: {e}")
+            self._condition.notify_all()
+        if reason:
+            print(f"📮 Dropped Discord notification: {reason}")
+
+    # -- delivery ------------------------------------------------------------
+
+    def _on_sent(self, entry):
+        self._finish(entry)
+
+    def _on_rejected(self, entry, status_code, error):
+        # Resending the same payload would be refused again.
+        self._finish(entry, f"refused by Discord ({error})")
+
+    def _on_failure(self, entry, error):
+        if time.time() - entry.created_at > OUTBOX_MAX_AGE_SECONDS:
+            self._finish(entry, f"older than {OUTBOX_MAX_AGE_SECONDS}s ({error})")
+            return
+        with self._condition:
+            entry.failures += 1
+            step = min(entry.failures, len(OUTBOX_BACKOFF_SECONDS)) - 1
+            delay = OUTBOX_BACKOFF_SECONDS[step]
+            entry.next_attempt_at = time.monotonic() + delay
+            entry.in_flight = False
+            self._condition.notify_all()
+        print(f"📮 Discord notification not delivered, retrying in {delay}s: {error}")
+
+    def _due_entries(self):
+        """Wait for entries whose next attempt is due; None once stopped."""
+        with self._condition:
+            while True:
+                if self._stopping:
+                    return None
+                now = time.monotonic()
+                waiting = [e for e in self._entries.values() if not e.in_flight]
+                due = [e for e in waiting if e.next_attempt_at <= now]
+                if due:
+                    for entry in due:
+                        entry.in_flight = True
+                    return due
+                if waiting:
+                    next_attempt = min(e.next_attempt_at for e in waiting)
+                    self._condition.wait(next_attempt - now)
+                else:
+                    self._condition.wait()
+
+    def _run(self):
+        while True:
+            due = self._due_entries()
+            if due is None:
+                return
+            for entry in due:
+                webhook_url = os.getenv(entry.webhook_env)
+                if not webhook_url:
+                    self._finish(entry, f"{entry.webhook_env} is not set")
+                    continue
+                queued = self._post(
+                    webhook_url,
+                    entry.content,
+                    on_failure=lambda error, entry=entry: self._on_failure(entry, error),
+                    label="discord notification",
+                    on_sent=lambda entry=entry: self._on_sent(entry),
+                    on_rejected=lambda status_code, error, entry=entry: self._on_rejected(
+                        entry, status_code, error
+                    ),
+                )
+                if not queued:
+                    self._on_failure(entry, "dispatcher queue full")
+
+
+# Pre-game and post-game reports; started by the entrypoint.
+discord_outbox = DiscordOutbox()
@@ -0,0 +1,183 @@
+"""
+Typed draft events derived from consecutive champ-select snapshots.
+
+The session hub hands every new snapshot to publish_session(), which diffs it
+against the previous one (both as ChampSelectState) and delivers the events to
+subscribers. Workers subscribe to the event types they act on and sleep until
+one arrives, instead of re-reading the whole session on every change:
+
+    subscription = subscribe_draft_events({SWAP_RECEIVED, DRAFT_ENDED})
+    for event in subscription.wait(timeout):
+        ...
+    subscription.close()
+
+Events carry the cell, action and champion they are about; event.data holds
+extra details (the swap kind, the previous and new phase, ...).
+"""
+
+import queue
+import threading
+
+from .champ_select_state import get_champ_select_state
+
+ACTION_STARTED = "action_started"
+ACTION_COMPLETED = "action_completed"
+ALLY_HOVER = "ally_hover"
+ENEMY_HOVER = "enemy_hover"
+ENEMY_LOCK = "enemy_lock"
+BAN_COMPLETED = "ban_completed"
+SWAP_RECEIVED = "swap_received"
+PHASE_CHANGED = "phase_changed"
+TIMER_RESET = "timer_reset"
+DRAFT_ENDED = "draft_ended"
+
+# A phase deadline moving later by more than this counts as a timer reset.
+TIMER_RESET_THRESHOLD_MS = 1000
+
+
+class DraftEvent:
+    __slots__ = ("type", "cell_id", "action_id", "champion_id", "data")
+
+    def __init__(self, type, cell_id=None, action_id=None, champion_id=None, data=None):
+        self.type = type
+        self.cell_id = cell_id
+        self.action_id = action_id
+        self.champion_id = champion_id
+        self.data = data
+
+    def __repr__(self):
+        return (
+            f"DraftEvent({self.type}, cell={self.cell_id}, action={self.action_id}, "
+            f"champion={self.champion_id}, data={self.data})"
+        )
+
+
+def _is_ally(state, cell_id):
+    participant = state.participants.get(cell_id)
+    return participant is not None and participant.is_ally
+
+
+def diff_states(previous, current):
+    """
+    Events leading from previous to current (either may be None).
+
+    With no previous state, everything already in progress, completed or pending
+    in current is reported as if it had just happened.
+    """
+    if current is None:
+        return [DraftEvent(DRAFT_ENDED)] if previous is not None else []
+
+    events = []
+    previous_phase = previous.timer_phase if previous else None
+    if current.timer_phase != previous_phase:
+        events.append(
+            DraftEvent(PHASE_CHANGED, data={"from": previous_phase, "to": current.timer_phase})
+        )
+    elif (
+        previous.phase_deadline_ms is not None
+        and current.phase_deadline_ms is not None
+        and current.phase_deadline_ms - previous.phase_deadline_ms > TIMER_RESET_THRESHOLD_MS
+    ):
+        events.append(
+            DraftEvent(TIMER_RESET, data={"deadline_ms": current.phase_deadline_ms})
+        )
+
+    previous_actions = {action.id: action for action in previous.actions} if previous else {}
+    for action in current.actions:
+        before = previous_actions.get(action.id)
+        cell_id = action.actor_cell_id
+        fields = {"cell_id": cell_id, "action_id": action.id, "champion_id": action.champion_id}
+        was_in_progress = before.is_in_progress if before else False
+        was_completed = before.completed if before else False
+        champion_before = before.champion_id if before else 0
+
+        if action.is_in_progress and not was_in_progress and not action.completed:
+            events.append(DraftEvent(ACTION_STARTED, data={"type": action.type}, **fields))
+        if action.completed and not was_completed:
+            events.append(DraftEvent(ACTION_COMPLETED, data={"type": action.type}, **fields))
+            if action.type == "ban":
+                events.append(DraftEvent(BAN_COMPLETED, **fields))
+            elif action.type == "pick" and not _is_ally(current, cell_id):
+                events.append(DraftEvent(ENEMY_LOCK, **fields))
+        elif (
+            action.type == "pick"
+            and not action.completed
+            and action.champion_id
+            and action.champion_id != champion_before
+            and cell_id != current.local_cell_id
+        ):
+            hover = ALLY_HOVER if _is_ally(current, cell_id) else ENEMY_HOVER
+            events.append(DraftEvent(hover, **fields))
+
+    previous_swaps = set(previous.received_swaps) if previous else set()
+    for kind, swap_id in current.received_swaps:
+        if (kind, swap_id) not in previous_swaps:
+            events.append(DraftEvent(SWAP_RECEIVED, action_id=swap_id, data={"kind": kind}))
+    return events
+
+
+class DraftEventSubscription:
+    """Queue of the draft events of the subscribed types."""
+
+    def __init__(self, event_types):
+        self.event_types = frozenset(event_types)
+        self._queue = queue.SimpleQueue()
+
+    def deliver(self, event):
+        self._queue.put(event)
+
+    def wait(self, timeout):
+        """Events queued so far, waiting up to timeout for the first one ([] on timeout)."""
+        try:
+            events = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self):
+        unsubscribe_draft_events(self)
+
+
+_lock = threading.Lock()
+_subscriptions = []
+_previous_state = None
+
+
+def subscribe_draft_events(event_types):
+    """Subscribe to the given event types; close() the subscription when done."""
+    subscription = DraftEventSubscription(event_types)
+    with _lock:
+        _subscriptions.append(subscription)
+    return subscription
+
+
+def unsubscribe_draft_events(subscription):
+    with _lock:
+        if subscription in _subscriptions:
+            _subscriptions.remove(subscription)
+
+
+def publish_session(session):
+    """Diff session against the last published one and deliver the events."""
+    global _previous_state
+    state = get_champ_select_state(session)
+    with _lock:
+        previous, _previous_state = _previous_state, state
+        subscriptions = list(_subscriptions)
+    events = diff_states(previous, state)
+    for event in events:
+        for subscription in subscriptions:
+            if event.type in subscription.event_types:
+                subscription.deliver(event)
+    return events
+
+
+def reset_draft_events():
+    """Forget the last session (a new champ select starts from scratch)."""
+    global _previous_state
+    with _lock:
+        _previous_state = None
@@ -0,0 +1,160 @@
+"""
+Deduplication and rate limiting of error reports sent to Discord.
+
+log_and_discord() runs inside hot loops (per counter candidate, per failed swap
+decline, per ownership fetch), so a flapping condition can produce dozens of
+identical reports a minute. ErrorAggregator sits between it and the webhook:
+
+- messages are fingerprinted with their numbers masked, so "port 51234" and
+  "port 51240" count as the same error;
+- the first report of a fingerprint goes out at once, repeats within
+  window_seconds are only counted and sent afterwards as one "(×N ...)" summary;
+- at most max_per_minute reports leave per minute; over the cap, reports are
+  folded into their summary, which waits for the next free slot.
+
+report() never blocks on the network: summaries are sent by a daemon thread and
+send() itself only queues (see utils.discord_dispatcher).
+"""
+
+import re
+import threading
+import time
+
+ERROR_REPORT_WINDOW_SECONDS = 60.0
+ERROR_REPORT_MAX_PER_MINUTE = 10
+# How long a summary held back by the rate cap waits before trying again.
+ERROR_REPORT_DEFER_SECONDS = 5.0
+
+_HEX_NUMBER = re.compile(r"0x[0-9a-fA-F]+")
+_NUMBER = re.compile(r"\d+")
+
+
+def error_fingerprint(error, summoner_name=None):
+    """Key under which repeats of error are grouped (numbers masked)."""
+    text = _NUMBER.sub("#", _HEX_NUMBER.sub("0x#", str(error)))
+    return (summoner_name, text.strip())
+
+
+class _ErrorWindow:
+    __slots__ = ("error", "summoner_name", "unreported", "closes_at")
+
+    def __init__(self, error, summoner_name, closes_at):
+        self.error = error
+        self.summoner_name = summoner_name
+        self.unreported = 0
+        self.closes_at = closes_at
+
+
+class ErrorAggregator:
+    """Fingerprint, coalesce and rate-limit error reports before send(error, summoner_name)."""
+
+    def __init__(
+        self,
+        send,
+        window_seconds=ERROR_REPORT_WINDOW_SECONDS,
+        max_per_minute=ERROR_REPORT_MAX_PER_MINUTE,
+    ):
+        self._send = send
+        self.window_seconds = window_seconds
+        self.max_per_minute = max_per_minute
+        self._condition = threading.Condition()
+        self._windows = {}
+        self._tokens = float(max_per_minute)
+        self._refilled_at = time.monotonic()
+        self._thread = None
+        self.sent = 0
+        self.coalesced = 0
+
+    def report(self, error, summoner_name=None):
+        """Send error now, or count it towards its fingerprint's summary."""
+        key = error_fingerprint(error, summoner_name)
+        with self._condition:
+            now = time.monotonic()
+            window = self._windows.get(key)
+            if window is not None:
+                window.error = error
+                window.unreported += 1
+                self.coalesced += 1
+                return
+            window = _ErrorWindow(error, summoner_name, now + self.window_seconds)
+            self._windows[key] = window
+            send_now = self._take_token(now)
+            if not send_now:
+                window.unreported = 1
+            self._ensure_flusher()
+            self._condition.notify_all()
+        if send_now:
+            self._deliver(error, summoner_name)
+
+    def flush(self):
+        """Send every pending summary now, ignoring the rate cap (shutdown)."""
+        with self._condition:
+            pending = [w for w in self._windows.values() if w.unreported]
+            self._windows.clear()
+            self._condition.notify_all()
+        for window in pending:
+            self._deliver(self._summary(window), window.summoner_name)
+
+    def _take_token(self, now):
+        """Use one outbound slot if the per-minute cap allows (lock held)."""
+        rate = self.max_per_minute / 60.0
+        self._tokens = min(
+            float(self.max_per_minute), self._tokens + (now - self._refilled_at) * rate
+        )
+        self._refilled_at = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _summary(self, window):
+        if window.unreported == 1:
+            return window.error
+        return (
+            f"{window.error} (×{window.unreported} in the last "
+            f"{self.window_seconds:g}s)"
+        )
+
+    def _deliver(self, error, summoner_name):
+        self.sent += 1
+        try:
+            self._send(error, summoner_name)
+        except Exception as e:
+            print(f"❌ Error reporting to Discord: {e}")
+
+    def _ensure_flusher(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="error-aggregator", daemon=True
+            )
+            self._thread.start()
+
+    def _due_summaries(self):
+        """Wait for the next window to close; returns the summaries to send."""
+        with self._condition:
+            while True:
+                if not self._windows:
+                    self._condition.wait()
+                    continue
+                now = time.monotonic()
+                next_close = min(w.closes_at for w in self._windows.values())
+                if next_close > now:
+                    self._condition.wait(next_close - now)
+                    continue
+                due = []
+                for key, window in list(self._windows.items()):
+                    if window.closes_at > now:
+                        continue
+                    if not window.unreported:
+                        del self._windows[key]
+                    elif self._take_token(now):
+                        del self._windows[key]
+                        due.append(window)
+                    else:
+                        window.closes_at = now + ERROR_REPORT_DEFER_SECONDS
+                return due
+
+    def _run(self):
+        while True:
+            for window in self._due_summaries():
+                self._deliver(self._summary(window), window.summoner_name)
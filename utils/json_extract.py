@@ -0,0 +1,234 @@
+"""
+Pull selected values out of a JSON document without building the whole tree.
+
+LCU responses such as match history, eog-stats-block or champions-minimal are
+large while the bot reads a handful of fields. These helpers walk the raw text:
+values on a requested path are decoded with the C json scanner, everything else
+is stepped over without being decoded (brackets are counted, strings jumped with
+a regex), and the walk stops as soon as every requested path was found. Only
+the requested values are ever built, and the tail after the last requested
+field is never read.
+
+Paths are tuples of object keys and array indexes, e.g.
+("games", "games", 0, "participantIdentities"). The empty tuple is the document.
+"""
+
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_scanstring = json.decoder.scanstring
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Rest of a string whose opening quote was consumed, closing quote included.
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to the next bracket outside a string, strings included.
+_UNTIL_BRACKET = re.compile(
+    r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL
+)
+_SCALAR = re.compile(r"[^,\]}\s]+")
+
+
+class _Done(Exception):
+    """Every requested path was found; stop reading."""
+
+
+def _skip_ws(text, pos):
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _skip_string(text, pos):
+    """End of the string whose opening quote is at pos - 1."""
+    match = _STRING_REST.match(text, pos)
+    if match is None:
+        raise ValueError(f"Unterminated string starting at {pos - 1}")
+    return match.end()
+
+
+def _skip_value(text, pos):
+    """End of the value at pos, found without decoding it."""
+    char = text[pos:pos + 1]
+    if char == '"':
+        return _skip_string(text, pos + 1)
+    if char not in ("[", "{"):
+        match = _SCALAR.match(text, pos)
+        if match is None:
+            raise ValueError(f"Expecting value at {pos}")
+        return match.end()
+    start = pos
+    depth = 0
+    until_bracket = _UNTIL_BRACKET.match
+    while True:
+        bracket = text[pos:pos + 1]
+        if bracket in ("[", "{"):
+            depth += 1
+        elif bracket in ("]", "}"):
+            depth -= 1
+            if not depth:
+                return pos + 1
+        else:
+            raise ValueError(f"Unterminated value starting at {start}")
+        pos = until_bracket(text, pos + 1).end()
+
+
+def _iter_members(text, pos):
+    """Yield (key, value_pos) for the object at pos; send the value's end back in."""
+    pos = _skip_ws(text, pos + 1)
+    if text[pos] == "}":
+        return pos + 1
+    while True:
+        if text[pos] != '"':
+            raise ValueError(f"Expecting property name at {pos}")
+        key, pos = _scanstring(text, pos + 1)
+        pos = _skip_ws(text, pos)
+        if text[pos] != ":":
+            raise ValueError(f"Expecting ':' at {pos}")
+        pos = yield key, _skip_ws(text, pos + 1)
+        pos = _skip_ws(text, pos)
+        if text[pos] == "}":
+            return pos + 1
+        if text[pos] != ",":
+            raise ValueError(f"Expecting ',' or '}}' at {pos}")
+        pos = _skip_ws(text, pos + 1)
+
+
+def _iter_items(text, pos):
+    """Yield (index, value_pos) for the array at pos; send the value's end back in."""
+    pos = _skip_ws(text, pos + 1)
+    if text[pos] == "]":
+        return pos + 1
+    index = 0
+    while True:
+        pos = yield index, pos
+        pos = _skip_ws(text, pos)
+        if text[pos] == "]":
+            return pos + 1
+        if text[pos] != ",":
+            raise ValueError(f"Expecting ',' or ']' at {pos}")
+        pos = _skip_ws(text, pos + 1)
+        index += 1
+
+
+def _children(text, pos):
+    char = text[pos]
+    if char == "{":
+        return _iter_members(text, pos)
+    if char == "[":
+        return _iter_items(text, pos)
+    return None
+
+
+def _walk(text, pos, tree, found, prefix, remaining):
+    """Decode the paths of tree below the value at pos; returns the value's end."""
+    if not tree:
+        value, end = _decoder.raw_decode(text, pos)
+        found[prefix] = value
+        remaining[0] -= 1
+        if not remaining[0]:
+            raise _Done()
+        return end
+
+    members = _children(text, pos)
+    if members is None:
+        return _skip_value(text, pos)
+    try:
+        key, value_pos = next(members)
+        while True:
+            subtree = tree.get(key)
+            if subtree is None:
+                end = _skip_value(text, value_pos)
+            else:
+                end = _walk(text, value_pos, subtree, found, prefix + (key,), remaining)
+            key, value_pos = members.send(end)
+    except StopIteration as stop:
+        return stop.value
+
+
+def extract(text, paths):
+    """
+    Return {path: value} for each path of paths present in the JSON text.
+
+    Missing paths (or paths through a value of another type) are left out.
+    Raises ValueError for malformed JSON on the part that had to be read;
+    skipped values are only checked for balanced brackets and strings.
+    """
+    paths = sorted({tuple(path) for path in paths}, key=len)
+    if () in paths:
+        return {(): json.loads(text)}
+
+    # Leaves are empty dicts. Shorter paths go in first, so a longer path that
+    # runs into a leaf is already covered by it.
+    tree = {}
+    leaves = 0
+    for path in paths:
+        node = tree
+        for key in path[:-1]:
+            child = node.get(key)
+            if child is not None and not child:
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[path[-1]] = {}
+            leaves += 1
+
+    found = {}
+    try:
+        _walk(text, _skip_ws(text, 0), tree, found, (), [leaves])
+    except _Done:
+        pass
+    return found
+
+
+def extract_value(text, path, default=None):
+    """Single-path extract(): the value at path, or default when it is missing."""
+    return extract(text, [path]).get(tuple(path), default)
+
+
+def _locate(text, path):
+    pos = _skip_ws(text, 0)
+    for key in path:
+        members = _children(text, pos)
+        if members is None:
+            return None
+        try:
+            member_key, value_pos = next(members)
+            while member_key != key:
+                member_key, value_pos = members.send(_skip_value(text, value_pos))
+        except StopIteration:
+            return None
+        members.close()
+        pos = value_pos
+    return pos
+
+
+def iter_array(text, path=()):
+    """
+    Yield the items of the array at path one by one.
+
+    Only one decoded item is alive at a time. Yields nothing when the path is
+    missing or not an array.
+    """
+    pos = _locate(text, tuple(path))
+    if pos is None or text[pos] != "[":
+        return
+    items = _iter_items(text, pos)
+    try:
+        _, item_pos = next(items)
+        while True:
+            item, end = _decoder.raw_decode(text, item_pos)
+            yield item
+            _, item_pos = items.send(end)
+    except StopIteration:
+        return
+
+
+def has_items(text, path=()):
+    """True if the value at path is a non-empty array or object."""
+    pos = _locate(text, tuple(path))
+    if pos is None or text[pos] not in "[{":
+        return False
+    return text[_skip_ws(text, pos + 1)] not in "]}"
+
+
+def response_text(response):
+    """Body of a requests response as str, without charset sniffing on big bodies."""
+    return response.content.decode(response.encoding or "utf-8")
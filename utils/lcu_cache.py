@@ -0,0 +1,113 @@
+"""
+Response cache for LCU endpoints that rarely change during a session.
+
+Each cached endpoint template gets a CachePolicy: how long a 200 response may be
+reused and which events drop it early. Events are raised by the rest of the bot:
+
+    "disconnect"    the client went away (new process, maybe another account)
+    "phase_change"  the gameflow phase changed
+    "end_of_game"   the gameflow phase entered a post-game phase
+
+Callers opt in per call with cached_get(path); plain lcu_get() never hits the
+cache. Cached responses are shared between threads: read them, do not mutate.
+"""
+
+import threading
+import time
+
+from .lcu_connection import endpoint_template, lcu_get
+
+DISCONNECT = "disconnect"
+PHASE_CHANGE = "phase_change"
+END_OF_GAME = "end_of_game"
+
+END_OF_GAME_PHASES = frozenset({"WaitingForStats", "PreEndOfGame", "EndOfGame"})
+
+
+class CachePolicy:
+    __slots__ = ("ttl", "invalidate_on")
+
+    def __init__(self, ttl, invalidate_on=(DISCONNECT,)):
+        self.ttl = ttl
+        self.invalidate_on = frozenset(invalidate_on)
+
+
+CACHE_POLICIES = {
+    # Only changes when another account logs in, which means a new client process.
+    "/lol-summoner/v1/current-summoner": CachePolicy(3600, (DISCONNECT,)),
+    # Read pre-game (LP snapshot, Discord message) and post-game (LP change):
+    # reuse within a phase, refetch once the phase moves on.
+    "/lol-ranked/v1/current-ranked-stats": CachePolicy(
+        600, (DISCONNECT, PHASE_CHANGE, END_OF_GAME)
+    ),
+}
+
+_lock = threading.Lock()
+_entries = {}
+# Bumped by every invalidation so a response fetched before it is not stored.
+_generation = 0
+_hits = 0
+_misses = 0
+
+
+def cached_get(path):
+    """
+    lcu_get(path), answered from memory while the endpoint's policy allows it.
+
+    Paths without a policy always go to the client. Only 200 responses are kept.
+    """
+    global _hits, _misses
+
+    template = endpoint_template(path)
+    policy = CACHE_POLICIES.get(template)
+    if policy is None:
+        return lcu_get(path)
+
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(path)
+        if entry is not None and entry[0] > now:
+            _hits += 1
+            return entry[1]
+        _misses += 1
+        generation = _generation
+
+    response = lcu_get(path)
+    if response.status_code == 200:
+        with _lock:
+            if generation == _generation:
+                _entries[path] = (time.monotonic() + policy.ttl, response, template)
+    return response
+
+
+def invalidate_lcu_cache(event=None):
+    """Drop entries whose policy lists event (all entries when event is None)."""
+    global _generation
+    with _lock:
+        _generation += 1
+        if event is None:
+            _entries.clear()
+            return
+        for path, (_, _, template) in list(_entries.items()):
+            if event in CACHE_POLICIES[template].invalidate_on:
+                del _entries[path]
+
+
+def notify_phase_change(phase):
+    """Raise the phase_change (and, for post-game phases, end_of_game) events."""
+    invalidate_lcu_cache(PHASE_CHANGE)
+    if phase in END_OF_GAME_PHASES:
+        invalidate_lcu_cache(END_OF_GAME)
+
+
+def get_lcu_cache_stats():
+    with _lock:
+        return {"hits": _hits, "misses": _misses, "entries": len(_entries)}
+
+
+def reset_lcu_cache():
+    global _hits, _misses
+    with _lock:
+        _entries.clear()
+        _hits = 0
+        _misses = 0
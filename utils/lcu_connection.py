@@ -1,11 +1,62 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
 import psutil
 import re
+import time
+from requests.adapters import HTTPAdapter
 
 from .exceptions import LeagueClientDisconnected
+from .metrics import format_histogram_report, record_histogram
+
+# Worker threads (pick/ban, swap decline, pick-order swap, post-game, lobby watcher)
+# can all hit the LCU at once, so keep enough pooled keep-alive sockets for them.
+LCU_POOL_MAXSIZE = 8
+
+# Per-endpoint latency histograms are named "lcu GET /lol-.../actions/{id}".
+LCU_REQUEST_METRIC_PREFIX = "lcu "
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36})$")
+# The segment after these is always an id, whatever it looks like (chat
+# conversation ids are e.g. "<uuid>@champ-select.pvp.net").
+_COLLECTION_SEGMENTS = frozenset(
+    {
+        "actions",
+        "conversations",
+        "inventories",
+        "pick-order-swaps",
+        "position-swaps",
+        "puuid",
+        "trades",
+    }
+)
+# 404 is how these answer "nothing right now" (not in champ select, no
+# ready-check, no finished game); it is not counted as an error.
+EXPECTED_NOT_FOUND_ENDPOINTS = frozenset(
+    {
+        "/lol-champ-select/v1/session",
+        "/lol-champ-select/v1/current-champion",
+        "/lol-matchmaking/v1/ready-check",
+        "/lol-end-of-game/v1/eog-stats-block",
+    }
+)
+
+# Concurrent identical GETs share one in-flight request. Endpoints listed here also
+# answer identical GETs from the finished response for this many seconds; the
+# champ-select session is not listed so fresh reads after a write stay fresh.
+SINGLE_FLIGHT_WINDOWS = {
+    "/lol-gameflow/v1/gameflow-phase": 0.1,
+    "/lol-summoner/v1/current-summoner": 1.0,
+    "/lol-champions/v1/inventories/{id}/champions-minimal": 1.0,
+}
 
 
 def get_lcu_credentials():
+    # LCU_BASE_URL points the bot at a local stand-in instead of a real client.
+    if os.getenv("LCU_BASE_URL"):
+        return None, os.getenv("LCU_AUTH_TOKEN", "")
     for proc in psutil.process_iter(["cmdline"]):
         if proc.info["cmdline"] and "LeagueClientUx.exe" in proc.info["cmdline"][0]:
             cmdline = " ".join(proc.info["cmdline"])
@@ -20,15 +71,42 @@ _port = None
 _token = None
 _base_url = None
 _auth = None
+_client = None
+_lock = threading.RLock()
+_session_source = None
+_session_fetcher = None
+_session_recorder = None
+_fan_out_executor = None
+_flight_lock = threading.Lock()
+_flights = {}
 
 
 def _ensure_credentials():
     """Ensure credentials are loaded, fetch them if needed"""
     global _port, _token, _base_url, _auth
-    if _port is None or _token is None:
-        _port, _token = get_lcu_credentials()
-        _base_url = f"https://127.0.0.1:{_port}"
-        _auth = requests.auth.HTTPBasicAuth("riot", _token)
+    if _port is not None and _token is not None:
+        return
+    with _lock:
+        if _port is None or _token is None:
+            port, token = get_lcu_credentials()
+            if port is None:
+                _base_url = os.getenv("LCU_BASE_URL").rstrip("/")
+                port = _base_url.rsplit(":", 1)[-1]
+            else:
+                _base_url = f"https://127.0.0.1:{port}"
+            _auth = requests.auth.HTTPBasicAuth("riot", token)
+            _port, _token = port, token
+
+
+def set_lcu_endpoint(base_url, token):
+    """Use base_url/token instead of the running client (e.g. a local stand-in)."""
+    global _port, _token, _base_url, _auth
+    reset_lcu_connection()
+    with _lock:
+        _base_url = base_url.rstrip("/")
+        _port = _base_url.rsplit(":", 1)[-1]
+        _token = token
+        _auth = requests.auth.HTTPBasicAuth("riot", token)
 
 
 def get_base_url():
@@ -43,15 +121,258 @@ def get_auth():
     return _auth
 
 
-def get_session():
-    """Get the current champ select session"""
+def get_lcu_client():
+    """
+    Get the pooled keep-alive HTTP client bound to the current LCU credentials.
+
+    The client is shared by every thread and rebuilt after reset_lcu_connection(),
+    so each poll reuses an open TLS connection instead of a fresh handshake.
+    """
+    global _client
+    _ensure_credentials()
+    client = _client
+    if client is not None:
+        return client
+    with _lock:
+        if _client is None:
+            client = requests.Session()
+            client.auth = _auth
+            client.verify = False
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=LCU_POOL_MAXSIZE)
+            client.mount("https://", adapter)
+            client.mount("http://", adapter)
+            _client = client
+        return _client
+
+
+def reset_lcu_connection():
+    """Forget cached credentials and close the pooled client (client restarted)."""
+    global _port, _token, _base_url, _auth, _client
+    with _flight_lock:
+        _flights.clear()
+    with _lock:
+        client = _client
+        _port = None
+        _token = None
+        _base_url = None
+        _auth = None
+        _client = None
+    if client is not None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=512)
+def endpoint_template(path):
+    """
+    Path with ids replaced by {id} and the query dropped, for grouping metrics.
+
+    /lol-champ-select/v1/session/actions/7 -> /lol-champ-select/v1/session/actions/{id}
+    """
+    segments = path.split("?", 1)[0].split("/")
+    templated = []
+    previous = None
+    for segment in segments:
+        if segment and (previous in _COLLECTION_SEGMENTS or _ID_SEGMENT.match(segment)):
+            templated.append("{id}")
+        else:
+            templated.append(segment)
+        previous = segment
+    return "/".join(templated)
+
+
+def lcu_request(method, path, **kwargs):
+    """Send a request to an LCU endpoint path (e.g. /lol-gameflow/v1/gameflow-phase)."""
+    client = get_lcu_client()
+    # Per request: REQUESTS_CA_BUNDLE in the environment overrides Session.verify.
+    kwargs.setdefault("verify", False)
+    if method != "GET":
+        _note_write()
+    template = endpoint_template(path)
+    started = time.perf_counter()
+    failed = True
     try:
-        r = requests.get(
-            f"{get_base_url()}/lol-champ-select/v1/session",
-            auth=get_auth(),
-            verify=False,
+        response = client.request(method, f"{get_base_url()}{path}", **kwargs)
+        failed = response.status_code >= 400 and not (
+            response.status_code == 404 and template in EXPECTED_NOT_FOUND_ENDPOINTS
+        )
+        return response
+    finally:
+        record_histogram(
+            f"{LCU_REQUEST_METRIC_PREFIX}{method} {template}",
+            (time.perf_counter() - started) * 1000,
+            error=failed,
         )
-        return r.json() if r.status_code == 200 else None
+
+
+def log_lcu_request_stats():
+    """Print request counts, errors and latency percentiles per LCU endpoint."""
+    lines = format_histogram_report(LCU_REQUEST_METRIC_PREFIX)
+    if not lines:
+        print("📊 No LCU requests recorded yet.")
+        return
+    print(f"📊 LCU requests ({len(lines)} endpoints):")
+    for line in lines:
+        print(f"   {line}")
+
+
+class _Flight:
+    """One shared GET: followers wait on done and reuse response or error."""
+
+    __slots__ = ("done", "response", "error", "finished_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+        self.finished_at = None
+
+    def result(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def _note_write():
+    # GETs started before a write must not answer reads made after it.
+    with _flight_lock:
+        _flights.clear()
+
+
+def lcu_get(path, **kwargs):
+    """
+    GET an LCU endpoint path, sharing the request with identical concurrent GETs.
+
+    Callers must treat the shared response as read-only. GETs with extra request
+    arguments are never shared.
+    """
+    if kwargs:
+        return lcu_request("GET", path, **kwargs)
+
+    window = SINGLE_FLIGHT_WINDOWS.get(endpoint_template(path), 0)
+    with _flight_lock:
+        flight = _flights.get(path)
+        if (
+            flight is not None
+            and flight.finished_at is not None
+            and time.monotonic() - flight.finished_at > window
+        ):
+            flight = None
+        if flight is not None:
+            leader = False
+        else:
+            leader = True
+            flight = _flights[path] = _Flight()
+
+    if not leader:
+        return flight.result()
+
+    try:
+        flight.response = lcu_request("GET", path)
+        return flight.response
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flight_lock:
+            flight.finished_at = time.monotonic()
+            if (not window or flight.error is not None) and _flights.get(path) is flight:
+                del _flights[path]
+        flight.done.set()
+
+
+def lcu_post(path, **kwargs):
+    return lcu_request("POST", path, **kwargs)
+
+
+def lcu_patch(path, **kwargs):
+    return lcu_request("PATCH", path, **kwargs)
+
+
+def _get_fan_out_executor():
+    global _fan_out_executor
+    with _lock:
+        if _fan_out_executor is None:
+            # Stays within the pooled client's connections.
+            _fan_out_executor = ThreadPoolExecutor(
+                max_workers=LCU_POOL_MAXSIZE // 2, thread_name_prefix="lcu-fan-out"
+            )
+        return _fan_out_executor
+
+
+def lcu_request_all(calls):
+    """
+    Send independent requests concurrently over the pooled client.
+
+    calls: iterable of (method, path, kwargs). Returns the responses in the same
+    order; the first exception raised by any request is re-raised.
+    """
+    executor = _get_fan_out_executor()
+    futures = [
+        executor.submit(lcu_request, method, path, **(kwargs or {}))
+        for method, path, kwargs in calls
+    ]
+    return [future.result() for future in futures]
+
+
+def set_session_source(source):
+    """
+    Route get_session() through source(fresh) instead of a direct GET.
+
+    Used by the session hub so every worker shares one poller; pass None to go
+    back to fetching the session directly.
+    """
+    global _session_source
+    _session_source = source
+
+
+def set_session_fetcher(fetcher):
+    """
+    Serve fetch_session() from fetcher() instead of the LCU (e.g. a trace replay).
+
+    Unlike set_session_source this also feeds the session hub. Pass None to undo.
+    """
+    global _session_fetcher
+    _session_fetcher = fetcher
+
+
+def set_session_recorder(recorder):
+    """Call recorder(session, fetched_at) after every session fetch; None to stop."""
+    global _session_recorder
+    _session_recorder = recorder
+
+
+def get_session(fresh=False):
+    """
+    Get the current champ select session.
+
+    fresh: only relevant while a session source (session hub) is active; waits
+    for a snapshot fetched after this call instead of returning the latest one.
+    """
+    source = _session_source
+    if source is not None:
+        return source(fresh)
+    return fetch_session()
+
+
+def fetch_session():
+    """GET the champ select session from the LCU, bypassing any session source"""
+    try:
+        fetcher = _session_fetcher
+        if fetcher is not None:
+            session = fetcher()
+        else:
+            r = lcu_get("/lol-champ-select/v1/session")
+            session = r.json() if r.status_code == 200 else None
+        recorder = _session_recorder
+        if recorder is not None:
+            recorder(session, time.time())
+        return session
+    except LeagueClientDisconnected:
+        raise
     except (
         requests.exceptions.ConnectionError,
         requests.exceptions.RequestException,
@@ -72,11 +393,7 @@ def get_current_champion_id_lcu():
     champion (e.g. after trades) if /session no longer returns 200.
     """
     try:
-        r = requests.get(
-            f"{get_base_url()}/lol-champ-select/v1/current-champion",
-            auth=get_auth(),
-            verify=False,
-        )
+        r = lcu_get("/lol-champ-select/v1/current-champion")
         if r.status_code != 200:
             return None
         data = r.json()
@@ -0,0 +1,236 @@
+"""
+LCU WebSocket (WAMP) event subscriptions.
+
+The League client pushes JSON API events over the same port as the REST API.
+A background listener subscribes to the events we care about and hands them to
+subscribers, so loops can wake up as soon as something changes instead of
+sleeping a fixed interval. When the WebSocket is unavailable (library missing,
+client not ready, connection dropped) wait_for_event simply times out and the
+existing REST polling keeps working as before.
+"""
+
+import base64
+import json
+import ssl
+import threading
+import time
+
+try:
+    import websocket
+
+    _websocket_available = True
+except Exception:
+    websocket = None
+    _websocket_available = False
+
+from .lcu_connection import get_auth, get_base_url
+
+CHAMP_SELECT_SESSION_EVENT = "OnJsonApiEvent_lol-champ-select_v1_session"
+READY_CHECK_EVENT = "OnJsonApiEvent_lol-matchmaking_v1_ready-check"
+GAMEFLOW_PHASE_EVENT = "OnJsonApiEvent_lol-gameflow_v1_gameflow-phase"
+
+DEFAULT_EVENTS = (
+    CHAMP_SELECT_SESSION_EVENT,
+    READY_CHECK_EVENT,
+    GAMEFLOW_PHASE_EVENT,
+)
+
+# WAMP 1.0 message type ids used by the LCU.
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+_RECONNECT_DELAY_SECONDS = 2
+_RECV_TIMEOUT_SECONDS = 1
+
+_condition = threading.Condition()
+_subscribers = {}
+_event_counts = {}
+_latest_payloads = {}
+_connected = False
+_listener_thread = None
+_stop_event = threading.Event()
+
+
+def subscribe(event_name, callback):
+    """Call callback(payload) every time event_name is received."""
+    with _condition:
+        _subscribers.setdefault(event_name, []).append(callback)
+
+
+def unsubscribe(event_name, callback):
+    with _condition:
+        callbacks = _subscribers.get(event_name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+
+def is_event_stream_connected():
+    return _connected
+
+
+def get_event_count(event_name):
+    """Number of events received so far (use as `since` for wait_for_event)."""
+    with _condition:
+        return _event_counts.get(event_name, 0)
+
+
+def get_latest_event(event_name):
+    """Last payload ({data, eventType, uri}) received for event_name, if any."""
+    with _condition:
+        return _latest_payloads.get(event_name)
+
+
+def wait_for_event(event_names, timeout, since=None):
+    """
+    Block until one of event_names is received or timeout seconds pass.
+
+    since: counts returned by get_event_count (a single int when one event name is
+    given, otherwise a dict) taken before the caller last read state, so an event
+    that arrived in between is not missed. Defaults to the counts at call time.
+
+    Returns True if an event woke us up, False on timeout (polling fallback).
+    """
+    names = (event_names,) if isinstance(event_names, str) else tuple(event_names)
+    with _condition:
+        if since is None:
+            baseline = {name: _event_counts.get(name, 0) for name in names}
+        elif isinstance(since, dict):
+            baseline = {name: since.get(name, 0) for name in names}
+        else:
+            baseline = {name: since for name in names}
+        return _condition.wait_for(
+            lambda: any(_event_counts.get(n, 0) != baseline[n] for n in names),
+            timeout,
+        )
+
+
+def dispatch_event(event_name, payload):
+    """Record an event and deliver it to subscribers."""
+    with _condition:
+        _event_counts[event_name] = _event_counts.get(event_name, 0) + 1
+        _latest_payloads[event_name] = payload
+        callbacks = list(_subscribers.get(event_name, []))
+        _condition.notify_all()
+
+    for callback in callbacks:
+        try:
+            callback(payload)
+        except Exception as e:
+            print(f"[LCU events] Subscriber error for {event_name}: {e}")
+
+
+def handle_message(raw_message):
+    """Parse one WAMP frame and dispatch it if it is an event."""
+    if not raw_message:
+        return
+    try:
+        message = json.loads(raw_message)
+    except (TypeError, ValueError):
+        return
+    if (
+        isinstance(message, list)
+        and len(message) >= 3
+        and message[0] == WAMP_EVENT
+        and isinstance(message[1], str)
+    ):
+        dispatch_event(message[1], message[2])
+
+
+def _event_stream_url():
+    base_url = get_base_url()
+    if base_url.startswith("https://"):
+        return "wss://" + base_url[len("https://"):]
+    if base_url.startswith("http://"):
+        return "ws://" + base_url[len("http://"):]
+    return base_url
+
+
+def _auth_header():
+    auth = get_auth()
+    credentials = f"{auth.username}:{auth.password}".encode("utf-8")
+    return "Authorization: Basic " + base64.b64encode(credentials).decode("ascii")
+
+
+def _set_connected(value):
+    global _connected
+    with _condition:
+        _connected = value
+        _condition.notify_all()
+
+
+def _run_listener(events):
+    while not _stop_event.is_set():
+        ws = None
+        try:
+            ws = websocket.create_connection(
+                _event_stream_url(),
+                header=[_auth_header()],
+                sslopt={"cert_reqs": ssl.CERT_NONE},
+                timeout=_RECV_TIMEOUT_SECONDS,
+            )
+            for event_name in events:
+                ws.send(json.dumps([WAMP_SUBSCRIBE, event_name]))
+            _set_connected(True)
+
+            while not _stop_event.is_set():
+                try:
+                    handle_message(ws.recv())
+                except websocket.WebSocketTimeoutException:
+                    continue
+        except Exception:
+            # Client closed/restarting or not reachable yet; REST polling covers us.
+            pass
+        finally:
+            _set_connected(False)
+            if ws is not None:
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+        _stop_event.wait(_RECONNECT_DELAY_SECONDS)
+
+
+def start_event_listener(events=DEFAULT_EVENTS):
+    """
+    Start the background WebSocket listener (no-op if already running).
+
+    The listener reconnects on its own, picking up new credentials after
+    reset_lcu_connection(). Returns the thread, or None if websocket-client is
+    not installed.
+    """
+    global _listener_thread
+
+    if not _websocket_available:
+        print("ℹ️ websocket-client not installed. Using REST polling only.")
+        return None
+
+    if _listener_thread is not None and _listener_thread.is_alive():
+        return _listener_thread
+
+    _stop_event.clear()
+    _listener_thread = threading.Thread(
+        target=_run_listener, args=(tuple(events),), daemon=True
+    )
+    _listener_thread.start()
+    return _listener_thread
+
+
+def stop_event_listener(timeout=5):
+    global _listener_thread
+    _stop_event.set()
+    thread = _listener_thread
+    _listener_thread = None
+    if thread is not None:
+        thread.join(timeout)
+
+
+def wait_until_connected(timeout):
+    """Block until the event stream is connected; returns the connection state."""
+    deadline = time.monotonic() + timeout
+    with _condition:
+        while not _connected:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _condition.wait(remaining)
+        return _connected
@@ -0,0 +1,122 @@
+"""
+Deadline-aware lock-in timing for the pick turn.
+
+The champ-select timer reports the phase deadline in the client's clock:
+timer.internalNowInEpochMs is when the client last stamped the timer and
+adjustedTimeLeftInPhase the time left from that stamp. To turn that into a
+local deadline we estimate the offset between the two clocks. Every sample
+(client stamp minus the local time we first saw it) underestimates the true
+offset by our read latency, so the largest recent sample is the tightest
+estimate.
+
+The stamp only moves when the session changes, so the first one seen after a
+start or reconnect can be many seconds old. It is not used as a sample; the
+offset is trusted from the first stamp that changed while we were watching.
+Until then, and as an upper bound afterwards, the deadline is the time the
+session was received plus the time left.
+
+The lock-in then fires at the local deadline minus a configurable safety
+margin and the expected request time (one fresh session read plus the PATCH,
+from a smoothed round-trip of recent execute_pick calls).
+"""
+
+import threading
+import time
+from collections import deque
+
+from constants import LOCK_IN_SAFETY_MARGIN_MS
+
+# Samples older than this are dropped so a clock jump does not stick forever.
+OFFSET_SAMPLE_WINDOW = 20
+DEFAULT_PATCH_RTT_SECONDS = 0.15
+_RTT_SMOOTHING = 0.3
+
+_lock = threading.Lock()
+_offset_samples = deque(maxlen=OFFSET_SAMPLE_WINDOW)
+_last_timer_stamp = None
+_patch_rtt = None
+
+
+def observe_timer(timer, received_at=None):
+    """
+    Record one session timer reading.
+
+    received_at is the local time.time() the session was first seen; defaults to
+    now. Repeated reads of the same timer stamp are ignored, and so is the first
+    stamp after a reset (its age is unknown).
+    """
+    global _last_timer_stamp
+
+    client_now_ms = (timer or {}).get("internalNowInEpochMs")
+    if not client_now_ms:
+        return
+    if received_at is None:
+        received_at = time.time()
+    with _lock:
+        if client_now_ms == _last_timer_stamp:
+            return
+        first_stamp = _last_timer_stamp is None
+        _last_timer_stamp = client_now_ms
+        if not first_stamp:
+            _offset_samples.append(client_now_ms / 1000 - received_at)
+
+
+def get_clock_offset():
+    """Estimated client clock minus local clock, in seconds (None without samples)."""
+    with _lock:
+        return max(_offset_samples) if _offset_samples else None
+
+
+def record_patch_rtt(seconds):
+    """Feed the round-trip time of one champ-select PATCH."""
+    global _patch_rtt
+    with _lock:
+        if _patch_rtt is None:
+            _patch_rtt = seconds
+        else:
+            _patch_rtt += _RTT_SMOOTHING * (seconds - _patch_rtt)
+
+
+def get_patch_rtt():
+    """Smoothed PATCH round-trip in seconds."""
+    with _lock:
+        return _patch_rtt if _patch_rtt is not None else DEFAULT_PATCH_RTT_SECONDS
+
+
+def get_phase_deadline(timer, received_at=None):
+    """Local time.time() at which the current champ-select phase ends, or None."""
+    timer = timer or {}
+    time_left_ms = timer.get("adjustedTimeLeftInPhase")
+    if time_left_ms is None:
+        return None
+    if received_at is None:
+        received_at = time.time()
+    deadline = received_at + time_left_ms / 1000
+    client_now_ms = timer.get("internalNowInEpochMs")
+    offset = get_clock_offset()
+    if client_now_ms and offset is not None:
+        deadline = min(deadline, (client_now_ms + time_left_ms) / 1000 - offset)
+    return deadline
+
+
+def get_lock_in_time(
+    timer, safety_margin_ms=LOCK_IN_SAFETY_MARGIN_MS, received_at=None
+):
+    """
+    Local time.time() at which to start locking in, or None without a timer.
+
+    Leaves safety_margin_ms plus one session read and one PATCH before the deadline.
+    """
+    deadline = get_phase_deadline(timer, received_at)
+    if deadline is None:
+        return None
+    return deadline - safety_margin_ms / 1000 - 2 * get_patch_rtt()
+
+
+def reset_lock_in_scheduler():
+    """Forget clock and round-trip samples (e.g. after the client restarted)."""
+    global _last_timer_stamp, _patch_rtt
+    with _lock:
+        _offset_samples.clear()
+        _last_timer_stamp = None
+        _patch_rtt = None
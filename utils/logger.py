@@ -1,62 +1,171 @@
 import sys
 from datetime import datetime
 import os
-import requests
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 
+from .discord_dispatcher import post_discord_message
+from .error_aggregator import ErrorAggregator
+
 load_dotenv()
 
 
+# Writes are queued and appended by a background thread in batches: at most
+# LOG_FLUSH_INTERVAL_SECONDS after the first queued line, as soon as
+# LOG_FLUSH_BYTES are pending, and immediately for stderr, log_and_discord and
+# shutdown. The file rotates to .1 .. .LOG_BACKUP_COUNT at LOG_MAX_BYTES.
+LOG_QUEUE_SIZE = 10000
+LOG_FLUSH_INTERVAL_SECONDS = 0.5
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+_FLUSH = object()
+_STOP = object()
+
+
+class _ErrorStream:
+    """sys.stderr while logging: like stdout, but flushed to the file right away."""
+
+    def __init__(self, logger):
+        self._logger = logger
+
+    def write(self, text):
+        self._logger.write(text)
+        self._logger.flush()
+
+    def flush(self):
+        self._logger.flush()
+
+
 # Simple logging system
 class Logger:
-    def __init__(self, log_file="league_auto_picker.log"):
-        self.log_file = log_file
+    def __init__(self, log_file="league_auto_picker.log", log_dir="logs"):
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
 
         # Create logs directory if it doesn't exist
-        os.makedirs("logs", exist_ok=True)
-        self.log_file = os.path.join("logs", log_file)
+        os.makedirs(log_dir, exist_ok=True)
+        self.log_file = os.path.join(log_dir, log_file)
 
         # Redirect stdout and stderr to file
         self.log_handle = open(self.log_file, "a", encoding="utf-8")
+        self._queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self.dropped = 0
 
     def start_logging(self):
         """Start redirecting prints to file"""
+        self._ensure_writer()
         sys.stdout = self
-        sys.stderr = self
+        sys.stderr = _ErrorStream(self)
 
     def stop_logging(self):
-        """Stop redirecting and restore original stdout/stderr"""
-        if hasattr(self, "log_handle"):
-            self.log_handle.close()
+        """Stop redirecting, write out what is queued and restore original stdout/stderr"""
         sys.stdout = self.original_stdout
         sys.stderr = self.original_stderr
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join(timeout=5)
+        if hasattr(self, "log_handle"):
+            self.log_handle.close()
 
     def write(self, text):
-        """Write to both file and original stdout"""
+        """Queue text for the log file and write it to the original stdout"""
         # Only add timestamp if text is not empty and not just whitespace
         if text.strip():
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             formatted_text = f"[{timestamp}] {text}"
-
-            # Write to file with timestamp
-            self.log_handle.write(formatted_text)
-            self.log_handle.flush()
         else:
             # For empty lines, just write to file without timestamp
-            self.log_handle.write(text)
-            self.log_handle.flush()
+            formatted_text = text
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(formatted_text)
+        except queue.Full:
+            # Never block a hot loop on the disk; the writer notes the gap.
+            self.dropped += 1
 
         # Always write to original stdout for console output (without timestamp)
         self.original_stdout.write(text)
-        self.original_stdout.flush()
+        if "\n" in text:
+            self.original_stdout.flush()
 
     def flush(self):
-        """Flush both file and stdout"""
-        self.log_handle.flush()
+        """Ask the writer to flush the file now and flush stdout"""
+        if self._writer is not None and self._writer.is_alive():
+            try:
+                self._queue.put_nowait(_FLUSH)
+            except queue.Full:
+                pass  # the writer is behind and will write everything anyway
         self.original_stdout.flush()
 
+    def _ensure_writer(self):
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="log-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _run_writer(self):
+        pending = []
+        pending_bytes = 0
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FLUSH
+            if item is _STOP or item is _FLUSH:
+                self._write_out(pending)
+                pending, pending_bytes, deadline = [], 0, None
+                if item is _STOP:
+                    return
+                continue
+            pending.append(item)
+            pending_bytes += len(item)
+            if deadline is None:
+                deadline = time.monotonic() + LOG_FLUSH_INTERVAL_SECONDS
+            if pending_bytes >= LOG_FLUSH_BYTES:
+                self._write_out(pending)
+                pending, pending_bytes, deadline = [], 0, None
+
+    def _write_out(self, pending):
+        dropped, self.dropped = self.dropped, 0
+        if dropped:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            pending.append(f"[{timestamp}] ⚠️ {dropped} log writes dropped (queue full)\n")
+        if not pending:
+            return
+        try:
+            self.log_handle.write("".join(pending))
+            self.log_handle.flush()
+            if self.log_handle.tell() >= LOG_MAX_BYTES:
+                self._rotate()
+        except (OSError, ValueError) as e:
+            self.original_stderr.write(f"❌ Error writing log file: {e}\n")
+
+    def _rotate(self):
+        """league_auto_picker.log -> .1 -> .2 ...; the oldest backup is removed."""
+        self.log_handle.close()
+        try:
+            for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+                source = f"{self.log_file}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.log_file}.{index + 1}")
+            os.replace(self.log_file, f"{self.log_file}.1")
+        finally:
+            # Reopen even if a backup could not be renamed (e.g. open elsewhere).
+            self.log_handle = open(self.log_file, "a", encoding="utf-8")
+
 
 # Global logger instance
 logger = Logger()
@@ -68,32 +177,37 @@ def log_print(*args, **kwargs):
 
 
 def send_discord_error_message(error, summoner_name=None):
+    """Queue error for the error webhook (DISCORD_WEBHOOK_URL as fallback)."""
     webhook_url = os.getenv("DISCORD_ERROR_WEBHOOK_URL") or os.getenv(
         "DISCORD_WEBHOOK_URL"
     )
     if not webhook_url:
         return
 
-    try:
-        data = {"content": f"{summoner_name or 'Unknown'}: {error}"}
-        response = requests.post(webhook_url, json=data)
+    # No on_failure: a failed error report is only printed, never re-reported.
+    post_discord_message(
+        webhook_url,
+        f"{summoner_name or 'Unknown'}: {error}",
+        label="discord error message",
+    )
 
-        if response.status_code == 204:
-            print("✅ Discord error message sent")
-        else:
-            print(f"❌ Error sending discord error message: {response.status_code}")
 
-    except Exception:
-        pass
+# Shared by every log_and_discord caller so repeats are counted across threads.
+error_aggregator = ErrorAggregator(send_discord_error_message)
 
 
 def log_and_discord(error, summoner_name=None):
     """
     Unified function to print a message and send it to Discord as an error message.
 
+    Every call is printed; Discord reports go through error_aggregator, which
+    coalesces repeats into "(×N ...)" summaries and caps the reporting rate.
+
     Args:
         error (str): The error message to print and send to Discord
         summoner_name (str, optional): The summoner name to include in the message
     """
     print(error)
-    send_discord_error_message(error, summoner_name)
+    # Errors reach the log file right away, not with the next batch.
+    logger.flush()
+    error_aggregator.report(error, summoner_name)
@@ -0,0 +1,164 @@
+"""
+In-process metrics for latency-sensitive paths.
+
+Values are kept per metric name (count, sum, min, max and the last few samples)
+so they can be printed or inspected in tests without any external collector.
+
+Histograms are for hot paths recorded on every call (e.g. each LCU request):
+they count samples into fixed buckets, so recording never allocates and the
+percentiles are read from the bucket counts (accurate to the bucket width).
+"""
+
+import threading
+from bisect import bisect_left
+from collections import deque
+
+RECENT_SAMPLES = 50
+
+# Upper bounds (inclusive) of the latency histogram buckets, in milliseconds.
+# One more bucket catches everything above the last bound.
+HISTOGRAM_BUCKETS_MS = (
+    1, 2, 3, 5, 7, 10, 15, 20, 30, 50, 75, 100, 150, 200, 300, 500, 750,
+    1000, 1500, 2000, 3000, 5000, 10000,
+)
+HISTOGRAM_PERCENTILES = (50, 95, 99)
+
+_lock = threading.Lock()
+_metrics = {}
+_histograms = {}
+
+
+class _Metric:
+    __slots__ = ("count", "total", "minimum", "maximum", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        self.recent.append(value)
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "errors", "total", "maximum")
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, value, error):
+        self.counts[bisect_left(HISTOGRAM_BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+        if error:
+            self.errors += 1
+
+    def percentile(self, pct):
+        # Upper bound of the bucket holding the pct-th sample; the overflow
+        # bucket reports the largest value seen.
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                if index < len(HISTOGRAM_BUCKETS_MS):
+                    return min(HISTOGRAM_BUCKETS_MS[index], self.maximum)
+                break
+        return self.maximum
+
+
+def record_metric(name, value):
+    """Record one sample (e.g. a latency in milliseconds) for name."""
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = _Metric()
+        metric.add(value)
+
+
+def get_metric_summary(name):
+    """
+    Summary dict for name, or None if nothing was recorded.
+
+    Keys: count, mean, min, max, last.
+    """
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None or not metric.count:
+            return None
+        return {
+            "count": metric.count,
+            "mean": metric.total / metric.count,
+            "min": metric.minimum,
+            "max": metric.maximum,
+            "last": metric.recent[-1],
+        }
+
+
+def record_histogram(name, value_ms, error=False):
+    """Count one latency sample (and whether the call failed) into name's histogram."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = _Histogram()
+        histogram.add(value_ms, error)
+
+
+def get_histogram_summary(name):
+    """
+    Summary dict for histogram name, or None if nothing was recorded.
+
+    Keys: count, errors, mean, max and p50/p95/p99 (bucket upper bounds, ms).
+    """
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None or not histogram.count:
+            return None
+        summary = {
+            "count": histogram.count,
+            "errors": histogram.errors,
+            "mean": histogram.total / histogram.count,
+            "max": histogram.maximum,
+        }
+        for pct in HISTOGRAM_PERCENTILES:
+            summary[f"p{pct}"] = histogram.percentile(pct)
+        return summary
+
+
+def get_histogram_names(prefix=""):
+    with _lock:
+        return sorted(name for name in _histograms if name.startswith(prefix))
+
+
+def format_histogram_report(prefix=""):
+    """One line per histogram starting with prefix, busiest first."""
+    summaries = []
+    for name in get_histogram_names(prefix):
+        summary = get_histogram_summary(name)
+        if summary:
+            summaries.append((name, summary))
+    summaries.sort(key=lambda item: item[1]["count"], reverse=True)
+    return [
+        f"{name[len(prefix):]}: n={s['count']} err={s['errors']} "
+        f"p50={s['p50']:.0f}ms p95={s['p95']:.0f}ms p99={s['p99']:.0f}ms "
+        f"max={s['max']:.0f}ms"
+        for name, s in summaries
+    ]
+
+
+def reset_metrics():
+    with _lock:
+        _metrics.clear()
+        _histograms.clear()
@@ -0,0 +1,231 @@
+"""
+Phase-aware scheduler for background polling loops.
+
+Instead of every background loop owning a time.sleep and its own gameflow-phase
+GET, loops register a task callback with the scheduler. One thread reads the
+gameflow phase (from the event stream when it is connected, otherwise with a
+single GET per tick), runs the tasks that are due with that phase, and sleeps
+until the next task is due or the phase changes. Intervals come from the phase:
+fast around queue pops and post-game, slow during a running game, and a rare
+probe while the client is down.
+
+Champ-select loops run on their own threads and wake on session updates; they
+use get_draft_poll_interval() for the fallback timeout of those waits.
+"""
+
+import threading
+import time
+
+from . import lcu_events, shared_state
+from .lcu_cache import notify_phase_change
+from .exceptions import LeagueClientDisconnected
+from .rank_utils import get_gameflow_phase
+
+# Seconds between task runs per gameflow phase.
+DEFAULT_PHASE_INTERVALS = {
+    "None": 2.0,
+    "Lobby": 1.0,
+    "Matchmaking": 1.0,
+    "ReadyCheck": 0.5,
+    "ChampSelect": 2.0,
+    "GameStart": 5.0,
+    "InProgress": 15.0,
+    "Reconnect": 15.0,
+    "WaitingForStats": 0.5,
+    "PreEndOfGame": 0.5,
+    "EndOfGame": 1.0,
+}
+DEFAULT_INTERVAL_SECONDS = 2.0
+# While the client is down tasks are suspended; the phase is only probed this often.
+DISCONNECTED_PROBE_SECONDS = 5.0
+
+# Champ-select wait timeouts: fast while we have to act, slower otherwise.
+DRAFT_ACTIVE_INTERVAL_SECONDS = 0.25
+DRAFT_BAN_PICK_INTERVAL_SECONDS = 1.0
+DRAFT_IDLE_INTERVAL_SECONDS = 3.0
+
+_PENDING_SWAP_STATES = frozenset({"RECEIVED", "SENT"})
+# Local event used to wake the scheduler (new task, stop) next to phase events.
+_WAKE_EVENT = "poll_scheduler_wake"
+_WAIT_EVENTS = (lcu_events.GAMEFLOW_PHASE_EVENT, _WAKE_EVENT)
+
+_lock = threading.Lock()
+_tasks = {}
+_thread = None
+_running = False
+_current_phase = None
+_client_down = False
+
+
+class PollTask:
+    """A registered callback(phase) with per-phase intervals."""
+
+    __slots__ = ("name", "callback", "intervals", "on_suspend", "next_run")
+
+    def __init__(self, name, callback, intervals=None, on_suspend=None):
+        self.name = name
+        self.callback = callback
+        self.intervals = dict(DEFAULT_PHASE_INTERVALS, **(intervals or {}))
+        self.on_suspend = on_suspend
+        self.next_run = 0.0
+
+    def interval_for(self, phase):
+        return self.intervals.get(phase, DEFAULT_INTERVAL_SECONDS)
+
+
+def register_task(name, callback, intervals=None, on_suspend=None):
+    """
+    Run callback(phase) on the scheduler thread.
+
+    intervals overrides DEFAULT_PHASE_INTERVALS for this task. The task runs right
+    away, then after each phase change and whenever its interval has passed.
+    on_suspend() is called once when the client goes down and the task is
+    suspended, to drop state that must not survive a client restart.
+    Registering a name again replaces the previous task.
+    """
+    task = PollTask(name, callback, intervals, on_suspend)
+    with _lock:
+        _tasks[name] = task
+    _wake_scheduler()
+    return task
+
+
+def unregister_task(name):
+    with _lock:
+        _tasks.pop(name, None)
+
+
+def _wake_scheduler():
+    lcu_events.dispatch_event(_WAKE_EVENT, None)
+
+
+def get_current_phase():
+    """Gameflow phase seen on the last scheduler tick (None while the client is down)."""
+    return _current_phase
+
+
+def _read_phase():
+    if lcu_events.is_event_stream_connected():
+        payload = lcu_events.get_latest_event(lcu_events.GAMEFLOW_PHASE_EVENT)
+        if payload and isinstance(payload.get("data"), str):
+            return payload["data"]
+    return get_gameflow_phase()
+
+
+def _run_due_tasks(phase, phase_changed):
+    now = time.monotonic()
+    with _lock:
+        tasks = list(_tasks.values())
+    for task in tasks:
+        if not phase_changed and task.next_run > now:
+            continue
+        try:
+            task.callback(phase)
+        except LeagueClientDisconnected:
+            raise
+        except Exception as e:
+            print(f"❌ Error in scheduled task {task.name}: {e}")
+        task.next_run = time.monotonic() + task.interval_for(phase)
+
+
+def _seconds_until_next_task():
+    with _lock:
+        if not _tasks:
+            return DEFAULT_INTERVAL_SECONDS
+        next_run = min(task.next_run for task in _tasks.values())
+    return max(0.0, next_run - time.monotonic())
+
+
+def _mark_client_down():
+    global _client_down, _current_phase
+    _current_phase = None
+    if not _client_down:
+        _client_down = True
+        # Let the main loop run its reconnect handling once per outage.
+        shared_state.client_disconnected = True
+        with _lock:
+            tasks = list(_tasks.values())
+        for task in tasks:
+            if task.on_suspend is None:
+                continue
+            try:
+                task.on_suspend()
+            except Exception as e:
+                print(f"❌ Error suspending scheduled task {task.name}: {e}")
+
+
+def _run():
+    global _current_phase, _client_down
+    last_phase = None
+    while _running:
+        seen_events = {name: lcu_events.get_event_count(name) for name in _WAIT_EVENTS}
+        try:
+            phase = _read_phase()
+            _client_down = False
+            _current_phase = phase
+            phase_changed = phase != last_phase
+            last_phase = phase
+            if phase_changed:
+                notify_phase_change(phase)
+            _run_due_tasks(phase, phase_changed)
+            timeout = _seconds_until_next_task()
+        except LeagueClientDisconnected:
+            _mark_client_down()
+            last_phase = None
+            timeout = DISCONNECTED_PROBE_SECONDS
+        except Exception as e:
+            print(f"❌ Error in poll scheduler: {e}")
+            timeout = DEFAULT_INTERVAL_SECONDS
+
+        # A phase change is pushed over the event stream; wake up for it right away.
+        lcu_events.wait_for_event(_WAIT_EVENTS, timeout, since=seen_events)
+
+
+def start_poll_scheduler():
+    """Start the scheduler thread (no-op if it is already running)."""
+    global _thread, _running
+    with _lock:
+        if _running:
+            return _thread
+        _running = True
+        _thread = threading.Thread(target=_run, name="poll-scheduler", daemon=True)
+    _thread.start()
+    return _thread
+
+
+def stop_poll_scheduler(timeout=5):
+    global _thread, _running
+    with _lock:
+        _running = False
+        thread = _thread
+        _thread = None
+    _wake_scheduler()
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout)
+
+
+def get_draft_poll_interval(session):
+    """
+    Fallback timeout for champ-select loops waiting on a session update.
+
+    Short while our ban/pick is in progress or a swap or trade is pending, normal
+    during BAN_PICK and long otherwise (planning, finalization).
+    """
+    if not session:
+        return DRAFT_IDLE_INTERVAL_SECONDS
+
+    my_cell_id = session.get("localPlayerCellId")
+    for action_group in session.get("actions", []):
+        for action in action_group:
+            if action.get("actorCellId") == my_cell_id and action.get("isInProgress"):
+                return DRAFT_ACTIVE_INTERVAL_SECONDS
+
+    for key in ("positionSwaps", "pickOrderSwaps", "trades"):
+        for swap in session.get(key) or []:
+            if swap.get("state") in _PENDING_SWAP_STATES:
+                return DRAFT_ACTIVE_INTERVAL_SECONDS
+
+    phase = (session.get("timer") or {}).get("phase", "").upper()
+    if phase == "BAN_PICK":
+        return DRAFT_BAN_PICK_INTERVAL_SECONDS
+    return DRAFT_IDLE_INTERVAL_SECONDS
@@ -1,17 +1,14 @@
 import requests
 
 from .logger import log_and_discord
-from .lcu_connection import get_auth, get_base_url
+from .lcu_cache import cached_get
+from .lcu_connection import lcu_get
 from .exceptions import LeagueClientDisconnected
 
 
 def get_rank_data(queueType):
     try:
-        response = requests.get(
-            f"{get_base_url()}/lol-ranked/v1/current-ranked-stats",
-            auth=get_auth(),
-            verify=False,
-        )
+        response = cached_get("/lol-ranked/v1/current-ranked-stats")
 
         if response.status_code == 200 or response.status_code == 204:
             player_data = response.json()
@@ -63,11 +60,7 @@ def get_rank_data(queueType):
 
 def get_gameflow_phase():
     try:
-        response = requests.get(
-            f"{get_base_url()}/lol-gameflow/v1/gameflow-phase",
-            auth=get_auth(),
-            verify=False,
-        )
+        response = lcu_get("/lol-gameflow/v1/gameflow-phase")
 
         if response.status_code == 200 or response.status_code == 204:
             # print("✅ phase: ", response.json())
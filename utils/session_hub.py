@@ -0,0 +1,200 @@
+"""
+Single champ-select session poller shared by every worker.
+
+During champ select the pick/ban, swap-decline and pick-order-swap threads all
+need the session. Instead of each of them sending its own GET, the hub fetches
+/lol-champ-select/v1/session once per tick (or as soon as the client pushes a
+session event) and publishes a SessionSnapshot with a monotonically increasing
+version. While the hub runs, get_session() returns the latest snapshot, so all
+workers decide on the same state.
+
+Every new snapshot is also diffed against the previous one by utils.draft_events,
+so workers can wait for typed draft events instead of any session change.
+
+Snapshots are shared between threads: treat snapshot.session as read-only.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+from . import draft_events, lcu_events
+from .exceptions import LeagueClientDisconnected
+from .lcu_connection import fetch_session, set_session_source
+
+SESSION_HUB_INTERVAL_SECONDS = 1.0
+FRESH_SESSION_TIMEOUT_SECONDS = 2.0
+
+SessionSnapshot = namedtuple("SessionSnapshot", ["version", "received_at", "session"])
+
+_condition = threading.Condition()
+_snapshot = None
+_fetch_count = 0
+_disconnected = False
+_fetch_in_progress = False
+_running = False
+_thread = None
+_wake = threading.Event()
+
+
+def _publish(session, disconnected=False):
+    global _snapshot, _disconnected, _fetch_count
+    with _condition:
+        _fetch_count += 1
+        # Only a changed session gets a new version, so waiters are not woken
+        # by ticks that saw the same state.
+        changed = _snapshot is None or disconnected or session != _snapshot.session
+        if changed:
+            version = _snapshot.version + 1 if _snapshot else 1
+            _snapshot = SessionSnapshot(version, time.time(), session)
+        _disconnected = disconnected
+        _condition.notify_all()
+    if changed:
+        # After the snapshot is visible, so subscribers read the new session.
+        draft_events.publish_session(session)
+
+
+def _poll_once():
+    """Fetch and publish one snapshot. Returns False once the client is gone."""
+    global _fetch_in_progress
+    with _condition:
+        _fetch_in_progress = True
+    try:
+        session = fetch_session()
+    except LeagueClientDisconnected:
+        _publish(None, disconnected=True)
+        return False
+    finally:
+        with _condition:
+            _fetch_in_progress = False
+    _publish(session)
+    return True
+
+
+def _run(interval):
+    while _running:
+        _wake.wait(interval)
+        _wake.clear()
+        if not _running:
+            break
+        if not _poll_once():
+            break
+
+
+def _on_session_event(_payload):
+    _wake.set()
+
+
+def _get_session_from_hub(fresh=False):
+    snapshot = get_fresh_snapshot() if fresh else get_snapshot()
+    if _disconnected:
+        raise LeagueClientDisconnected()
+    return snapshot.session if snapshot else None
+
+
+def start_session_hub(interval=SESSION_HUB_INTERVAL_SECONDS):
+    """Start polling and route get_session() through the hub (no-op if running)."""
+    global _running, _thread, _snapshot, _disconnected
+
+    if _running:
+        return _thread
+
+    with _condition:
+        _snapshot = None
+        _disconnected = False
+    draft_events.reset_draft_events()
+    _running = True
+    _wake.clear()
+    _poll_once()
+
+    lcu_events.subscribe(lcu_events.CHAMP_SELECT_SESSION_EVENT, _on_session_event)
+    set_session_source(_get_session_from_hub)
+    _thread = threading.Thread(target=_run, args=(interval,), daemon=True)
+    _thread.start()
+    return _thread
+
+
+def stop_session_hub(timeout=5):
+    """Stop polling; get_session() goes back to direct GETs."""
+    global _running, _thread
+
+    if not _running:
+        return
+    _running = False
+    _wake.set()
+    set_session_source(None)
+    lcu_events.unsubscribe(lcu_events.CHAMP_SELECT_SESSION_EVENT, _on_session_event)
+    thread = _thread
+    _thread = None
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout)
+    with _condition:
+        _condition.notify_all()
+
+
+def is_session_hub_running():
+    return _running
+
+
+def get_snapshot():
+    """Latest SessionSnapshot, or None before the first fetch."""
+    with _condition:
+        return _snapshot
+
+
+def request_refresh():
+    """Ask the poller to fetch right away instead of waiting for the next tick."""
+    _wake.set()
+
+
+def wait_for_snapshot(after_version, timeout):
+    """Block until a snapshot newer than after_version exists; returns the latest."""
+    with _condition:
+        _condition.wait_for(
+            lambda: not _running
+            or _disconnected
+            or (_snapshot is not None and _snapshot.version > after_version),
+            timeout,
+        )
+        return _snapshot
+
+
+def get_fresh_snapshot(timeout=FRESH_SESSION_TIMEOUT_SECONDS):
+    """Return the snapshot after a fetch that started after this call (e.g. after a PATCH)."""
+    with _condition:
+        # A fetch already in flight may predate the caller's write; skip it.
+        target_fetch = _fetch_count + (2 if _fetch_in_progress else 1)
+    request_refresh()
+    with _condition:
+        _condition.wait_for(
+            lambda: not _running or _disconnected or _fetch_count >= target_fetch,
+            timeout,
+        )
+        return _snapshot
+
+
+def get_session_version():
+    """
+    Version counter for "has the session changed since I last looked".
+
+    Uses the hub version while it runs, otherwise the count of session events
+    pushed over the WebSocket.
+    """
+    if _running:
+        snapshot = get_snapshot()
+        return snapshot.version if snapshot else 0
+    return lcu_events.get_event_count(lcu_events.CHAMP_SELECT_SESSION_EVENT)
+
+
+def wait_for_session_update(since_version, timeout):
+    """
+    Sleep until the session changes after since_version or timeout passes.
+
+    Returns True if woken by an update, False on timeout.
+    """
+    if _running:
+        snapshot = wait_for_snapshot(since_version, timeout)
+        return snapshot is not None and snapshot.version > since_version
+    return lcu_events.wait_for_event(
+        lcu_events.CHAMP_SELECT_SESSION_EVENT, timeout, since=since_version
+    )
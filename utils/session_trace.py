@@ -0,0 +1,160 @@
+"""
+Record and replay champ-select session traces.
+
+A trace is a gzip-compressed JSON-lines file: a header line, then one line per
+session fetch with its local timestamp. Fetches that returned the same session
+as the previous one only store the timestamp, so a trace of a whole champ select
+stays small while still showing how often the session was read.
+
+    {"trace": "champ_select_session", "version": 1, "started_at": 1700000000.0}
+    {"t": 1700000000.12, "session": {...}}
+    {"t": 1700000001.13}
+    {"t": 1700000002.14, "session": null}
+
+Recording hooks into every session fetch (utils.lcu_connection.fetch_session);
+the file is written from a background thread so the poller never waits on disk.
+Replay serves the recorded sessions back through fetch_session()/get_session()
+at the original or an accelerated pace.
+"""
+
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from . import lcu_connection
+
+TRACE_DIR = os.path.join("logs", "traces")
+TRACE_FORMAT = "champ_select_session"
+TRACE_VERSION = 1
+
+_UNCHANGED = object()
+
+
+def load_trace(path):
+    """Return the trace as a list of (timestamp, session) with repeats expanded."""
+    entries = []
+    session = None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("trace") != TRACE_FORMAT:
+            raise ValueError(f"{path} is not a champ select session trace")
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "session" in record:
+                session = record["session"]
+            entries.append((record["t"], session))
+    return entries
+
+
+class SessionTraceRecorder:
+    """Append every fetched session to a trace file until stop() is called."""
+
+    def __init__(self, path=None):
+        if path is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(TRACE_DIR, f"champ_select_{stamp}.jsonl.gz")
+        self.path = path
+        self._queue = queue.SimpleQueue()
+        self._last_session = _UNCHANGED
+        self._thread = None
+
+    def start(self):
+        """Open the file and hook into session fetches."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+        lcu_connection.set_session_recorder(self.record)
+        return self
+
+    def record(self, session, fetched_at):
+        # Runs on the fetching thread: compare and enqueue only, no I/O here.
+        if session == self._last_session:
+            self._queue.put({"t": fetched_at})
+        else:
+            self._last_session = session
+            self._queue.put({"t": fetched_at, "session": session})
+
+    def stop(self, timeout=5):
+        """Unhook, flush the remaining records and close the file."""
+        lcu_connection.set_session_recorder(None)
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        return self.path
+
+    def _write(self):
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            header = {
+                "trace": TRACE_FORMAT,
+                "version": TRACE_VERSION,
+                "started_at": time.time(),
+            }
+            f.write(json.dumps(header) + "\n")
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    return
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+class SessionTraceReplayer:
+    """
+    Serve a recorded trace through fetch_session() and get_session().
+
+    speed scales the recorded timeline (2.0 replays twice as fast). Each fetch
+    returns the session that was current at that point of the timeline; after
+    the end of the trace the last recorded session keeps being returned.
+    """
+
+    def __init__(self, path_or_entries, speed=1.0):
+        if isinstance(path_or_entries, (str, os.PathLike)):
+            path_or_entries = load_trace(path_or_entries)
+        self.entries = path_or_entries
+        self.speed = speed
+        self._started_at = None
+        self._index = 0
+        self._lock = threading.Lock()
+
+    @property
+    def duration(self):
+        """Replay length in seconds at the configured speed."""
+        if not self.entries:
+            return 0.0
+        return (self.entries[-1][0] - self.entries[0][0]) / self.speed
+
+    def start(self):
+        self._started_at = time.monotonic()
+        self._index = 0
+        lcu_connection.set_session_fetcher(self.fetch)
+        return self
+
+    def stop(self):
+        lcu_connection.set_session_fetcher(None)
+
+    def is_finished(self):
+        return self._started_at is not None and self.elapsed() >= self.duration
+
+    def elapsed(self):
+        return (time.monotonic() - self._started_at) if self._started_at else 0.0
+
+    def fetch(self):
+        """Session current at this point of the replay."""
+        if not self.entries:
+            return None
+        if self._started_at is None:
+            self.start()
+        trace_time = self.entries[0][0] + self.elapsed() * self.speed
+        with self._lock:
+            while (
+                self._index + 1 < len(self.entries)
+                and self.entries[self._index + 1][0] <= trace_time
+            ):
+                self._index += 1
+            return self.entries[self._index][1]
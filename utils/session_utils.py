@@ -1,4 +1,6 @@
 from constants import DRAFT_PICK_CODE, FLEX_CODE, SOLOQ_CODE
+from .champion_catalog import resolve_champion_name
+from .champ_select_state import get_champ_select_state
 
 # Canonical lane keys returned by normalize_lcu_lane (matches config.json lane keys).
 STANDARD_LCU_LANES = frozenset(
@@ -26,40 +28,28 @@ def normalize_lcu_lane(role):
 
 def get_assigned_lane(session):
     """Get the player's assigned lane from the session."""
-    my_cell_id = session.get("localPlayerCellId")
-    for participant in session.get("myTeam", []):
-        if participant.get("cellId") == my_cell_id:
-            return participant.get("assignedPosition")
-    return None
+    state = get_champ_select_state(session)
+    if state is None or state.local_player is None:
+        return None
+    return state.local_player.assigned_position
 
 
 def get_enemy_champions(session, champion_ids):
     """Get list of enemy champions that have been picked."""
+    state = get_champ_select_state(session)
+    if state is None:
+        return []
     enemy_champions = []
-    their_team = session.get("theirTeam", [])
-
-    for participant in their_team:
-        # Check if they have picked a champion
-        if participant.get("championId") and participant.get("championId") != 0:
-            # Convert champion ID to name
-            champion_name = get_champion_name_by_id(
-                participant.get("championId"), champion_ids
-            )
-            if champion_name:
-                enemy_champions.append(champion_name)
-
+    for champion_id in state.enemy_champion_ids:
+        champion_name = get_champion_name_by_id(champion_id, champion_ids)
+        if champion_name:
+            enemy_champions.append(champion_name)
     return enemy_champions
 
 
 def get_banned_champion_ids(session):
     """Get list of banned champion IDs from the session."""
-    banned_champs = [
-        action["championId"]
-        for phase in session["actions"]
-        for action in phase
-        if action["type"] == "ban" and action["completed"]
-    ]
-    return banned_champs
+    return list(get_champ_select_state(session).banned_champion_ids)
 
 
 def get_region(session):
@@ -85,38 +75,34 @@ def get_queueType(session):
 
 def is_still_our_turn_to_pick(session, my_cell_id):
     """Check if it's still our turn to pick."""
-    actions = session.get("actions", [])
-
-    for action_group in actions:
-        for action in action_group:
-            if (
-                action["actorCellId"] == my_cell_id
-                and action["isInProgress"]
-                and action["type"] == "pick"
-            ):
-                return True
+    state = get_champ_select_state(session)
+    if state is None:
+        return False
+    action = state.in_progress_action(my_cell_id)
+    return action is not None and action.type == "pick"
 
-    return False
 
+def get_champion_name_by_id(champion_id, champion_ids=None):
+    """
+    Convert champion ID to name.
 
-def get_champion_name_by_id(champion_id, champion_ids):
-    """Convert champion ID to name using the reverse mapping from champion_ids."""
-    # Create reverse mapping from the existing champion_ids dict
-    id_to_name = {v: k for k, v in champion_ids.items()}
-    return id_to_name.get(champion_id)
+    With the catalog mapping from fetch_champion_ids() (or None) this is an O(1)
+    ChampionCatalog lookup instead of rebuilding a reverse map per call.
+    """
+    return resolve_champion_name(champion_id, champion_ids)
 
 
 def get_summoner_name(session):
-    local_player_cell_id = session.get("localPlayerCellId")
-
-    # Find your player info in myTeam
-    for player in session.get("myTeam", []):
-        if player["cellId"] == local_player_cell_id:
-            game_name = player.get("gameName", "")
-            tag_line = player.get("tagLine", "")
-
-            if game_name and tag_line:
-                # FIXME: This is porofessor and opgg format. If we intend to reuse this function we should be careful not to break the link
-                return f"{game_name}-{tag_line}"
-            elif game_name:
-                return game_name
+    state = get_champ_select_state(session)
+    player = state.local_player if state else None
+    if player is None:
+        return None
+
+    game_name = player.game_name
+    tag_line = player.tag_line
+    if game_name and tag_line:
+        # FIXME: This is porofessor and opgg format. If we intend to reuse this function we should be careful not to break the link
+        return f"{game_name}-{tag_line}"
+    elif game_name:
+        return game_name
+    return None